@@ -18,6 +18,7 @@ from django_object_actions import DjangoObjectActions, action
 from .compat import get_course_keys_with_outlines
 from .models import (
     AcquiredSkill,
+    BulkEnrollmentJob,
     LearningPath,
     LearningPathEnrollment,
     LearningPathEnrollmentAllowed,
@@ -418,3 +419,13 @@ class EnrollmentAuditAdmin(admin.ModelAdmin):
         return "-"
 
     get_learning_path.short_description = "Learning Path"
+
+
+@admin.register(BulkEnrollmentJob)
+class BulkEnrollmentJobAdmin(admin.ModelAdmin):
+    """Admin configuration for BulkEnrollmentJob model."""
+
+    list_display = ["uuid", "action", "status", "created_by", "processed", "total", "created", "modified"]
+    list_filter = ["action", "status", "created"]
+    search_fields = ["uuid", "created_by__username", "reason", "org"]
+    readonly_fields = ["uuid", "created_by", "total", "processed", "counts", "errors", "created", "modified"]
@@ -0,0 +1,72 @@
+"""
+HTTP client for the completion aggregator API of the LMS.
+
+All clients share a single process-wide session, so the connections to the LMS are kept alive and reused
+across requests. The identity of the user is sent with each request instead of being bound to the session, and
+the session rejects all cookies, so no state set by a response for one user is sent with the requests of others.
+"""
+
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any
+
+import requests
+from django.conf import settings
+from django.contrib.auth.models import AbstractBaseUser
+from requests.adapters import HTTPAdapter
+
+from ...compat import create_user_jwt
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide session used for the completion API calls.
+
+    The session keeps up to `LEARNING_PATHS_COMPLETION_POOL_SIZE` connections per host alive. It does not
+    store cookies, as it is shared by the requests of all users.
+    """
+    global _session  # pylint: disable=global-statement
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                adapter = HTTPAdapter(
+                    pool_connections=settings.LEARNING_PATHS_COMPLETION_POOL_SIZE,
+                    pool_maxsize=settings.LEARNING_PATHS_COMPLETION_POOL_SIZE,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def reset_session():
+    """Close the process-wide session, so the next call creates a new one (e.g., after changing the settings)."""
+    global _session  # pylint: disable=global-statement
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+class CompletionClient:
+    """
+    Client for the completion API that makes requests on the shared session as a specific user.
+    """
+
+    def __init__(self, user: AbstractBaseUser):
+        self.headers = {"Authorization": f"JWT {create_user_jwt(user)}"}
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a GET request with the identity of the user.
+
+        Each request times out after `LEARNING_PATHS_COMPLETION_REQUEST_TIMEOUT` seconds, unless another
+        timeout is passed.
+        """
+        kwargs.setdefault("timeout", settings.LEARNING_PATHS_COMPLETION_REQUEST_TIMEOUT)
+        return get_session().get(url, headers=self.headers, **kwargs)
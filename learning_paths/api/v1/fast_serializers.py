@@ -0,0 +1,197 @@
+"""
+Lightweight serializers for the learning path list, detail, and programs APIs.
+
+These functions build the same data as `LearningPathListSerializer`, `LearningPathDetailSerializer`, and
+`LearningPathAsProgramSerializer` from `values()` querysets and plain dicts, without the per-field overhead of DRF.
+The rendered JSON must be identical to the one of the DRF serializers, so any change to these serializers must be
+reflected here.
+"""
+
+from collections import defaultdict
+from collections.abc import Collection, Iterable
+
+from django.db.models import QuerySet
+from rest_framework.request import Request
+
+from learning_paths.api.v1.serializers import DEFAULT_STATUS, IMAGE_HEIGHT, IMAGE_WIDTH
+from learning_paths.models import (
+    AcquiredSkill,
+    LearningPath,
+    LearningPathStep,
+    RequiredSkill,
+)
+
+from .utils import fetch_course_dates
+
+LIST_FIELDS = (
+    "id",
+    "key",
+    "display_name",
+    "image",
+    "sequential",
+    "invite_only",
+    "grading_criteria__required_completion",
+)
+DETAIL_FIELDS = LIST_FIELDS + ("subtitle", "description", "level", "duration", "time_commitment")
+PROGRAM_FIELDS = ("id", "uuid", "key", "display_name", "subtitle", "image")
+
+
+def get_learning_path_values(
+    queryset: QuerySet, detail: bool = False, fields: Collection[str] | None = None
+) -> QuerySet:
+    """
+    Get the values of the learning paths needed by `serialize_learning_paths`.
+
+    The `enrollment_date` is included if the queryset is annotated with it
+    (e.g., by `LearningPath.objects.get_paths_visible_to_user`).
+
+    :param fields: The serialized fields, if not all of them are needed.
+    """
+    values_fields = DETAIL_FIELDS if detail else LIST_FIELDS
+    if fields is not None and "required_completion" not in fields:
+        values_fields = tuple(field for field in values_fields if field != "grading_criteria__required_completion")
+    if "enrollment_date" in queryset.query.annotations:
+        values_fields += ("enrollment_date",)
+    return queryset.prefetch_related(None).values(*values_fields)
+
+
+def get_program_values(queryset: QuerySet) -> QuerySet:
+    """Get the values of the learning paths needed by `serialize_learning_paths_as_programs`."""
+    return queryset.prefetch_related(None).values(*PROGRAM_FIELDS)
+
+
+def _get_image_url(name: str | None, request: Request | None = None) -> str | None:
+    """Get the URL of a learning path image, like the DRF `ImageField`."""
+    if not name:
+        return None
+    url = LearningPath._meta.get_field("image").storage.url(name)
+    if request is not None:
+        return request.build_absolute_uri(url)
+    return url
+
+
+def _get_steps(learning_path_ids: Iterable[int]) -> dict[int, list[dict]]:
+    """Get the steps of the learning paths, grouped by the learning path ID."""
+    steps = defaultdict(list)
+    for step in (
+        LearningPathStep.objects.filter(learning_path_id__in=learning_path_ids)
+        .order_by("pk")
+        .values("learning_path_id", "order", "course_key", "weight")
+    ):
+        steps[step["learning_path_id"]].append(step)
+    return steps
+
+
+def _get_skills(model: type[RequiredSkill | AcquiredSkill], learning_path_ids: Iterable[int]) -> dict[int, list[dict]]:
+    """Get the serialized required or acquired skills of the learning paths, grouped by the learning path ID."""
+    skills = defaultdict(list)
+    for learning_path_id, level, skill_id, skill_display_name in (
+        model.objects.filter(learning_path_id__in=learning_path_ids)
+        .order_by("pk")
+        .values_list("learning_path_id", "level", "skill_id", "skill__display_name")
+    ):
+        skills[learning_path_id].append({"skill": {"id": skill_id, "display_name": skill_display_name}, "level": level})
+    return skills
+
+
+def serialize_learning_paths(
+    learning_paths: Iterable[dict],
+    request: Request | None = None,
+    detail: bool = False,
+    fields: Collection[str] | None = None,
+) -> list[dict]:
+    """
+    Serialize the learning paths like `LearningPathListSerializer` (or `LearningPathDetailSerializer`).
+
+    The steps, their course dates, and the skills are retrieved only if they are among the serialized fields.
+
+    :param learning_paths: The learning path values returned by `get_learning_path_values`.
+    :param request: The request used for building the absolute image URLs.
+    :param detail: Whether to include the fields of the learning path details.
+    :param fields: The serialized fields, in the order of the serializer. Defaults to all fields.
+    """
+    learning_paths = list(learning_paths)
+    learning_path_ids = [learning_path["id"] for learning_path in learning_paths]
+    steps: dict[int, list[dict]] = defaultdict(list)
+    course_dates = {}
+    if fields is None or "steps" in fields:
+        steps = _get_steps(learning_path_ids)
+        course_dates = fetch_course_dates(step["course_key"] for path_steps in steps.values() for step in path_steps)
+    required_skills: dict[int, list[dict]] = defaultdict(list)
+    acquired_skills: dict[int, list[dict]] = defaultdict(list)
+    if detail and (fields is None or "required_skills" in fields):
+        required_skills = _get_skills(RequiredSkill, learning_path_ids)
+    if detail and (fields is None or "acquired_skills" in fields):
+        acquired_skills = _get_skills(AcquiredSkill, learning_path_ids)
+
+    data = []
+    for learning_path in learning_paths:
+        required_completion = learning_path.get("grading_criteria__required_completion")
+        item = {
+            "key": str(learning_path["key"]),
+            "display_name": learning_path["display_name"],
+            "image": _get_image_url(learning_path["image"], request),
+            "sequential": learning_path["sequential"],
+            "steps": [
+                {
+                    "order": step["order"],
+                    "course_key": str(step["course_key"]),
+                    "course_dates": course_dates[step["course_key"]],
+                    "weight": step["weight"],
+                }
+                for step in steps[learning_path["id"]]
+            ],
+            "required_completion": None if required_completion is None else float(required_completion),
+            "enrollment_date": learning_path.get("enrollment_date"),
+            "invite_only": learning_path["invite_only"],
+        }
+        if detail:
+            item.update(
+                {
+                    "subtitle": learning_path["subtitle"],
+                    "description": learning_path["description"],
+                    "level": learning_path["level"],
+                    "duration": learning_path["duration"],
+                    "time_commitment": learning_path["time_commitment"],
+                    "required_skills": required_skills[learning_path["id"]],
+                    "acquired_skills": acquired_skills[learning_path["id"]],
+                }
+            )
+        if fields is not None:
+            item = {field: item[field] for field in fields}
+        data.append(item)
+    return data
+
+
+def serialize_learning_paths_as_programs(learning_paths: Iterable[dict]) -> list[dict]:
+    """
+    Serialize the learning paths like `LearningPathAsProgramSerializer`.
+
+    :param learning_paths: The learning path values returned by `get_program_values`.
+    """
+    learning_paths = list(learning_paths)
+    steps = _get_steps(learning_path["id"] for learning_path in learning_paths)
+
+    data = []
+    for learning_path in learning_paths:
+        course_codes: dict[str, dict] = {}
+        for step in steps[learning_path["id"]]:
+            course_key = step["course_key"]
+            run_mode = {"course_key": str(course_key), "run_key": course_key.run}
+            course_codes.setdefault(course_key.course, {"run_modes": []})["run_modes"].append(run_mode)
+
+        image_url = _get_image_url(learning_path["image"])
+        data.append(
+            {
+                "uuid": str(learning_path["uuid"]),
+                "name": learning_path["display_name"],
+                "marketing_slug": str(learning_path["key"]),
+                "title": learning_path["display_name"],
+                "subtitle": learning_path["subtitle"],
+                "status": DEFAULT_STATUS,
+                "banner_image_urls": {f"w{IMAGE_WIDTH}h{IMAGE_HEIGHT}": image_url} if image_url else {},
+                "organizations": [],
+                "course_codes": [{"key": key, **value} for key, value in course_codes.items()],
+            }
+        )
+    return data
@@ -0,0 +1,53 @@
+"""
+Pagination for the Learning Paths API.
+"""
+
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+CURSOR_PAGINATION_QUERY_PARAM = "pagination"
+CURSOR_PAGINATION = "cursor"
+
+
+class IdCursorPagination(CursorPagination):
+    """
+    Cursor pagination ordered by the ID.
+
+    Unlike page number pagination, it does not count the results or scan the results of the previous pages, so each
+    page takes the same time to retrieve.
+    """
+
+    ordering = "id"
+    page_size_query_param = "page_size"
+
+    def get_page_size(self, request):
+        """Get the requested page size, or `LEARNING_PATHS_CURSOR_PAGE_SIZE` by default."""
+        self.page_size = settings.LEARNING_PATHS_CURSOR_PAGE_SIZE
+        self.max_page_size = settings.LEARNING_PATHS_CURSOR_MAX_PAGE_SIZE
+        return super().get_page_size(request)
+
+
+class OptInCursorPaginationMixin:
+    """
+    View mixin that paginates the requests with `pagination=cursor` with `IdCursorPagination`.
+
+    Other requests are paginated with the `pagination_class` of the view (if any).
+    """
+
+    cursor_pagination_class = IdCursorPagination
+
+    def uses_cursor_pagination(self) -> bool:
+        """Check whether the request opted in to the cursor pagination."""
+        return self.request.query_params.get(CURSOR_PAGINATION_QUERY_PARAM) == CURSOR_PAGINATION
+
+    @property
+    def paginator(self):
+        """Get the paginator instance of the request."""
+        if not hasattr(self, "_paginator"):
+            if self.uses_cursor_pagination():
+                self._paginator = self.cursor_pagination_class()
+            elif self.pagination_class is None:
+                self._paginator = None
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
@@ -0,0 +1,133 @@
+"""
+Streaming parsers of the bulk enrollment API.
+
+The email addresses of a CSV body (or upload) and of a JSON array body are returned as `EmailRows`, an iterator that
+reads the request body while the rows are consumed. Therefore, the body is never loaded into memory as a whole.
+"""
+
+import codecs
+import csv
+import io
+import json
+from collections.abc import Iterator
+from typing import IO
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+
+# The number of bytes read from the request body at once.
+READ_SIZE = 64 * 1024
+EMAIL_COLUMN = "email"
+
+
+class EmailRows(Iterator[str]):
+    """Email addresses of the rows of a request body, parsed as they are consumed."""
+
+    def __init__(self, emails: Iterator[str]):
+        self._emails = emails
+
+    def __next__(self) -> str:
+        return next(self._emails)
+
+
+def _get_row_email(value) -> str:
+    """Get the email address of a JSON array item: a string or an object with an `email`."""
+    if isinstance(value, dict):
+        value = value.get(EMAIL_COLUMN)
+    return value.strip() if isinstance(value, str) else ""
+
+
+def _iter_json_array(reader: codecs.StreamReader, buffer: str) -> Iterator[str]:
+    """
+    Parse the items of a JSON array incrementally.
+
+    :param reader: The reader of the rest of the body.
+    :param buffer: The beginning of the body, starting with the opening bracket of the array.
+    """
+    decoder = json.JSONDecoder()
+    position = buffer.index("[") + 1
+    eof = False
+    while True:
+        while position < len(buffer) and (buffer[position].isspace() or buffer[position] == ","):
+            position += 1
+        if position < len(buffer) and buffer[position] == "]":
+            return
+        try:
+            value, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as exc:
+            if eof:
+                raise ParseError(f"JSON parse error - {exc}") from exc
+            end = None
+        # A value at the end of the buffer (e.g., a number) can continue in the next chunk.
+        if end is None or (end == len(buffer) and not eof):
+            try:
+                chunk = reader.read(READ_SIZE)
+            except UnicodeDecodeError as exc:
+                raise ParseError(f"JSON parse error - {exc}") from exc
+            eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        yield _get_row_email(value)
+        position = end
+
+
+def _iter_csv(reader: Iterator[list[str]], index: int) -> Iterator[str]:
+    """Get the email address of each CSV row."""
+    try:
+        for row in reader:
+            yield row[index].strip() if len(row) > index else ""
+    except (csv.Error, UnicodeDecodeError) as exc:
+        raise ParseError(f"CSV parse error - {exc}") from exc
+
+
+def parse_csv_emails(stream: IO[bytes], encoding: str | None = None) -> EmailRows:
+    """
+    Parse the email addresses of a CSV file incrementally.
+
+    The header is parsed immediately, so a file without an `email` column is rejected before any row is processed.
+
+    :param encoding: The encoding of the file. Defaults to `DEFAULT_CHARSET`.
+    """
+    reader = csv.reader(codecs.getreader(encoding or settings.DEFAULT_CHARSET)(stream))
+    try:
+        header = [column.strip().lower() for column in next(reader, [])]
+    except (csv.Error, UnicodeDecodeError) as exc:
+        raise ParseError(f"CSV parse error - {exc}") from exc
+    if EMAIL_COLUMN not in header:
+        raise ParseError(f'The CSV file must have an "{EMAIL_COLUMN}" column.')
+    return EmailRows(_iter_csv(reader, header.index(EMAIL_COLUMN)))
+
+
+class CSVParser(BaseParser):
+    """Parse the email addresses of a CSV body incrementally."""
+
+    media_type = "text/csv"
+
+    def parse(self, stream, media_type=None, parser_context=None) -> EmailRows:
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        return parse_csv_emails(stream, encoding)
+
+
+class StreamingJSONParser(JSONParser):
+    """
+    Parse the email addresses of a JSON array body incrementally.
+
+    The items of the array are email addresses or objects with an `email`. Other JSON documents are parsed like
+    `JSONParser` does.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        reader = codecs.getreader(encoding)(stream)
+        try:
+            head = reader.read(READ_SIZE)
+            while head.isspace() and (chunk := reader.read(READ_SIZE)):
+                head += chunk
+            if head.lstrip().startswith("["):
+                return EmailRows(_iter_json_array(reader, head))
+            body = head + reader.read()
+        except UnicodeDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}") from exc
+        return super().parse(io.BytesIO(body.encode(encoding)), media_type, parser_context)
@@ -6,6 +6,7 @@ from rest_framework import serializers
 
 from learning_paths.models import (
     AcquiredSkill,
+    BulkEnrollmentJob,
     LearningPath,
     LearningPathEnrollment,
     LearningPathStep,
@@ -79,9 +80,15 @@ class LearningPathAsProgramSerializer(serializers.ModelSerializer):
 
 # pylint: disable=abstract-method
 class LearningPathProgressSerializer(serializers.Serializer):
+    """
+    Serializer for learning path progress.
+    """
+
     learning_path_key = serializers.CharField()
     progress = serializers.FloatField()
     required_completion = serializers.FloatField()
+    incomplete = serializers.BooleanField(default=False)
+    stale = serializers.BooleanField(default=False)
 
 
 class LearningPathGradeSerializer(serializers.Serializer):
@@ -92,16 +99,52 @@ class LearningPathGradeSerializer(serializers.Serializer):
     learning_path_key = serializers.CharField()
     grade = serializers.FloatField()
     required_grade = serializers.FloatField()
+    stale = serializers.BooleanField(default=False)
+
+
+class LearningPathProgressAndGradeSerializer(serializers.Serializer):
+    """
+    Serializer for learning path progress and grade.
+
+    `stale` is True when the progress or the grade is calculated from the last known course values.
+    """
+
+    learning_path_key = serializers.CharField()
+    progress = serializers.FloatField()
+    required_completion = serializers.FloatField(allow_null=True)
+    incomplete = serializers.BooleanField(default=False)
+    stale = serializers.BooleanField(default=False)
+    grade = serializers.FloatField(allow_null=True)
+    required_grade = serializers.FloatField(allow_null=True)
 
 
 class LearningPathStepSerializer(serializers.ModelSerializer):
+    """
+    Serializer for learning path steps.
+
+    The course dates can be prefetched in bulk and passed in the `course_dates` context, keyed by the course key.
+    """
+
+    course_dates = serializers.SerializerMethodField()
+
     class Meta:
         model = LearningPathStep
         fields = ["order", "course_key", "course_dates", "weight"]
 
+    def get_course_dates(self, obj):
+        """Return the prefetched course dates, or retrieve them if they were not prefetched."""
+        course_dates = self.context.get("course_dates") or {}
+        if obj.course_key in course_dates:
+            return course_dates[obj.course_key]
+        return obj.course_dates
+
 
 class LearningPathListSerializer(serializers.ModelSerializer):
-    """Serializer for the learning path list."""
+    """
+    Serializer for the learning path list.
+
+    The optional `fields` argument limits the serialized fields.
+    """
 
     steps = LearningPathStepSerializer(many=True, read_only=True)
     required_completion = serializers.FloatField(source="grading_criteria.required_completion", read_only=True)
@@ -122,6 +165,13 @@ class LearningPathListSerializer(serializers.ModelSerializer):
             "invite_only",
         ]
 
+    def __init__(self, *args, fields=None, **kwargs):
+        """Initialize the serializer with the given subset of fields."""
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
     def get_enrollment_date(self, obj):
         """
         Check if the current user is enrolled in this learning path.
@@ -185,3 +235,14 @@ class LearningPathEnrollmentSerializer(serializers.ModelSerializer):
     class Meta:
         model = LearningPathEnrollment
         fields = ("user", "learning_path", "is_active", "created")
+
+
+class BulkEnrollmentJobSerializer(serializers.ModelSerializer):
+    """Serializer for the status of a bulk enrollment job."""
+
+    job_id = serializers.UUIDField(source="uuid", read_only=True)
+    total = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = BulkEnrollmentJob
+        fields = ("job_id", "action", "status", "total", "processed", "counts", "errors", "created", "modified")
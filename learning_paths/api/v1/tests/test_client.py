@@ -0,0 +1,91 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring
+import http.client
+import io
+from unittest.mock import Mock, patch
+
+import pytest
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+from learning_paths.api.v1.client import CompletionClient, get_session, reset_session
+
+
+@pytest.fixture(autouse=True)
+def fresh_session():
+    """Start each test with a new session."""
+    reset_session()
+    yield
+    reset_session()
+
+
+class TestGetSession:
+    def test_session_is_shared(self):
+        """Test that the same session is returned on each call."""
+        assert get_session() is get_session()
+
+    def test_pool_size(self, settings):
+        """Test that the connection pool size is configurable."""
+        settings.LEARNING_PATHS_COMPLETION_POOL_SIZE = 3
+
+        adapter = get_session().get_adapter("https://lms")
+
+        assert adapter._pool_maxsize == 3  # pylint: disable=protected-access
+
+    def test_reset_session(self):
+        """Test that resetting the session creates a new one."""
+        session = get_session()
+
+        reset_session()
+
+        assert get_session() is not session
+
+    def test_cookies_are_not_stored(self):
+        """Test that the cookies set by a response are not stored in the shared session."""
+
+        def send(adapter, request, **kwargs):
+            headers = http.client.HTTPMessage()
+            headers["Set-Cookie"] = "sessionid=user-1; Path=/"
+            raw = HTTPResponse(
+                body=io.BytesIO(b"{}"),
+                headers=dict(headers),
+                status=200,
+                preload_content=False,
+                original_response=Mock(msg=headers),
+            )
+            return adapter.build_response(request, raw)
+
+        with patch.object(HTTPAdapter, "send", send):
+            response = get_session().get("https://lms/api/completion/v1/course/")
+
+        assert response.cookies["sessionid"] == "user-1"
+        assert not get_session().cookies
+
+
+@patch("learning_paths.api.v1.client.create_user_jwt", side_effect=lambda user: f"token-{user.username}")
+class TestCompletionClient:
+    def test_requests_use_shared_session_with_user_identity(self, _mock_jwt):
+        """Test that clients of different users share the session but send their own credentials."""
+        with patch.object(get_session(), "get") as mock_get:
+            CompletionClient(Mock(username="alice")).get("https://lms/api")
+            CompletionClient(Mock(username="bob")).get("https://lms/api")
+
+        assert [call.kwargs["headers"]["Authorization"] for call in mock_get.call_args_list] == [
+            "JWT token-alice",
+            "JWT token-bob",
+        ]
+
+    def test_default_timeout(self, _mock_jwt, settings):
+        """Test that each request times out after the configured number of seconds."""
+        settings.LEARNING_PATHS_COMPLETION_REQUEST_TIMEOUT = 2
+
+        with patch.object(get_session(), "get") as mock_get:
+            CompletionClient(Mock(username="alice")).get("https://lms/api")
+
+        assert mock_get.call_args.kwargs["timeout"] == 2
+
+    def test_custom_timeout(self, _mock_jwt):
+        """Test that the timeout can be overridden per call."""
+        with patch.object(get_session(), "get") as mock_get:
+            CompletionClient(Mock(username="alice")).get("https://lms/api", timeout=1)
+
+        assert mock_get.call_args.kwargs["timeout"] == 1
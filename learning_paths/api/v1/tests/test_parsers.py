@@ -0,0 +1,79 @@
+"""Tests for the streaming parsers of the bulk enrollment API."""
+
+import io
+from unittest.mock import patch
+
+import pytest
+from rest_framework.exceptions import ParseError
+
+from learning_paths.api.v1.parsers import CSVParser, EmailRows, StreamingJSONParser
+
+
+@pytest.fixture(autouse=True)
+def small_reads():
+    """Read the body in small chunks, so that the values are split between the chunks."""
+    with patch("learning_paths.api.v1.parsers.READ_SIZE", 3):
+        yield
+
+
+class TestStreamingJSONParser:
+    """Tests for the `StreamingJSONParser`."""
+
+    def test_array(self):
+        """Test that the emails of a JSON array are parsed incrementally."""
+        body = b' \n [ "a@example.com", {"email": " b@example.com "}, 12345, null, {}, "c@example.com" ]'
+        stream = io.BytesIO(body)
+
+        emails = StreamingJSONParser().parse(stream)
+
+        assert isinstance(emails, EmailRows)
+        assert next(emails) == "a@example.com"
+        assert stream.tell() < len(body)
+        assert list(emails) == ["b@example.com", "", "", "", "c@example.com"]
+
+    def test_empty_array(self):
+        """Test that an empty JSON array has no rows."""
+        assert not list(StreamingJSONParser().parse(io.BytesIO(b"[]")))
+
+    def test_object(self):
+        """Test that other JSON documents are parsed like `JSONParser` does."""
+        assert StreamingJSONParser().parse(io.BytesIO(b'{"emails": "a@example.com"}')) == {"emails": "a@example.com"}
+
+    @pytest.mark.parametrize("body", [b'["a@example.com", {"email": ', b'["a@example.com" "b@example.com" x'])
+    def test_malformed_array(self, body):
+        """Test that the rows before a malformed part of the array are parsed before the error is raised."""
+        emails = StreamingJSONParser().parse(io.BytesIO(body))
+
+        assert next(emails) == "a@example.com"
+        with pytest.raises(ParseError):
+            list(emails)
+
+    def test_malformed_object(self):
+        """Test that a malformed JSON object is rejected."""
+        with pytest.raises(ParseError):
+            StreamingJSONParser().parse(io.BytesIO(b'{"emails": '))
+
+
+class TestCSVParser:
+    """Tests for the `CSVParser`."""
+
+    def test_email_column(self):
+        """Test that the email column is parsed, and the rows without an email are kept."""
+        body = b"Name,Email\nA,a@example.com\nB\nC, c@example.com \n"
+
+        assert list(CSVParser().parse(io.BytesIO(body))) == ["a@example.com", "", "c@example.com"]
+
+    @pytest.mark.parametrize("body", [b"", b"name\nA\n"])
+    def test_missing_email_column(self, body):
+        """Test that a CSV body without an email column is rejected before any row is parsed."""
+        with pytest.raises(ParseError):
+            CSVParser().parse(io.BytesIO(body))
+
+    def test_invalid_encoding(self):
+        """Test that a row that cannot be decoded raises a parse error."""
+        body = b"email\n" + b"a@example.com\n" * 100 + b"\xff\xfe\n"
+        emails = CSVParser().parse(io.BytesIO(body))
+
+        assert next(emails) == "a@example.com"
+        with pytest.raises(ParseError):
+            list(emails)
@@ -1,17 +1,33 @@
 # pylint: disable=missing-module-docstring
+from datetime import datetime, timezone
+from unittest.mock import patch
+
 import pytest
 from django.core.files.uploadedfile import SimpleUploadedFile
-
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from learning_paths.api.v1.fast_serializers import (
+    get_learning_path_values,
+    get_program_values,
+    serialize_learning_paths,
+    serialize_learning_paths_as_programs,
+)
 from learning_paths.api.v1.serializers import (
     LearningPathAsProgramSerializer,
     LearningPathDetailSerializer,
     LearningPathGradeSerializer,
     LearningPathListSerializer,
     LearningPathProgressSerializer,
+    LearningPathStepSerializer,
 )
+from learning_paths.models import LearningPath
 from learning_paths.tests.factories import (
+    AcquiredSkillFactory,
     LearningPathEnrollmentFactory,
     LearningPathFactory,
+    LearningPathStepFactory,
+    RequiredSkillFactory,
 )
 
 
@@ -63,6 +79,8 @@ def test_learning_path_progress_serializer():
         "learning_path_key": str(learning_path.key),
         "progress": 0.25,
         "required_completion": 0.80,
+        "incomplete": False,
+        "stale": False,
     }
     progress_serializer = LearningPathProgressSerializer(progress_data)
     assert dict(progress_serializer.data) == progress_data
@@ -84,6 +102,7 @@ def test_learning_path_grade_serializer():
         "learning_path_key": str(learning_path.key),
         "grade": 0.25,
         "required_grade": 0.80,
+        "stale": False,
     }
     grade_serializer = LearningPathGradeSerializer(grade_data)
     assert dict(grade_serializer.data) == grade_data
@@ -149,3 +168,83 @@ def test_detail_serializer():
     }
     serializer = LearningPathDetailSerializer(learning_path)
     assert dict(serializer.data) == expected
+
+
+@pytest.mark.django_db
+def test_step_serializer_course_dates():
+    """
+    Tests LearningPathStepSerializer uses the prefetched course dates and retrieves the missing ones.
+    """
+    step = LearningPathStepFactory()
+    prefetched_dates = (datetime(2024, 1, 1, tzinfo=timezone.utc), None)
+
+    with patch("learning_paths.models.get_course_dates", return_value=(None, None)) as mock_get_course_dates:
+        prefetched = LearningPathStepSerializer(step, context={"course_dates": {step.course_key: prefetched_dates}})
+        assert prefetched.data["course_dates"] == prefetched_dates
+        mock_get_course_dates.assert_not_called()
+
+        assert LearningPathStepSerializer(step).data["course_dates"] == (None, None)
+        mock_get_course_dates.assert_called_once_with(step.course_key)
+
+
+@pytest.mark.django_db
+class TestFastSerializers:
+    """Tests for the parity of the lightweight serializers with the DRF serializers."""
+
+    @pytest.fixture(autouse=True)
+    def mock_course_dates(self):
+        """Mock the course dates retrieved from edx-platform."""
+
+        def get_dates(course_key):
+            return datetime(2024, 1, len(course_key.run), tzinfo=timezone.utc), None
+
+        with (
+            patch("learning_paths.models.get_course_dates", side_effect=get_dates),
+            patch(
+                "learning_paths.api.v1.utils.get_course_dates_many",
+                side_effect=lambda course_keys: {course_key: get_dates(course_key) for course_key in course_keys},
+            ),
+        ):
+            yield
+
+    @pytest.fixture
+    def learning_paths(self, temp_media, user):  # pylint: disable=unused-argument
+        """Create learning paths with all fields, steps, skills, and enrollments."""
+        image = SimpleUploadedFile(name="test_image.png", content=b"test image content", content_type="image/png")
+        full = LearningPathFactory(
+            subtitle="Subtitle",
+            image=image,
+            level="advanced",
+            duration="10 Weeks",
+            time_commitment="4-6 hours/week",
+            sequential=True,
+            invite_only=False,
+        )
+        empty = LearningPathFactory(invite_only=False)
+        empty.grading_criteria.delete()
+        for order, course_key in enumerate(["course-v1:edX+A+Run", "course-v1:edX+B+Run", "course-v1:edX+A+Run2"]):
+            LearningPathStepFactory(learning_path=full, course_key=course_key, order=order or None, weight=0.5)
+        RequiredSkillFactory.create_batch(2, learning_path=full)
+        AcquiredSkillFactory(learning_path=full)
+        LearningPathEnrollmentFactory(user=user, learning_path=full)
+        return LearningPath.objects.get_paths_visible_to_user(user).prefetch_related("steps", "grading_criteria")
+
+    @pytest.mark.parametrize("serializer_class", [LearningPathListSerializer, LearningPathDetailSerializer])
+    @pytest.mark.parametrize("with_request", [True, False])
+    def test_learning_paths(self, learning_paths, serializer_class, with_request):
+        """Test that the learning paths are rendered to the same JSON as with the DRF serializers."""
+        request = APIRequestFactory().get("/") if with_request else None
+        detail = serializer_class is LearningPathDetailSerializer
+        expected = serializer_class(learning_paths, many=True, context={"request": request}).data
+
+        data = serialize_learning_paths(get_learning_path_values(learning_paths, detail=detail), request, detail=detail)
+
+        assert JSONRenderer().render(data) == JSONRenderer().render(expected)
+
+    def test_programs(self, learning_paths):
+        """Test that the programs are rendered to the same JSON as with the DRF serializer."""
+        expected = LearningPathAsProgramSerializer(learning_paths, many=True).data
+
+        data = serialize_learning_paths_as_programs(get_program_values(learning_paths))
+
+        assert JSONRenderer().render(data) == JSONRenderer().render(expected)
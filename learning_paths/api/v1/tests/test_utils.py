@@ -0,0 +1,395 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from django.db import DatabaseError
+from django.test import override_settings
+from opaque_keys.edx.keys import CourseKey
+from requests.exceptions import HTTPError
+from rest_framework.exceptions import APIException
+
+from learning_paths.api.v1.utils import (
+    AggregateProgress,
+    CourseCompletions,
+    calculate_aggregate_progress,
+    fetch_course_completions,
+    get_aggregate_progress,
+    get_completion_backend,
+    get_course_completion,
+    get_course_completions,
+    get_course_completions_batched,
+)
+from learning_paths.cache import set_last_known_values
+from learning_paths.circuit_breaker import completion_circuit_breaker
+from learning_paths.tests.factories import LearningPathStepFactory
+
+COURSE_KEYS = [CourseKey.from_string(f"course-v1:edX+DemoX+Course_{i}") for i in range(3)]
+
+
+@pytest.fixture(autouse=True)
+def lms_root_url(settings):
+    """Set the LMS root URL used to build the completion API URLs."""
+    settings.LMS_ROOT_URL = "http://lms"
+
+
+def _completion_response(percent: float) -> Mock:
+    """Create a mocked response of the completion aggregator API."""
+    response = Mock()
+    response.json.return_value = {"results": [{"completion": {"percent": percent}}]}
+    return response
+
+
+def _error_response(status_code: int) -> Mock:
+    """Create a mocked response that raises an HTTPError."""
+    response = Mock(status_code=status_code)
+    response.raise_for_status.side_effect = HTTPError(response=response)
+    return response
+
+
+class TestGetCourseCompletion:
+    def test_returns_completion_percent(self):
+        """Test that the completion percent is extracted from the response."""
+        client = Mock()
+        client.get.return_value = _completion_response(0.4)
+
+        assert get_course_completion("user", COURSE_KEYS[0], client) == 0.4
+        client.get.assert_called_once_with(
+            f"http://lms/completion-aggregator/v1/course/{COURSE_KEYS[0]}/?username=user"
+        )
+
+    def test_missing_course_returns_zero(self):
+        """Test that a missing course completion is treated as 0.0."""
+        client = Mock()
+        client.get.return_value = _error_response(404)
+
+        assert get_course_completion("user", COURSE_KEYS[0], client) == 0.0
+
+    def test_error_raises_api_exception(self):
+        """Test that errors other than 404 are raised as API exceptions."""
+        client = Mock()
+        client.get.return_value = _error_response(500)
+
+        with pytest.raises(APIException):
+            get_course_completion("user", COURSE_KEYS[0], client)
+
+
+class TestGetCourseCompletions:
+    def test_fetches_all_courses(self):
+        """Test that the completions of all courses are returned."""
+        client = Mock()
+        client.get.side_effect = [_completion_response(0.5) for _ in COURSE_KEYS]
+
+        completions, incomplete = get_course_completions("user", COURSE_KEYS, client)
+
+        assert completions == {course_key: 0.5 for course_key in COURSE_KEYS}
+        assert incomplete is False
+
+    def test_no_courses(self):
+        """Test that no requests are made when there are no courses."""
+        client = Mock()
+
+        assert get_course_completions("user", [], client) == ({}, False)
+        client.get.assert_not_called()
+
+    @override_settings(LEARNING_PATHS_COMPLETION_MAX_WORKERS=3)
+    def test_requests_run_concurrently(self):
+        """Test that the requests are made concurrently."""
+        barrier = threading.Barrier(len(COURSE_KEYS), timeout=5)
+
+        def get(_url):
+            # This only succeeds if all requests are in flight at the same time.
+            barrier.wait()
+            return _completion_response(1.0)
+
+        client = Mock()
+        client.get.side_effect = get
+
+        completions, incomplete = get_course_completions("user", COURSE_KEYS, client)
+
+        assert len(completions) == len(COURSE_KEYS)
+        assert incomplete is False
+
+    @override_settings(LEARNING_PATHS_COMPLETION_TIMEOUT=0.1)
+    def test_deadline_returns_partial_results(self):
+        """Test that the completions fetched before the deadline are returned and marked as incomplete."""
+        release = threading.Event()
+
+        def get(url):
+            if str(COURSE_KEYS[0]) not in url:
+                release.wait(timeout=5)
+            return _completion_response(1.0)
+
+        client = Mock()
+        client.get.side_effect = get
+
+        try:
+            completions, incomplete = get_course_completions("user", COURSE_KEYS, client)
+        finally:
+            release.set()
+
+        assert completions == {COURSE_KEYS[0]: 1.0}
+        assert incomplete is True
+
+    def test_errors_are_propagated(self):
+        """Test that errors raised while fetching a completion are propagated."""
+        client = Mock()
+        client.get.return_value = _error_response(500)
+
+        with pytest.raises(APIException):
+            get_course_completions("user", COURSE_KEYS, client)
+
+
+def _completion_list_response(completions: dict[CourseKey, float], next_url: str | None = None) -> Mock:
+    """Create a mocked response of the completion aggregator list API."""
+    response = Mock()
+    response.json.return_value = {
+        "results": [
+            {"course_key": str(course_key), "completion": {"percent": percent}}
+            for course_key, percent in completions.items()
+        ],
+        "pagination": {"next": next_url},
+    }
+    return response
+
+
+class TestGetCourseCompletionsBatched:
+    def test_single_request(self, settings):
+        """Test that the completions of all courses are fetched with a single request."""
+        settings.LEARNING_PATHS_COMPLETION_BATCH_SIZE = 50
+        other_course_key = CourseKey.from_string("course-v1:edX+DemoX+Other")
+        client = Mock()
+        client.get.return_value = _completion_list_response(
+            {COURSE_KEYS[0]: 0.5, COURSE_KEYS[1]: 1.0, other_course_key: 0.3}
+        )
+
+        completions = get_course_completions_batched("user", COURSE_KEYS, client)
+
+        # The course without completion data is treated as 0.0, and the course outside the path is ignored.
+        assert completions == {COURSE_KEYS[0]: 0.5, COURSE_KEYS[1]: 1.0, COURSE_KEYS[2]: 0.0}
+        client.get.assert_called_once_with("http://lms/completion-aggregator/v1/course/?username=user&page_size=50")
+
+    def test_follows_pagination(self):
+        """Test that the next pages are fetched until all courses are found."""
+        client = Mock()
+        client.get.side_effect = [
+            _completion_list_response({COURSE_KEYS[0]: 0.5}, next_url="http://lms/page2"),
+            _completion_list_response({COURSE_KEYS[1]: 0.2, COURSE_KEYS[2]: 0.1}, next_url="http://lms/page3"),
+        ]
+
+        completions = get_course_completions_batched("user", COURSE_KEYS, client)
+
+        assert completions == {COURSE_KEYS[0]: 0.5, COURSE_KEYS[1]: 0.2, COURSE_KEYS[2]: 0.1}
+        assert client.get.call_count == 2
+
+    def test_not_found_returns_zero(self):
+        """Test that all courses are treated as 0.0 when the user has no completion data."""
+        client = Mock()
+        client.get.return_value = _error_response(404)
+
+        assert get_course_completions_batched("user", COURSE_KEYS, client) == dict.fromkeys(COURSE_KEYS, 0.0)
+
+    def test_error_raises_api_exception(self):
+        """Test that errors other than 404 are raised as API exceptions."""
+        client = Mock()
+        client.get.return_value = _error_response(500)
+
+        with pytest.raises(APIException):
+            get_course_completions_batched("user", COURSE_KEYS, client)
+
+
+class TestGetCompletionBackend:
+    @patch("learning_paths.api.v1.utils.apps.is_installed", return_value=True)
+    def test_native_backend(self, _mock_is_installed, settings):
+        """Test that the native backend is used when the completion aggregator is installed."""
+        settings.LEARNING_PATHS_COMPLETION_BACKEND = "native"
+        assert get_completion_backend() == "native"
+
+    @patch("learning_paths.api.v1.utils.apps.is_installed", return_value=False)
+    def test_native_backend_falls_back_to_http(self, _mock_is_installed, settings):
+        """Test that the HTTP backend is used when the completion aggregator is not installed."""
+        settings.LEARNING_PATHS_COMPLETION_BACKEND = "native"
+        assert get_completion_backend() == "http"
+
+    def test_http_backend(self, settings):
+        """Test that the HTTP backend can be selected explicitly."""
+        settings.LEARNING_PATHS_COMPLETION_BACKEND = "http"
+        assert get_completion_backend() == "http"
+
+
+@pytest.mark.django_db
+@patch("learning_paths.api.v1.utils.get_completion_backend", return_value="http")
+class TestFetchCourseCompletionsFallback:
+    @pytest.fixture(autouse=True)
+    def mock_client(self):
+        with patch("learning_paths.api.v1.utils.CompletionClient") as mock_client:
+            yield mock_client
+
+    @patch("learning_paths.api.v1.utils.get_course_completions", return_value=({COURSE_KEYS[0]: 0.5}, False))
+    def test_success_stores_last_known_values(self, mock_get_course_completions, _mock_backend, user):
+        """Test that the fetched completions are used as the fallback of later failures."""
+        fetch_course_completions(user, COURSE_KEYS[:1])
+        mock_get_course_completions.side_effect = APIException("Unavailable")
+
+        assert fetch_course_completions(user, COURSE_KEYS[:1]) == CourseCompletions(
+            {COURSE_KEYS[0]: 0.5}, incomplete=False, stale=True
+        )
+
+    @patch("learning_paths.api.v1.utils.get_course_completions", side_effect=APIException("Unavailable"))
+    def test_failure_without_last_known_values(self, _mock_get_course_completions, _mock_backend, user):
+        """Test that the courses without a current or last known completion are reported as missing."""
+        assert fetch_course_completions(user, COURSE_KEYS[:1]) == CourseCompletions({}, incomplete=True)
+
+    @patch("learning_paths.api.v1.utils.get_course_completions", return_value=({COURSE_KEYS[0]: 0.5}, True))
+    def test_deadline_uses_last_known_values(self, _mock_get_course_completions, _mock_backend, user):
+        """Test that the courses not fetched before the deadline use their last known completions."""
+        set_last_known_values("completion", user.id, {COURSE_KEYS[1]: 0.25})
+
+        assert fetch_course_completions(user, COURSE_KEYS[:2]) == CourseCompletions(
+            {COURSE_KEYS[0]: 0.5, COURSE_KEYS[1]: 0.25}, incomplete=False, stale=True
+        )
+
+    @patch("learning_paths.api.v1.utils.get_course_completions", side_effect=APIException("Unavailable"))
+    def test_repeated_failures_open_circuit(self, mock_get_course_completions, _mock_backend, settings, user):
+        """Test that the backend is not called after the failure threshold is reached."""
+        settings.LEARNING_PATHS_CIRCUIT_BREAKER_FAILURE_THRESHOLD = 2
+
+        for _ in range(3):
+            fetch_course_completions(user, COURSE_KEYS[:1])
+
+        assert mock_get_course_completions.call_count == 2
+        assert not completion_circuit_breaker.allow_request()
+
+
+@pytest.mark.django_db
+@patch("learning_paths.api.v1.utils.get_completion_backend", return_value="native")
+class TestFetchCourseCompletionsNativeFallback:
+    @patch("learning_paths.api.v1.utils.get_user_course_completions", return_value={COURSE_KEYS[0]: 0.5})
+    def test_database_error_uses_last_known_values(self, mock_get_user_course_completions, _mock_backend, user):
+        """Test that a database error of the native backend falls back to the last known completions."""
+        fetch_course_completions(user, COURSE_KEYS[:1])
+        mock_get_user_course_completions.side_effect = DatabaseError("Unavailable")
+
+        assert fetch_course_completions(user, COURSE_KEYS[:1]) == CourseCompletions(
+            {COURSE_KEYS[0]: 0.5}, incomplete=False, stale=True
+        )
+
+    @patch(
+        "learning_paths.api.v1.utils.get_user_course_completions",
+        side_effect=lambda user, course_keys: time.sleep(0.01) or {COURSE_KEYS[0]: 0.5},
+    )
+    def test_slow_call_counts_as_failure(self, _mock_get_user_course_completions, _mock_backend, settings, user):
+        """Test that a native call exceeding the time budget returns its completions but opens the circuit."""
+        settings.LEARNING_PATHS_CIRCUIT_BREAKER_FAILURE_THRESHOLD = 1
+        settings.LEARNING_PATHS_COMPLETION_TIMEOUT = 0
+
+        assert fetch_course_completions(user, COURSE_KEYS[:1]) == CourseCompletions({COURSE_KEYS[0]: 0.5})
+
+        assert not completion_circuit_breaker.allow_request()
+
+
+@pytest.mark.django_db
+class TestCalculateAggregateProgress:
+    @pytest.fixture(autouse=True)
+    def mock_client(self):
+        with patch("learning_paths.api.v1.utils.CompletionClient") as mock_client:
+            yield mock_client
+
+    def test_no_steps(self, user, learning_path):
+        """Test that the progress of a learning path without steps is 0.0."""
+        assert calculate_aggregate_progress(user, learning_path) == AggregateProgress(0.0)
+
+    @patch(
+        "learning_paths.api.v1.utils.get_course_completions",
+        return_value=({COURSE_KEYS[0]: 1.0, COURSE_KEYS[1]: 0.5}, False),
+    )
+    def test_average_progress(self, _mock_get_course_completions, user, learning_path):
+        """Test that the progress is the average completion of all steps."""
+        LearningPathStepFactory(learning_path=learning_path, course_key=COURSE_KEYS[0])
+        LearningPathStepFactory(learning_path=learning_path, course_key=COURSE_KEYS[1])
+
+        assert calculate_aggregate_progress(user, learning_path) == AggregateProgress(0.75)
+
+    @patch(
+        "learning_paths.api.v1.utils.get_course_completions",
+        return_value=({COURSE_KEYS[0]: 1.0}, True),
+    )
+    def test_incomplete_progress(self, _mock_get_course_completions, user, learning_path):
+        """Test that missing completions are counted as 0.0 and the progress is marked as incomplete."""
+        LearningPathStepFactory(learning_path=learning_path, course_key=COURSE_KEYS[0])
+        LearningPathStepFactory(learning_path=learning_path, course_key=COURSE_KEYS[1])
+
+        assert calculate_aggregate_progress(user, learning_path) == AggregateProgress(0.5, incomplete=True)
+
+    @patch("learning_paths.api.v1.utils.get_completion_backend", return_value="native")
+    @patch("learning_paths.api.v1.utils.get_user_course_completions")
+    def test_native_backend(self, mock_get_user_course_completions, _mock_backend, mock_client, user, learning_path):
+        """Test that the native backend fetches all completions in one call without an HTTP client."""
+        LearningPathStepFactory(learning_path=learning_path, course_key=COURSE_KEYS[0])
+        LearningPathStepFactory(learning_path=learning_path, course_key=COURSE_KEYS[1])
+        mock_get_user_course_completions.return_value = {COURSE_KEYS[0]: 0.5, COURSE_KEYS[1]: 0.0}
+
+        assert calculate_aggregate_progress(user, learning_path) == AggregateProgress(0.25)
+        mock_get_user_course_completions.assert_called_once()
+        assert set(mock_get_user_course_completions.call_args.args[1]) == set(COURSE_KEYS[:2])
+        mock_client.assert_not_called()
+
+    @patch("learning_paths.api.v1.utils.get_completion_backend", return_value="http_batched")
+    @patch("learning_paths.api.v1.utils.get_course_completions_batched")
+    def test_http_batched_backend(self, mock_get_course_completions_batched, _mock_backend, user, learning_path):
+        """Test that the batched HTTP backend maps the fetched completions back to the steps."""
+        LearningPathStepFactory(learning_path=learning_path, course_key=COURSE_KEYS[0])
+        LearningPathStepFactory(learning_path=learning_path, course_key=COURSE_KEYS[1])
+        mock_get_course_completions_batched.return_value = {COURSE_KEYS[0]: 1.0, COURSE_KEYS[1]: 0.0}
+
+        assert calculate_aggregate_progress(user, learning_path) == AggregateProgress(0.5)
+        mock_get_course_completions_batched.assert_called_once()
+
+
+@pytest.mark.django_db
+class TestGetAggregateProgressCache:
+    @pytest.fixture(autouse=True)
+    def mock_calculate(self):
+        with patch("learning_paths.api.v1.utils.calculate_aggregate_progress") as mock_calculate:
+            mock_calculate.return_value = AggregateProgress(0.5)
+            yield mock_calculate
+
+    def test_progress_is_cached(self, mock_calculate, user, learning_path):
+        """Test that the progress is calculated only once."""
+        assert get_aggregate_progress(user, learning_path) == AggregateProgress(0.5)
+        assert get_aggregate_progress(user, learning_path) == AggregateProgress(0.5)
+
+        mock_calculate.assert_called_once_with(user, learning_path)
+
+    def test_max_age_zero_recalculates_progress(self, mock_calculate, user, learning_path):
+        """Test that the progress is recalculated when the client does not accept cached values."""
+        get_aggregate_progress(user, learning_path)
+        mock_calculate.return_value = AggregateProgress(0.6)
+
+        assert get_aggregate_progress(user, learning_path, max_age=0) == AggregateProgress(0.6)
+        assert get_aggregate_progress(user, learning_path) == AggregateProgress(0.6)
+
+    def test_incomplete_progress_is_not_cached(self, mock_calculate, user, learning_path):
+        """Test that partial results are not cached."""
+        mock_calculate.return_value = AggregateProgress(0.1, incomplete=True)
+        get_aggregate_progress(user, learning_path)
+        get_aggregate_progress(user, learning_path)
+
+        assert mock_calculate.call_count == 2
+
+    def test_stale_progress_is_not_cached(self, mock_calculate, user, learning_path):
+        """Test that results calculated from the last known completions are not cached."""
+        mock_calculate.return_value = AggregateProgress(0.1, stale=True)
+        get_aggregate_progress(user, learning_path)
+        get_aggregate_progress(user, learning_path)
+
+        assert mock_calculate.call_count == 2
+
+    def test_disabled_cache(self, mock_calculate, settings, user, learning_path):
+        """Test that the progress is always calculated when the cache is disabled."""
+        settings.LEARNING_PATHS_PROGRESS_CACHE_TIMEOUT = 0
+        get_aggregate_progress(user, learning_path)
+        get_aggregate_progress(user, learning_path)
+
+        assert mock_calculate.call_count == 2
@@ -1,36 +1,56 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,redefined-outer-name,unused-argument
+import csv
+import json
+import re
 from datetime import datetime, timezone
-from unittest.mock import patch
+from unittest.mock import Mock, patch
+from urllib.parse import urlencode
+from uuid import uuid4
 
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import DatabaseError, connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from openedx_events.content_authoring.data import CourseCatalogData, CourseScheduleData
+from openedx_events.content_authoring.signals import COURSE_CATALOG_INFO_CHANGED
 from rest_framework import status
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
 
 from learning_paths.api.v1.serializers import (
     LearningPathAsProgramSerializer,
     LearningPathProgressSerializer,
 )
+from learning_paths.api.v1.utils import AggregateProgress
 from learning_paths.api.v1.views import (
     LearningPathAsProgramViewSet,
     LearningPathUserProgressView,
 )
+from learning_paths.grades import AggregateGrade
 from learning_paths.models import (
+    BulkEnrollmentJob,
+    LearningPath,
     LearningPathEnrollment,
     LearningPathEnrollmentAllowed,
     LearningPathEnrollmentAudit,
+    LearningPathStep,
 )
 from learning_paths.tests.factories import (
     AcquiredSkillFactory,
     LearningPathEnrollmentAllowedFactory,
     LearningPathEnrollmentFactory,
     LearningPathFactory,
+    LearningPathProgressFactory,
     LearningPathStepFactory,
     RequiredSkillFactory,
     UserFactory,
 )
 
+# The query that counts the paginated learning paths or enrollments.
+PAGINATION_COUNT_QUERY = re.compile(r'"__count" FROM "learning_paths_learningpath(enrollment)?"')
+
 
 @pytest.fixture
 def api_client():
@@ -118,7 +138,7 @@ class TestLearningPathAsProgram:
 
 @pytest.mark.django_db
 class TestLearningPathUserProgress:
-    @patch("learning_paths.api.v1.views.get_aggregate_progress", return_value=0.75)
+    @patch("learning_paths.api.v1.views.get_aggregate_progress", return_value=AggregateProgress(0.75))
     def test_learning_path_progress_success(self, _mock_get_aggregate_progress, user, learning_path):
         """Test retrieving progress for a learning path."""
         url = reverse("learning-path-progress", args=[learning_path.key])
@@ -137,6 +157,62 @@ class TestLearningPathUserProgress:
         serializer = LearningPathProgressSerializer(data=expected_data)
         serializer.is_valid()
         assert response.data == serializer.data
+        assert response.data["incomplete"] is False
+
+    @patch("learning_paths.api.v1.views.get_aggregate_progress", return_value=AggregateProgress(0.5, incomplete=True))
+    def test_learning_path_progress_incomplete(self, _mock_get_aggregate_progress, authenticated_client, learning_path):
+        """Test that the progress view marks the progress as incomplete when some completions are missing."""
+        url = reverse("learning-path-progress", args=[learning_path.key])
+        response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["progress"] == 0.5
+        assert response.data["incomplete"] is True
+
+    @patch("learning_paths.api.v1.views.get_aggregate_progress", return_value=AggregateProgress(0.5))
+    def test_learning_path_progress_max_age(self, mock_get_aggregate_progress, authenticated_client, learning_path):
+        """Test that the `max_age` query parameter is passed to the progress calculation."""
+        url = reverse("learning-path-progress", args=[learning_path.key])
+        response = authenticated_client.get(url, {"max_age": "60"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert mock_get_aggregate_progress.call_args.kwargs["max_age"] == 60
+
+    @pytest.mark.parametrize("max_age", ["-1", "abc"])
+    def test_learning_path_progress_invalid_max_age(self, authenticated_client, learning_path, max_age):
+        """Test that an invalid `max_age` query parameter returns 400."""
+        url = reverse("learning-path-progress", args=[learning_path.key])
+        response = authenticated_client.get(url, {"max_age": max_age})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @patch("learning_paths.api.v1.views.get_aggregate_progress")
+    def test_learning_path_progress_materialized(  # pylint: disable=too-many-positional-arguments
+        self, mock_get_aggregate_progress, settings, authenticated_client, active_enrollment, learning_path
+    ):
+        """Test that the progress is read from the materialized table when it is enabled."""
+        settings.LEARNING_PATHS_USE_MATERIALIZED_PROGRESS = True
+        LearningPathProgressFactory(enrollment=active_enrollment, progress=0.4)
+        url = reverse("learning-path-progress", args=[learning_path.key])
+
+        response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["progress"] == 0.4
+        mock_get_aggregate_progress.assert_not_called()
+
+    @patch("learning_paths.api.v1.views.get_aggregate_progress", return_value=AggregateProgress(0.3))
+    def test_learning_path_progress_materialized_fallback(
+        self, _mock_get_aggregate_progress, settings, authenticated_client, active_enrollment, learning_path
+    ):
+        """Test that the progress is calculated when there is no materialized row."""
+        settings.LEARNING_PATHS_USE_MATERIALIZED_PROGRESS = True
+        url = reverse("learning-path-progress", args=[learning_path.key])
+
+        response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["progress"] == 0.3
 
     def test_learning_path_progress_not_found(self, authenticated_client):
         """Test that the progress view returns 404 if the learning path is not found."""
@@ -162,10 +238,10 @@ class TestLearningPathUserGrade:
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert response.data["detail"] == "Grading criteria not found for this learning path."
 
-    @patch("learning_paths.api.v1.views.get_aggregate_progress", return_value=80.0)
+    @patch("learning_paths.api.v1.views.get_aggregate_progress", return_value=AggregateProgress(80.0))
     @patch(
         "learning_paths.models.LearningPathGradingCriteria.calculate_grade",
-        return_value=0.85,
+        return_value=AggregateGrade(0.85),
     )
     def test_learning_path_grade_success(
         self,
@@ -181,6 +257,34 @@ class TestLearningPathUserGrade:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["grade"] == 0.85
         assert response.data["required_grade"] == 0.75
+        assert response.data["stale"] is False
+
+    @patch("learning_paths.grades.get_user_course_grade", side_effect=DatabaseError("Unavailable"))
+    def test_learning_path_grade_stale(
+        self, _mock_get_user_course_grade, authenticated_client, learning_path_with_steps
+    ):
+        """Test that a grade calculated without the current course grades is marked as stale."""
+        url = reverse("learning-path-grade", args=[learning_path_with_steps.key])
+        response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["grade"] == 0.0
+        assert response.data["stale"] is True
+
+    @patch("learning_paths.models.LearningPathGradingCriteria.calculate_grade")
+    def test_learning_path_grade_materialized(  # pylint: disable=too-many-positional-arguments
+        self, mock_calculate_grade, settings, authenticated_client, active_enrollment, learning_path
+    ):
+        """Test that the grade is read from the materialized table when it is enabled."""
+        settings.LEARNING_PATHS_USE_MATERIALIZED_PROGRESS = True
+        LearningPathProgressFactory(enrollment=active_enrollment, grade=0.9)
+        url = reverse("learning-path-grade", args=[learning_path.key])
+
+        response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["grade"] == 0.9
+        mock_calculate_grade.assert_not_called()
 
     def test_learning_path_grade_not_found(self, authenticated_client):
         """Test that the grade view returns 404 if the learning path is not found."""
@@ -196,15 +300,297 @@ class TestLearningPathUserGrade:
 
 
 @pytest.mark.django_db
-class TestLearningPathViewSet:
+class TestLearningPathUserProgressAndGrade:
+    @pytest.fixture
+    def url(self, learning_path_with_steps):
+        return reverse("learning-path-progress-and-grade", args=[learning_path_with_steps.key])
+
     @pytest.fixture(autouse=True)
-    def setup_mock_course_dates(self):
-        """Mock course dates that are retrieved from edx-platform."""
-        start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        end_date = datetime(2025, 1, 1, tzinfo=timezone.utc)
-        with patch("learning_paths.models.get_course_dates", return_value=(start_date, end_date)):
+    def mock_course_values(self):
+        """Mock the course completions and grades retrieved from edx-platform."""
+        with (
+            patch("learning_paths.api.v1.utils.get_completion_backend", return_value="native"),
+            patch(
+                "learning_paths.api.v1.utils.get_user_course_completions",
+                side_effect=lambda user, course_keys: dict.fromkeys(course_keys, 0.5),
+            ),
+            patch("learning_paths.grades.get_user_course_grade", return_value=Mock(percent=0.9)),
+        ):
             yield
 
+    def test_progress_and_grade(self, authenticated_client, url, learning_path_with_steps):
+        """Test that the progress and grade are returned together."""
+        response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "learning_path_key": str(learning_path_with_steps.key),
+            "progress": 0.5,
+            "required_completion": 0.8,
+            "incomplete": False,
+            "stale": False,
+            "grade": 0.9,
+            "required_grade": 0.75,
+        }
+
+    def test_stale_grade(self, authenticated_client, url):
+        """Test that the response is marked as stale when the grade is calculated without the current course grades."""
+        with patch("learning_paths.grades.get_user_course_grade", side_effect=DatabaseError("Unavailable")):
+            response = authenticated_client.get(url)
+
+        assert response.data["grade"] == 0.0
+        assert response.data["stale"] is True
+
+    def test_learning_path_and_steps_are_fetched_once(self, authenticated_client, url, django_assert_num_queries):
+        """Test that the learning path (with its grading criteria) and its steps are fetched only once."""
+        with django_assert_num_queries(2):
+            response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_without_grading_criteria(self, authenticated_client, url, learning_path_with_steps):
+        """Test that the progress is returned without a grade when there are no grading criteria."""
+        learning_path_with_steps.grading_criteria.delete()
+
+        response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["progress"] == 0.5
+        assert response.data["grade"] is None
+        assert response.data["required_grade"] is None
+
+    def test_materialized(  # pylint: disable=too-many-positional-arguments
+        self, settings, authenticated_client, url, learning_path_with_steps, user
+    ):
+        """Test that the progress and grade are read from a single materialized row."""
+        settings.LEARNING_PATHS_USE_MATERIALIZED_PROGRESS = True
+        LearningPathProgressFactory(
+            enrollment__user=user, enrollment__learning_path=learning_path_with_steps, progress=0.2, grade=0.3
+        )
+
+        response = authenticated_client.get(url)
+
+        assert response.data["progress"] == 0.2
+        assert response.data["grade"] == 0.3
+
+    def test_materialized_without_grading_criteria(  # pylint: disable=too-many-positional-arguments
+        self, settings, authenticated_client, url, learning_path_with_steps, user
+    ):
+        """Test that the materialized row is returned without a grade when there are no grading criteria."""
+        settings.LEARNING_PATHS_USE_MATERIALIZED_PROGRESS = True
+        learning_path_with_steps.grading_criteria.delete()
+        LearningPathProgressFactory(
+            enrollment__user=user, enrollment__learning_path=learning_path_with_steps, progress=0.2, grade=0.0
+        )
+
+        response = authenticated_client.get(url)
+
+        assert response.data["progress"] == 0.2
+        assert response.data["grade"] is None
+        assert response.data["required_grade"] is None
+
+    def test_invite_only_learning_path_404(self, authenticated_client, learning_path_with_invite_only):
+        """Test that the view returns 404 if the learning path is invite-only."""
+        url = reverse("learning-path-progress-and-grade", args=[learning_path_with_invite_only.key])
+        response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestUserLearningPathsProgress:
+    url = reverse("user-learning-paths-progress")
+
+    @pytest.fixture
+    def enrolled_learning_paths(self, user, learning_paths_with_steps):
+        """Enroll the user in all learning paths that share the same courses."""
+        for learning_path in learning_paths_with_steps:
+            LearningPathEnrollmentFactory(user=user, learning_path=learning_path)
+        return learning_paths_with_steps
+
+    @pytest.fixture
+    def mock_completions(self):
+        """Mock the course completions retrieved from edx-platform."""
+        with (
+            patch("learning_paths.api.v1.utils.get_completion_backend", return_value="native"),
+            patch(
+                "learning_paths.api.v1.utils.get_user_course_completions",
+                side_effect=lambda user, course_keys: dict.fromkeys(course_keys, 0.5),
+            ) as mock,
+        ):
+            yield mock
+
+    @pytest.fixture
+    def mock_grades(self):
+        """Mock the course grades retrieved from edx-platform."""
+        with patch("learning_paths.grades.get_user_course_grade", return_value=Mock(percent=0.9)) as mock:
+            yield mock
+
+    def test_progress_in_all_learning_paths(
+        self, authenticated_client, enrolled_learning_paths, mock_completions, mock_grades
+    ):
+        """Test that the progress and grade are returned for all enrolled learning paths."""
+        response = authenticated_client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert {item["learning_path_key"] for item in response.data} == {
+            str(learning_path.key) for learning_path in enrolled_learning_paths
+        }
+        for item in response.data:
+            assert item["progress"] == 0.5
+            assert item["grade"] == 0.9
+            assert item["incomplete"] is False
+
+    def test_courses_are_fetched_once(
+        self, authenticated_client, enrolled_learning_paths, mock_completions, mock_grades
+    ):
+        """Test that courses shared by multiple learning paths are fetched only once."""
+        authenticated_client.get(self.url)
+
+        mock_completions.assert_called_once()
+        assert len(mock_completions.call_args.args[1]) == 2
+        assert mock_grades.call_count == 2
+
+    def test_cached_values_are_reused(
+        self, authenticated_client, enrolled_learning_paths, mock_completions, mock_grades
+    ):
+        """Test that the cached progress and grades are not fetched again."""
+        authenticated_client.get(self.url)
+        mock_completions.reset_mock()
+        mock_grades.reset_mock()
+
+        response = authenticated_client.get(self.url)
+
+        assert len(response.data) == len(enrolled_learning_paths)
+        mock_completions.assert_not_called()
+        mock_grades.assert_not_called()
+
+    def test_stale_grades(self, authenticated_client, enrolled_learning_paths, mock_completions, mock_grades):
+        """Test that the learning paths are marked as stale when the current course grades are unavailable."""
+        mock_grades.side_effect = DatabaseError("Unavailable")
+
+        response = authenticated_client.get(self.url)
+
+        assert [item["stale"] for item in response.data] == [True] * len(enrolled_learning_paths)
+        assert [item["grade"] for item in response.data] == [0.0] * len(enrolled_learning_paths)
+
+    def test_grades_are_not_fetched_without_grading_criteria(
+        self, authenticated_client, enrolled_learning_paths, mock_completions, mock_grades
+    ):
+        """Test that the course grades are not fetched for learning paths without grading criteria."""
+        for learning_path in enrolled_learning_paths:
+            learning_path.grading_criteria.delete()
+
+        response = authenticated_client.get(self.url)
+
+        assert [item["grade"] for item in response.data] == [None] * len(enrolled_learning_paths)
+        mock_grades.assert_not_called()
+
+    def test_inactive_enrollments_are_excluded(  # pylint: disable=too-many-positional-arguments
+        self, authenticated_client, user, learning_path_with_steps, mock_completions, mock_grades
+    ):
+        """Test that the learning paths the user is unenrolled from are not returned."""
+        LearningPathEnrollmentFactory(user=user, learning_path=learning_path_with_steps, is_active=False)
+
+        response = authenticated_client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == []
+        mock_completions.assert_not_called()
+
+    def test_materialized(  # pylint: disable=too-many-positional-arguments
+        self, settings, authenticated_client, user, learning_path_with_steps, mock_completions, mock_grades
+    ):
+        """Test that the materialized progress is used without fetching the courses."""
+        settings.LEARNING_PATHS_USE_MATERIALIZED_PROGRESS = True
+        LearningPathProgressFactory(
+            enrollment__user=user, enrollment__learning_path=learning_path_with_steps, progress=0.2, grade=0.3
+        )
+
+        response = authenticated_client.get(self.url)
+
+        assert response.data[0]["progress"] == 0.2
+        assert response.data[0]["grade"] == 0.3
+        mock_completions.assert_not_called()
+        mock_grades.assert_not_called()
+
+    def test_unauthenticated(self, api_client):
+        """Test that the endpoint requires authentication."""
+        response = api_client.get(self.url)
+        assert response.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+
+
+@pytest.mark.django_db
+class TestLearningPathProgressReport:
+    @pytest.fixture
+    def url(self, learning_path_with_steps):
+        return reverse("learning-path-progress-report", args=[learning_path_with_steps.key])
+
+    @pytest.fixture(autouse=True)
+    def mock_course_values(self):
+        """Mock the bulk course completions and grades retrieved from edx-platform."""
+        with (
+            patch(
+                "learning_paths.reports.get_course_user_completions",
+                side_effect=lambda course_key, user_ids: dict.fromkeys(user_ids, 0.5),
+            ),
+            patch(
+                "learning_paths.reports.get_course_user_grades",
+                side_effect=lambda course_key, user_ids: dict.fromkeys(user_ids, 0.8),
+            ),
+        ):
+            yield
+
+    @pytest.fixture
+    def enrollment(self, learning_path_with_steps):
+        return LearningPathEnrollmentFactory(learning_path=learning_path_with_steps)
+
+    def test_csv_report(self, staff_client, url, enrollment):
+        """Test that the report is streamed as CSV by default."""
+        response = staff_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"] == "text/csv"
+        assert b"".join(response.streaming_content).decode().splitlines() == [
+            "username,progress,grade,passed",
+            f"{enrollment.user.username},0.5,0.8,True",
+        ]
+
+    def test_ndjson_report(self, staff_client, url, enrollment):
+        """Test that the report is streamed as NDJSON."""
+        response = staff_client.get(url, {"report_format": "ndjson"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"username": enrollment.user.username, "progress": 0.5, "grade": 0.8, "passed": True}
+        ]
+
+    def test_invalid_format(self, staff_client, url):
+        """Test that an unsupported report format is rejected."""
+        response = staff_client.get(url, {"report_format": "xml"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_non_staff_user(self, authenticated_client, url):
+        """Test that non-staff users cannot access the report."""
+        response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_missing_learning_path(self, staff_client):
+        """Test that the view returns 404 if the learning path does not exist."""
+        response = staff_client.get(reverse("learning-path-progress-report", args=["path-v1:test+missing+run+group"]))
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("mock_course_dates")
+class TestLearningPathViewSet:
+    @pytest.fixture
+    def course_dates(self):
+        """Return the dates of all courses."""
+        return datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2025, 1, 1, tzinfo=timezone.utc)
+
     def test_learning_path_list(self, authenticated_client, learning_paths_with_steps):
         """Test that the list endpoint returns all learning paths with basic fields."""
         url = reverse("learning-path-list")
@@ -326,6 +712,467 @@ class TestLearningPathViewSet:
         assert response.data["detail"] == "No LearningPath matches the given query."
 
 
+@pytest.mark.django_db
+@pytest.mark.usefixtures("mock_course_dates")
+class TestLearningPathViewSetCatalogCache:
+    """Tests for the cached catalog of the learning path list."""
+
+    url = reverse("learning-path-list")
+
+    @pytest.fixture
+    def mixed_learning_paths(self, user):
+        """Create public and invite-only learning paths, some of which the user is enrolled in."""
+        public = LearningPathFactory.create_batch(3, invite_only=False)
+        invite_only = LearningPathFactory.create_batch(2, invite_only=True)
+        for learning_path in public + invite_only:
+            LearningPathStepFactory(learning_path=learning_path, order=1)
+        LearningPathEnrollmentFactory(user=user, learning_path=invite_only[0])
+        LearningPathEnrollmentFactory(user=user, learning_path=public[1])
+        LearningPathEnrollmentFactory(user=user, learning_path=public[2], is_active=False)
+        return public + invite_only
+
+    @pytest.mark.parametrize("client_fixture", ["authenticated_client", "staff_client"])
+    def test_same_response_as_uncached(self, request, settings, client_fixture, mixed_learning_paths):
+        """Test that the cached catalog returns the same learning paths, ordering, and enrollment dates."""
+        client = request.getfixturevalue(client_fixture)
+        cached_response = client.get(self.url)
+        settings.LEARNING_PATHS_CATALOG_CACHE_TIMEOUT = 0
+
+        uncached_response = client.get(self.url)
+
+        assert cached_response.status_code == status.HTTP_200_OK
+        assert cached_response.data == uncached_response.data
+
+    def test_catalog_is_shared_by_users(
+        self, authenticated_client, staff_user, mixed_learning_paths, mock_course_dates
+    ):
+        """Test that the catalog is serialized once for all users."""
+        staff_client = APIClient()
+        staff_client.force_authenticate(user=staff_user)
+        staff_client.get(self.url)
+        mock_course_dates.reset_mock()
+
+        authenticated_client.get(self.url)
+
+        mock_course_dates.assert_not_called()
+
+    def test_cached_list_queries(self, authenticated_client, mixed_learning_paths, django_assert_num_queries):
+        """Test that a cached list only queries the enrollments of the user (in addition to the ETag validators)."""
+        authenticated_client.get(self.url)
+
+        # 2 queries for the ETag validators and 1 for the enrollments.
+        with django_assert_num_queries(3):
+            authenticated_client.get(self.url)
+
+    def test_enrollment_is_reflected(self, authenticated_client, user, mixed_learning_paths):
+        """Test that new enrollments are reflected without invalidating the catalog."""
+        authenticated_client.get(self.url)
+        LearningPathEnrollmentFactory(user=user, learning_path=mixed_learning_paths[4])
+
+        response = authenticated_client.get(self.url)
+
+        assert response.data[0]["key"] == str(mixed_learning_paths[4].key)
+        assert response.data[0]["enrollment_date"] is not None
+
+    @pytest.mark.parametrize("change", ["path", "step", "grading_criteria"])
+    def test_catalog_changes_invalidate_cache(self, authenticated_client, mixed_learning_paths, change):
+        """Test that changing a learning path, its steps, or its grading criteria invalidates the catalog."""
+        authenticated_client.get(self.url)
+        learning_path = mixed_learning_paths[0]
+        if change == "path":
+            learning_path.display_name = "Updated"
+            learning_path.save()
+        elif change == "step":
+            LearningPathStepFactory(
+                learning_path=learning_path, order=2, course_key="course-v1:edX+DemoX+Another_Course"
+            )
+        else:
+            learning_path.grading_criteria.required_completion = 0.5
+            learning_path.grading_criteria.save()
+
+        response = authenticated_client.get(self.url)
+
+        item = next(item for item in response.data if item["key"] == str(learning_path.key))
+        assert item["display_name"] == learning_path.display_name
+        assert len(item["steps"]) == learning_path.steps.count()
+        assert item["required_completion"] == learning_path.grading_criteria.required_completion
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("mock_course_dates")
+class TestLearningPathViewSetCourseDates:
+    """Tests for the bulk retrieval of the course dates of the learning path steps."""
+
+    START_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    END_DATE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    @pytest.fixture
+    def course_dates(self):
+        """Return the dates of all courses."""
+        return self.START_DATE, self.END_DATE
+
+    @pytest.fixture
+    def learning_paths(self):
+        """Create learning paths with several steps each."""
+        learning_paths = LearningPathFactory.create_batch(3, invite_only=False)
+        for learning_path in learning_paths:
+            for order in range(1, 4):
+                LearningPathStepFactory(
+                    learning_path=learning_path,
+                    order=order,
+                    course_key=f"course-v1:edX+{learning_path.pk}+Course_{order}",
+                )
+        return learning_paths
+
+    @pytest.mark.parametrize("catalog_cache_timeout", [0, 300])
+    def test_list_retrieves_dates_once(  # pylint: disable=too-many-positional-arguments
+        self, settings, authenticated_client, learning_paths, mock_course_dates, catalog_cache_timeout
+    ):
+        """Test that the dates of all courses in the list are retrieved with a single call."""
+        settings.LEARNING_PATHS_CATALOG_CACHE_TIMEOUT = catalog_cache_timeout
+
+        response = authenticated_client.get(reverse("learning-path-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        mock_course_dates.assert_called_once()
+        assert len(mock_course_dates.call_args.args[0]) == 9
+        for item in response.data:
+            assert all(step["course_dates"] == (self.START_DATE, self.END_DATE) for step in item["steps"])
+
+    def test_retrieve_retrieves_dates_once(self, authenticated_client, learning_paths, mock_course_dates):
+        """Test that the dates of all courses in a learning path are retrieved with a single call."""
+        learning_path = learning_paths[0]
+
+        response = authenticated_client.get(reverse("learning-path-detail", args=[learning_path.key]))
+
+        assert response.status_code == status.HTTP_200_OK
+        mock_course_dates.assert_called_once()
+        assert set(mock_course_dates.call_args.args[0]) == {step.course_key for step in learning_path.steps.all()}
+
+    def test_dates_are_cached_in_process(self, settings, authenticated_client, learning_paths, mock_course_dates):
+        """Test that the course dates are reused by the next requests."""
+        settings.LEARNING_PATHS_CATALOG_CACHE_TIMEOUT = 0
+        authenticated_client.get(reverse("learning-path-list"))
+        mock_course_dates.reset_mock()
+
+        authenticated_client.get(reverse("learning-path-list"))
+        authenticated_client.get(reverse("learning-path-detail", args=[learning_paths[0].key]))
+
+        mock_course_dates.assert_not_called()
+
+    def test_course_publish_invalidates_dates(self, settings, authenticated_client, learning_paths, mock_course_dates):
+        """Test that publishing a course invalidates its cached dates and the cached catalog."""
+        authenticated_client.get(reverse("learning-path-list"))
+        mock_course_dates.reset_mock()
+        course_key = learning_paths[0].steps.first().course_key
+
+        COURSE_CATALOG_INFO_CHANGED.send_event(
+            catalog_info=CourseCatalogData(
+                course_key=course_key,
+                name="Course",
+                schedule_data=CourseScheduleData(start=self.START_DATE, pacing="instructor"),
+            )
+        )
+        authenticated_client.get(reverse("learning-path-list"))
+
+        mock_course_dates.assert_called_once_with([course_key])
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("mock_course_dates")
+class TestFastSerialization:
+    """Tests for the lightweight serialization of the learning path list, detail, and programs APIs."""
+
+    @pytest.fixture
+    def course_dates(self):
+        """Return the dates of all courses."""
+        return datetime(2024, 1, 1, tzinfo=timezone.utc), None
+
+    @pytest.fixture
+    def learning_paths(self, user):
+        """Create public and invite-only learning paths with steps and skills."""
+        learning_paths = LearningPathFactory.create_batch(3, invite_only=False) + [
+            LearningPathFactory(invite_only=True)
+        ]
+        for learning_path in learning_paths:
+            LearningPathStepFactory(learning_path=learning_path, course_key=f"course-v1:edX+{learning_path.pk}+Run")
+            RequiredSkillFactory(learning_path=learning_path)
+            AcquiredSkillFactory(learning_path=learning_path)
+        LearningPathEnrollmentFactory(user=user, learning_path=learning_paths[1])
+        LearningPathEnrollmentFactory(user=user, learning_path=learning_paths[3])
+        return learning_paths
+
+    @pytest.mark.parametrize(
+        "url_name, args",
+        [("learning-path-list", []), ("learning-path-detail", [1]), ("learning-path-as-program-list", [])],
+    )
+    @pytest.mark.parametrize("catalog_cache_timeout", [0, 300])
+    @pytest.mark.parametrize("page_size", [None, 2])
+    def test_same_response(  # pylint: disable=too-many-positional-arguments
+        self, settings, authenticated_client, learning_paths, url_name, args, catalog_cache_timeout, page_size
+    ):
+        """Test that the responses are identical to the ones of the DRF serializers."""
+        settings.LEARNING_PATHS_CATALOG_CACHE_TIMEOUT = catalog_cache_timeout
+        url = reverse(url_name, args=[learning_paths[index].key for index in args])
+
+        with patch.object(PageNumberPagination, "page_size", page_size):
+            settings.LEARNING_PATHS_FAST_SERIALIZATION = False
+            expected = authenticated_client.get(url, {"page": 2} if page_size else {})
+            settings.LEARNING_PATHS_FAST_SERIALIZATION = True
+            response = authenticated_client.get(url, {"page": 2} if page_size else {})
+
+        assert response.status_code == expected.status_code == status.HTTP_200_OK
+        assert response.content == expected.content
+
+    @pytest.mark.parametrize(
+        "key, detail",
+        [
+            ("invalid-key-format", "Invalid learning path key format."),
+            ("path-v1:this+does+not+exist", "No LearningPath matches the given query."),
+        ],
+    )
+    def test_retrieve_not_found(self, authenticated_client, key, detail):
+        """Test that the detail API returns the same 404 responses as with the DRF serializers."""
+        response = authenticated_client.get(reverse("learning-path-detail", args=[key]))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.data["detail"] == detail
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("mock_course_dates")
+class TestLearningPathViewSetSparseFieldsets:
+    """Tests for the `fields` and `expand` query params of the learning path list and detail APIs."""
+
+    @pytest.fixture(autouse=True, params=[True, False], ids=["fast", "drf"])
+    def fast_serialization(self, request, settings):
+        """Run the tests with the lightweight and the DRF serializers."""
+        settings.LEARNING_PATHS_FAST_SERIALIZATION = request.param
+
+    @pytest.fixture
+    def learning_paths(self, user):
+        """Create learning paths with steps and skills, one of which the user is enrolled in."""
+        learning_paths = LearningPathFactory.create_batch(3, invite_only=False)
+        for learning_path in learning_paths:
+            LearningPathStepFactory(learning_path=learning_path, course_key=f"course-v1:edX+{learning_path.pk}+Run")
+            RequiredSkillFactory(learning_path=learning_path)
+            AcquiredSkillFactory(learning_path=learning_path)
+        LearningPathEnrollmentFactory(user=user, learning_path=learning_paths[1])
+        return learning_paths
+
+    def test_list_fields(self, authenticated_client, learning_paths, mock_course_dates, django_assert_num_queries):
+        """Test that the steps and their course dates are not retrieved if they are not requested."""
+        # 2 queries for the ETag validators and 1 for the learning paths.
+        with django_assert_num_queries(3):
+            response = authenticated_client.get(
+                reverse("learning-path-list"), {"fields": "enrollment_date,key,display_name"}
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [list(item) for item in response.data] == [["key", "display_name", "enrollment_date"]] * 3
+        assert response.data[0]["key"] == str(learning_paths[1].key)
+        assert response.data[0]["enrollment_date"] is not None
+        mock_course_dates.assert_not_called()
+
+    def test_list_expand(self, authenticated_client, learning_paths, mock_course_dates):
+        """Test that the nested relations are omitted if they are not expanded."""
+        response = authenticated_client.get(reverse("learning-path-list"), {"expand": ""})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "steps" not in response.data[0]
+        assert "required_completion" in response.data[0]
+        mock_course_dates.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "params, expected_fields",
+        [
+            ({"fields": "key,steps"}, ["key", "steps"]),
+            ({"fields": "key,steps", "expand": "required_skills"}, ["key"]),
+            (
+                {"fields": "key,required_skills,acquired_skills", "expand": "acquired_skills"},
+                ["key", "acquired_skills"],
+            ),
+        ],
+    )
+    def test_detail_fields(self, authenticated_client, learning_paths, params, expected_fields):
+        """Test that the detail API returns only the requested fields."""
+        response = authenticated_client.get(reverse("learning-path-detail", args=[learning_paths[0].key]), params)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert list(response.data) == expected_fields
+
+    def test_detail_without_related_data(self, authenticated_client, learning_paths, django_assert_num_queries):
+        """Test that the detail API does not retrieve the related data that is not requested."""
+        url = reverse("learning-path-detail", args=[learning_paths[0].key])
+
+        # 2 queries for the ETag validators and 1 for the learning path.
+        with django_assert_num_queries(3):
+            response = authenticated_client.get(url, {"fields": "key,display_name,description"})
+
+        assert response.data["key"] == str(learning_paths[0].key)
+
+    @pytest.mark.parametrize(
+        "url_name, params",
+        [
+            ("learning-path-list", {"fields": "key,description"}),
+            ("learning-path-list", {"expand": "required_skills"}),
+            ("learning-path-detail", {"fields": "key,unknown"}),
+            ("learning-path-detail", {"expand": "display_name"}),
+        ],
+    )
+    def test_unknown_fields(self, authenticated_client, learning_paths, url_name, params):
+        """Test that unknown fields return 400."""
+        args = [learning_paths[0].key] if url_name == "learning-path-detail" else []
+
+        response = authenticated_client.get(reverse(url_name, args=args), params)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"].startswith("Unknown")
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("mock_course_dates")
+class TestQueryBudgets:
+    """Tests for the number of queries of the learning path APIs, which must not depend on the number of objects."""
+
+    @pytest.fixture(params=[1, 4], ids=["one_path", "many_paths"])
+    def learning_paths(self, request, user):
+        """Create learning paths with several steps and skills each."""
+        learning_paths = LearningPathFactory.create_batch(request.param, invite_only=False)
+        for learning_path in learning_paths:
+            for order in range(1, 4):
+                LearningPathStepFactory(
+                    learning_path=learning_path, order=order, course_key=f"course-v1:edX+{learning_path.pk}+{order}"
+                )
+            RequiredSkillFactory.create_batch(2, learning_path=learning_path)
+            AcquiredSkillFactory.create_batch(2, learning_path=learning_path)
+            LearningPathEnrollmentFactory(user=user, learning_path=learning_path)
+        return learning_paths
+
+    # All requests run 2 queries for the ETag validators.
+    @pytest.mark.parametrize(
+        "url_name, catalog_cache_timeout, fast_serialization, budget",
+        [
+            # The enrollments and the cached catalog.
+            ("learning-path-list", 300, True, 3),
+            ("learning-path-list", 300, False, 3),
+            # The learning paths (with their enrollments and grading criteria) and their steps.
+            ("learning-path-list", 0, True, 4),
+            ("learning-path-list", 0, False, 4),
+            # The learning path (with its enrollment and grading criteria), its steps, and its skills.
+            ("learning-path-detail", 300, True, 6),
+            ("learning-path-detail", 300, False, 6),
+            # The learning paths and their steps.
+            ("learning-path-as-program-list", 300, True, 4),
+            ("learning-path-as-program-list", 300, False, 4),
+        ],
+    )
+    def test_query_budget(  # pylint: disable=too-many-positional-arguments
+        self,
+        settings,
+        authenticated_client,
+        learning_paths,
+        django_assert_num_queries,
+        url_name,
+        catalog_cache_timeout,
+        fast_serialization,
+        budget,
+    ):
+        """Test that each action runs a fixed number of queries."""
+        settings.LEARNING_PATHS_CATALOG_CACHE_TIMEOUT = catalog_cache_timeout
+        settings.LEARNING_PATHS_FAST_SERIALIZATION = fast_serialization
+        url = reverse(url_name, args=[learning_paths[0].key] if url_name == "learning-path-detail" else [])
+        # Warm up the cached catalog and course dates.
+        authenticated_client.get(url)
+
+        with django_assert_num_queries(budget):
+            response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("mock_course_dates")
+class TestConditionalRequests:
+    """Tests for the ETag support of the learning path list, detail, and programs endpoints."""
+
+    @pytest.fixture(params=["learning-path-list", "learning-path-detail", "learning-path-as-program-list"])
+    def url(self, request, learning_path_with_steps):
+        if request.param == "learning-path-detail":
+            return reverse(request.param, args=[learning_path_with_steps.key])
+        return reverse(request.param)
+
+    def test_not_modified(self, authenticated_client, url, mock_course_dates):
+        """Test that a request with the current ETag returns 304 without serializing the learning paths."""
+        etag = authenticated_client.get(url)["ETag"]
+        mock_course_dates.reset_mock()
+
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+        mock_course_dates.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            "path",
+            "path_without_signals",
+            "step",
+            "step_without_signals",
+            "skill",
+            "skill_name",
+            "acquired_skill",
+            "grading_criteria",
+            "enrollment",
+        ],
+    )
+    def test_changes_update_etag(  # pylint: disable=too-many-positional-arguments
+        self, authenticated_client, user, url, learning_path_with_steps, change
+    ):
+        """Test that changing any of the data included in the response changes the ETag."""
+        etag = authenticated_client.get(url)["ETag"]
+        learning_path = learning_path_with_steps
+        if change == "path":
+            learning_path.display_name = "Updated"
+            learning_path.save()
+        elif change == "path_without_signals":
+            LearningPath.objects.filter(pk=learning_path.pk).update(modified=datetime(2100, 1, 1, tzinfo=timezone.utc))
+        elif change == "step":
+            learning_path.steps.first().delete()
+        elif change == "step_without_signals":
+            LearningPathStep.objects.bulk_create(
+                [LearningPathStep(learning_path=learning_path, course_key="course-v1:edX+New+Run", order=99)]
+            )
+        elif change == "skill":
+            skill = learning_path.requiredskill_set.first()
+            skill.level = skill.level % 5 + 1
+            skill.save()
+        elif change == "skill_name":
+            skill = learning_path.requiredskill_set.first().skill
+            skill.display_name = "Updated"
+            skill.save()
+        elif change == "acquired_skill":
+            AcquiredSkillFactory(learning_path=learning_path)
+        elif change == "grading_criteria":
+            learning_path.grading_criteria.required_grade = 0.5
+            learning_path.grading_criteria.save()
+        else:
+            LearningPathEnrollmentFactory(user=user, learning_path=learning_path)
+
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+
+    def test_etag_depends_on_user(self, authenticated_client, staff_user, url):
+        """Test that different users do not share ETags."""
+        staff_client = APIClient()
+        staff_client.force_authenticate(user=staff_user)
+
+        assert authenticated_client.get(url)["ETag"] != staff_client.get(url)["ETag"]
+
+
 @pytest.mark.django_db
 class TestLearningPathEnrollment:
     @pytest.fixture
@@ -576,6 +1423,91 @@ class TestListEnrollmentsView:
         assert len(response.data) == 0
 
 
+@pytest.mark.django_db
+@pytest.mark.usefixtures("mock_course_dates")
+class TestCursorPagination:
+    """Tests for the opt-in cursor pagination of the learning paths, programs, and enrollments APIs."""
+
+    @pytest.fixture
+    def learning_paths(self, staff_user):
+        """Create learning paths with enrollments, some of which belong to the staff user."""
+        learning_paths = LearningPathFactory.create_batch(5)
+        for learning_path in learning_paths:
+            LearningPathStepFactory(learning_path=learning_path)
+            LearningPathEnrollmentFactory(learning_path=learning_path)
+        LearningPathEnrollmentFactory(user=staff_user, learning_path=learning_paths[3])
+        return learning_paths
+
+    def _walk_pages(self, client, url: str, params: dict) -> list[dict]:
+        """Get the results of all pages, and check that they are retrieved without counting or skipping results."""
+        results = []
+        url = f"{url}?{urlencode(params)}"
+        while url:
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            assert len(response.data["results"]) <= params["page_size"]
+            assert not any(
+                PAGINATION_COUNT_QUERY.search(query["sql"]) or "OFFSET" in query["sql"]
+                for query in queries.captured_queries
+            )
+            results += response.data["results"]
+            url = response.data["next"]
+        return results
+
+    @pytest.mark.parametrize("fast_serialization", [True, False])
+    @pytest.mark.parametrize("catalog_cache_timeout", [0, 300])
+    def test_learning_paths(  # pylint: disable=too-many-positional-arguments
+        self, settings, staff_client, learning_paths, fast_serialization, catalog_cache_timeout
+    ):
+        """Test that all learning paths are listed in the order of their IDs."""
+        settings.LEARNING_PATHS_FAST_SERIALIZATION = fast_serialization
+        settings.LEARNING_PATHS_CATALOG_CACHE_TIMEOUT = catalog_cache_timeout
+
+        results = self._walk_pages(
+            staff_client, reverse("learning-path-list"), {"pagination": "cursor", "page_size": 2}
+        )
+
+        assert [item["key"] for item in results] == [str(learning_path.key) for learning_path in learning_paths]
+        assert results[3]["enrollment_date"] is not None
+
+    @pytest.mark.parametrize("fast_serialization", [True, False])
+    def test_programs(self, settings, staff_client, learning_paths, fast_serialization):
+        """Test that all programs are listed in the order of their IDs."""
+        settings.LEARNING_PATHS_FAST_SERIALIZATION = fast_serialization
+
+        results = self._walk_pages(
+            staff_client, reverse("learning-path-as-program-list"), {"pagination": "cursor", "page_size": 2}
+        )
+
+        assert [item["uuid"] for item in results] == [str(learning_path.uuid) for learning_path in learning_paths]
+
+    def test_enrollments(self, staff_client, learning_paths):
+        """Test that all enrollments are listed in the order of their IDs."""
+        results = self._walk_pages(
+            staff_client, "/api/learning_paths/v1/enrollments/", {"pagination": "cursor", "page_size": 4}
+        )
+
+        assert [item["learning_path"] for item in results] == list(
+            LearningPathEnrollment.objects.order_by("id").values_list("learning_path_id", flat=True)
+        )
+
+    def test_default_page_size(self, settings, staff_client, learning_paths):
+        """Test that the default and the maximum page sizes are applied."""
+        settings.LEARNING_PATHS_CURSOR_PAGE_SIZE = 2
+        settings.LEARNING_PATHS_CURSOR_MAX_PAGE_SIZE = 3
+        url = reverse("learning-path-list")
+
+        assert len(staff_client.get(url, {"pagination": "cursor"}).data["results"]) == 2
+        assert len(staff_client.get(url, {"pagination": "cursor", "page_size": 100}).data["results"]) == 3
+
+    def test_not_paginated_by_default(self, staff_client, learning_paths):
+        """Test that the enrollments are not paginated without opting in to the cursor pagination."""
+        response = staff_client.get("/api/learning_paths/v1/enrollments/")
+
+        assert len(response.data) == 6
+
+
 @pytest.mark.django_db
 class TestBulkEnrollAPI:
     @pytest.fixture
@@ -830,6 +1762,264 @@ class TestBulkEnrollAPI:
             assert response.data["enrollments_unenrolled"] == 0
 
 
+@pytest.mark.django_db
+class TestBulkEnrollDryRunAPI:
+    """Tests for the `dry_run` mode of the bulk enrollment API."""
+
+    bulk_enroll_url = "/api/learning_paths/v1/enrollments/bulk-enroll/"
+
+    def test_enroll_dry_run(self, staff_client, learning_path):
+        """Test that a dry run returns the counters of the enrollment without enrolling anyone."""
+        user = UserFactory()
+        payload = {
+            "learning_paths": str(learning_path.key),
+            "emails": f"{user.email},new_user@example.com,invalid",
+            "dry_run": True,
+        }
+
+        response = staff_client.post(self.bulk_enroll_url, payload, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "enrollments_created": 1,
+            "enrollment_allowed_created": 1,
+            "newly_enrolled": 1,
+            "reactivated": 0,
+            "already_enrolled": 0,
+            "made_allowed": 1,
+            "invalid": 1,
+        }
+        assert not LearningPathEnrollment.objects.exists()
+        assert not LearningPathEnrollmentAllowed.objects.exists()
+        assert not LearningPathEnrollmentAudit.objects.exists()
+
+    def test_unenroll_dry_run(self, staff_client, active_enrollment):
+        """Test that a dry run returns the counters of the unenrollment without unenrolling anyone."""
+        query = urlencode({"learning_paths": str(active_enrollment.learning_path.key), "dry_run": "true"})
+
+        response = staff_client.delete(
+            f"{self.bulk_enroll_url}?{query}",
+            json.dumps([active_enrollment.user.email]),
+            content_type="application/json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "enrollments_unenrolled": 1,
+            "enrollment_allowed_deactivated": 0,
+            "already_unenrolled": 0,
+            "invalid": 0,
+        }
+        active_enrollment.refresh_from_db()
+        assert active_enrollment.is_active
+
+
+@pytest.mark.django_db
+class TestBulkEnrollmentJobAPI:
+    """Tests for the asynchronous bulk enrollment jobs."""
+
+    bulk_enroll_url = "/api/learning_paths/v1/enrollments/bulk-enroll/"
+
+    def test_enroll_job(self, staff_client, staff_user, django_capture_on_commit_callbacks):
+        """Test that an asynchronous enrollment returns a job whose status has the counters and per-row errors."""
+        learning_path = LearningPathFactory()
+        user = UserFactory()
+        payload = {
+            "learning_paths": str(learning_path.key),
+            "emails": f"{user.email},invalid,new_user@example.com",
+            "reason": "TestReason",
+            "async": True,
+        }
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = staff_client.post(self.bulk_enroll_url, payload, format="json")
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        job = BulkEnrollmentJob.objects.get(uuid=response.data["job_id"])
+        assert response.data["status_url"] == f"http://testserver{self.bulk_enroll_url}jobs/{job.uuid}/"
+        assert response["Location"] == response.data["status_url"]
+        assert LearningPathEnrollment.objects.get(user=user, learning_path=learning_path).is_active
+        audit = LearningPathEnrollmentAudit.objects.get(enrollment__user=user)
+        assert (audit.enrolled_by, audit.reason) == (staff_user, "TestReason")
+
+        response = staff_client.get(response.data["status_url"])
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["action"] == BulkEnrollmentJob.ENROLL
+        assert response.data["status"] == BulkEnrollmentJob.COMPLETED
+        assert response.data["total"] == response.data["processed"] == 3
+        assert response.data["counts"] == {"enrollments_created": 1, "enrollment_allowed_created": 1}
+        assert response.data["errors"] == [{"row": 1, "email": "invalid", "error": "Invalid email address."}]
+
+    def test_unenroll_job(self, staff_client, django_capture_on_commit_callbacks):
+        """Test that an asynchronous unenrollment deactivates the enrollments."""
+        enrollment = LearningPathEnrollmentFactory()
+        payload = {
+            "learning_paths": str(enrollment.learning_path.key),
+            "emails": enrollment.user.email,
+            "async": "true",
+        }
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = staff_client.delete(self.bulk_enroll_url, payload)
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        enrollment.refresh_from_db()
+        assert not enrollment.is_active
+        job = BulkEnrollmentJob.objects.get(uuid=response.data["job_id"])
+        assert job.action == BulkEnrollmentJob.UNENROLL
+        assert job.counts == {"enrollments_unenrolled": 1, "enrollment_allowed_deactivated": 0}
+
+    def test_job_is_scheduled_after_commit(self, staff_client, django_capture_on_commit_callbacks):
+        """Test that the job is created as pending and processed only after the request is committed."""
+        learning_path = LearningPathFactory()
+        payload = {"learning_paths": str(learning_path.key), "emails": "new_user@example.com", "async": True}
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            response = staff_client.post(self.bulk_enroll_url, payload, format="json")
+
+        assert response.data["status"] == BulkEnrollmentJob.PENDING
+        assert len(callbacks) == 1
+        assert not LearningPathEnrollmentAllowed.objects.exists()
+
+    def test_job_status_does_not_load_emails(self, staff_client):
+        """Test that the status of a job is read with a single query, without its emails."""
+        job = BulkEnrollmentJob.objects.create(
+            action=BulkEnrollmentJob.ENROLL, emails=["a@example.com", "b@example.com"], total=2
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            response = staff_client.get(f"{self.bulk_enroll_url}jobs/{job.uuid}/")
+
+        assert response.data["total"] == 2
+        assert len(queries) == 1
+        assert "emails" not in queries[0]["sql"]
+
+    def test_job_status_permissions(self, api_client, user, staff_user):
+        """Test that only staff users can retrieve the status of existing jobs."""
+        job = BulkEnrollmentJob.objects.create(action=BulkEnrollmentJob.ENROLL)
+        url = f"{self.bulk_enroll_url}jobs/{job.uuid}/"
+
+        api_client.force_authenticate(user=user)
+        assert api_client.get(url).status_code == status.HTTP_403_FORBIDDEN
+        api_client.force_authenticate(user=staff_user)
+        assert api_client.get(url).status_code == status.HTTP_200_OK
+        assert api_client.get(f"{self.bulk_enroll_url}jobs/{uuid4()}/").status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestBulkEnrollStreamingAPI:
+    """Tests for the bulk enrollment API with the emails streamed as JSON array or CSV rows."""
+
+    bulk_enroll_url = "/api/learning_paths/v1/enrollments/bulk-enroll/"
+
+    @staticmethod
+    def read_csv_report(response) -> list[dict]:
+        """Read the rows of a streamed CSV report."""
+        content = b"".join(response.streaming_content).decode()
+        return list(csv.DictReader(content.splitlines()))
+
+    def test_enroll_json_array(self, staff_client, staff_user, settings):
+        """Test that the emails of a JSON array body are enrolled in chunks, with a streamed report of each row."""
+        settings.LEARNING_PATHS_BULK_ENROLLMENT_CHUNK_SIZE = 2
+        learning_path = LearningPathFactory()
+        user = UserFactory()
+        query = urlencode({"learning_paths": str(learning_path.key), "reason": "TestReason"})
+        body = [user.email, {"email": "new_user@example.com"}, "invalid"]
+
+        response = staff_client.post(
+            f"{self.bulk_enroll_url}?{query}", json.dumps(body), content_type="application/json"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/csv"
+        assert self.read_csv_report(response) == [
+            {"row": "0", "email": user.email, "result": "enrolled", "error": ""},
+            {"row": "1", "email": "new_user@example.com", "result": "allowed", "error": ""},
+            {"row": "2", "email": "invalid", "result": "invalid", "error": "Invalid email address."},
+        ]
+        assert LearningPathEnrollment.objects.filter(user=user, learning_path=learning_path, is_active=True).exists()
+        assert LearningPathEnrollmentAllowed.objects.filter(email="new_user@example.com").exists()
+        assert set(LearningPathEnrollmentAudit.objects.values_list("enrolled_by", "reason")) == {
+            (staff_user.id, "TestReason")
+        }
+
+    def test_unenroll_csv_body(self, staff_client):
+        """Test that the emails of a CSV body are unenrolled, with a streamed NDJSON report."""
+        enrollment = LearningPathEnrollmentFactory()
+        query = urlencode({"learning_paths": str(enrollment.learning_path.key), "report_format": "ndjson"})
+        body = f"name,email\nUser,{enrollment.user.email}\n"
+
+        response = staff_client.delete(f"{self.bulk_enroll_url}?{query}", body, content_type="text/csv")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        assert rows == [{"row": 0, "email": enrollment.user.email, "result": "unenrolled", "error": ""}]
+        enrollment.refresh_from_db()
+        assert not enrollment.is_active
+
+    def test_enroll_csv_file(self, staff_client):
+        """Test that the emails of an uploaded CSV file are enrolled."""
+        learning_path = LearningPathFactory()
+        csv_file = SimpleUploadedFile("emails.csv", b"email\nnew_user@example.com\n", content_type="text/csv")
+
+        response = staff_client.post(
+            self.bulk_enroll_url, {"file": csv_file, "learning_paths": str(learning_path.key)}, format="multipart"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [row["result"] for row in self.read_csv_report(response)] == ["allowed"]
+        assert LearningPathEnrollmentAllowed.objects.filter(email="new_user@example.com").exists()
+
+    def test_csv_without_email_column(self, staff_client):
+        """Test that a CSV body without an email column is rejected."""
+        response = staff_client.post(self.bulk_enroll_url, "name\nUser\n", content_type="text/csv")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not LearningPathEnrollmentAudit.objects.exists()
+
+    def test_invalid_report_format(self, staff_client):
+        """Test that an unknown report format is rejected."""
+        response = staff_client.post(
+            f"{self.bulk_enroll_url}?report_format=xml", json.dumps([]), content_type="application/json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_malformed_json_array(self, staff_client, settings):
+        """Test that the rows before a malformed part of the body are processed, and the report ends with an error."""
+        settings.LEARNING_PATHS_BULK_ENROLLMENT_CHUNK_SIZE = 1
+        learning_path = LearningPathFactory()
+        body = '["new_user@example.com", {"email": '
+
+        response = staff_client.post(
+            f"{self.bulk_enroll_url}?{urlencode({'learning_paths': str(learning_path.key)})}",
+            body,
+            content_type="application/json",
+        )
+
+        rows = self.read_csv_report(response)
+        assert [row["result"] for row in rows] == ["allowed", "error"]
+        assert rows[1]["error"].startswith("JSON parse error")
+        assert LearningPathEnrollmentAllowed.objects.filter(email="new_user@example.com").exists()
+
+    def test_async_json_array(self, staff_client, django_capture_on_commit_callbacks):
+        """Test that the emails of a JSON array body can be processed as a job."""
+        learning_path = LearningPathFactory()
+        query = urlencode({"learning_paths": str(learning_path.key), "async": "true"})
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = staff_client.post(
+                f"{self.bulk_enroll_url}?{query}", json.dumps(["new_user@example.com"]), content_type="application/json"
+            )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        job = BulkEnrollmentJob.objects.get(uuid=response.data["job_id"])
+        assert job.emails == ["new_user@example.com"]
+        assert job.status == BulkEnrollmentJob.COMPLETED
+
+
 @pytest.mark.django_db
 class TestLearningPathCourseEnrollment:
     @pytest.fixture
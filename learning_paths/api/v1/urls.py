@@ -4,14 +4,18 @@ from django.urls import path, re_path
 from rest_framework import routers
 
 from learning_paths.api.v1.views import (
+    BulkEnrollmentJobView,
     BulkEnrollView,
     LearningPathAsProgramViewSet,
     LearningPathCourseEnrollmentView,
     LearningPathEnrollmentView,
+    LearningPathProgressReportView,
     LearningPathUserGradeView,
+    LearningPathUserProgressAndGradeView,
     LearningPathUserProgressView,
     LearningPathViewSet,
     ListEnrollmentsView,
+    UserLearningPathsProgressView,
 )
 from learning_paths.keys import COURSE_KEY_URL_PATTERN, LEARNING_PATH_URL_PATTERN
 
@@ -30,11 +34,26 @@ urlpatterns = router.urls + [
         LearningPathUserGradeView.as_view(),
         name="learning-path-grade",
     ),
+    re_path(
+        rf"{LEARNING_PATH_URL_PATTERN}/progress-and-grade/",
+        LearningPathUserProgressAndGradeView.as_view(),
+        name="learning-path-progress-and-grade",
+    ),
+    re_path(
+        rf"{LEARNING_PATH_URL_PATTERN}/progress-report/",
+        LearningPathProgressReportView.as_view(),
+        name="learning-path-progress-report",
+    ),
     re_path(
         rf"{LEARNING_PATH_URL_PATTERN}/enrollments/$",
         LearningPathEnrollmentView.as_view(),
         name="learning-path-enrollments",
     ),
+    path(
+        "me/progress/",
+        UserLearningPathsProgressView.as_view(),
+        name="user-learning-paths-progress",
+    ),
     path(
         "enrollments/",
         ListEnrollmentsView.as_view(),
@@ -45,6 +64,11 @@ urlpatterns = router.urls + [
         BulkEnrollView.as_view(),
         name="bulk-enroll",
     ),
+    path(
+        "enrollments/bulk-enroll/jobs/<uuid:job_id>/",
+        BulkEnrollmentJobView.as_view(),
+        name="bulk-enrollment-job",
+    ),
     re_path(
         rf"{LEARNING_PATH_URL_PATTERN}/enrollments/{COURSE_KEY_URL_PATTERN}/",
         LearningPathCourseEnrollmentView.as_view(),
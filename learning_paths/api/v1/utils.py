@@ -2,15 +2,76 @@
 Util methods for LearningPath
 """
 
-from typing import Any
+import hashlib
+import logging
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Any, NamedTuple
 
+from django.apps import apps
 from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import DatabaseError
+from django.db.models import Count, Max
 from opaque_keys.edx.keys import CourseKey
-from requests.exceptions import HTTPError
+from requests.exceptions import HTTPError, RequestException
 from rest_framework.exceptions import APIException
 
-from ...compat import get_catalog_api_client
-from ...models import LearningPathStep
+from ...cache import (
+    get_cached_course_dates,
+    get_cached_grade,
+    get_cached_progress,
+    get_catalog_version,
+    get_course_dates_versions,
+    get_grade_cache_key,
+    get_last_known_values,
+    get_progress_cache_key,
+    set_cached_course_dates,
+    set_cached_grade,
+    set_cached_progress,
+    set_last_known_values,
+)
+from ...circuit_breaker import completion_circuit_breaker
+from ...compat import get_course_dates_many, get_user_course_completions
+from ...grades import AggregateGrade, get_course_grades
+from ...models import LearningPath, LearningPathEnrollment, LearningPathProgress
+from .client import CompletionClient
+
+log = logging.getLogger(__name__)
+
+COMPLETION_BACKEND_NATIVE = "native"
+COMPLETION_BACKEND_HTTP = "http"
+COMPLETION_BACKEND_HTTP_BATCHED = "http_batched"
+
+
+class AggregateProgress(NamedTuple):
+    """
+    Aggregate progress of a user in a learning path.
+
+    `incomplete` is True when some course completions could not be fetched before the deadline.
+    In that case, the missing courses are counted as 0.0, so `progress` is a lower bound.
+    `stale` is True when some course completions are the last known values, because the completion
+    backend was unavailable.
+    """
+
+    progress: float
+    incomplete: bool = False
+    stale: bool = False
+
+
+class CourseCompletions(NamedTuple):
+    """
+    Course completions of a user.
+
+    `incomplete` is True when some courses are missing from `completions`.
+    `stale` is True when some completions are the last known values instead of the current ones.
+    """
+
+    completions: dict[CourseKey, float]
+    incomplete: bool = False
+    stale: bool = False
 
 
 def get_course_completion(username: str, course_key: CourseKey, client: Any) -> float:
@@ -36,26 +97,313 @@ def get_course_completion(username: str, course_key: CourseKey, client: Any) ->
     return 0.0
 
 
-def get_aggregate_progress(user, learning_path):
+def get_course_completions(
+    username: str, course_keys: list[CourseKey], client: Any
+) -> tuple[dict[CourseKey, float], bool]:
+    """
+    Fetch the completion percentages of multiple courses concurrently.
+
+    The requests run on a pool of at most `LEARNING_PATHS_COMPLETION_MAX_WORKERS` threads, and all of them
+    share a single deadline of `LEARNING_PATHS_COMPLETION_TIMEOUT` seconds.
+
+    Returns a tuple of the completions of the courses fetched before the deadline and a boolean indicating
+    whether any course is missing from the results.
+    """
+    if not course_keys:
+        return {}, False
+
+    max_workers = max(1, min(settings.LEARNING_PATHS_COMPLETION_MAX_WORKERS, len(course_keys)))
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="learning_paths_completion")
+    try:
+        futures = {
+            executor.submit(get_course_completion, username, course_key, client): course_key
+            for course_key in course_keys
+        }
+        done, not_done = wait(futures, timeout=settings.LEARNING_PATHS_COMPLETION_TIMEOUT)
+    finally:
+        # Do not block the request on the requests that have not finished before the deadline.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if not_done:
+        log.warning(
+            "Fetching completion for user %s timed out for courses: %s",
+            username,
+            ", ".join(str(futures[future]) for future in not_done),
+        )
+
+    # Calling `result` re-raises the exceptions from the worker threads.
+    return {futures[future]: future.result() for future in done}, bool(not_done)
+
+
+def get_course_completions_batched(username: str, course_keys: list[CourseKey], client: Any) -> dict[CourseKey, float]:
+    """
+    Fetch the completion percentages of multiple courses via the completion list API.
+
+    The list API returns the completions of all courses the user is enrolled in, in pages of
+    `LEARNING_PATHS_COMPLETION_BATCH_SIZE` courses. The pages are fetched until all requested courses are found.
+    Courses missing from the response (e.g., because the user is not enrolled in them) are treated as 0.0.
+    """
+    completions = dict.fromkeys(course_keys, 0.0)
+    remaining_course_keys = set(course_keys)
+    lms_base_url = settings.LMS_ROOT_URL
+    page_size = settings.LEARNING_PATHS_COMPLETION_BATCH_SIZE
+    completion_url = f"{lms_base_url}/completion-aggregator/v1/course/?username={username}&page_size={page_size}"
+
+    while completion_url and remaining_course_keys:
+        try:
+            response = client.get(completion_url)
+            response.raise_for_status()
+            data = response.json()
+        except HTTPError as err:
+            if err.response.status_code == 404:
+                break
+            raise APIException(f"Error fetching completions for user {username}: {err}") from err
+
+        for result in data.get("results", []):
+            course_key = CourseKey.from_string(result["course_key"])
+            if course_key in remaining_course_keys:
+                completions[course_key] = result["completion"]["percent"]
+                remaining_course_keys.remove(course_key)
+
+        completion_url = data.get("pagination", {}).get("next")
+
+    return completions
+
+
+def get_completion_backend() -> str:
+    """
+    Return the backend used for fetching the course completions.
+
+    The native backend reads the completions directly from the completion aggregator models. It falls back to the
+    HTTP API when the completion aggregator is not installed in this process.
+    """
+    backend = settings.LEARNING_PATHS_COMPLETION_BACKEND
+    if backend == COMPLETION_BACKEND_NATIVE and not apps.is_installed("completion_aggregator"):
+        return COMPLETION_BACKEND_HTTP
+    return backend
+
+
+def _fetch_course_completions(user, course_keys: list[CourseKey]) -> tuple[dict[CourseKey, float], bool]:
+    """Fetch the completions of a user in the given courses with the configured completion backend."""
+    backend = get_completion_backend()
+    if backend == COMPLETION_BACKEND_NATIVE:
+        return get_user_course_completions(user, course_keys), False
+
+    client = CompletionClient(user)
+    if backend == COMPLETION_BACKEND_HTTP_BATCHED:
+        return get_course_completions_batched(user.username, course_keys, client), False
+    return get_course_completions(user.username, course_keys, client)
+
+
+def fetch_course_completions(user, course_keys: list[CourseKey]) -> CourseCompletions:
+    """
+    Fetch the completions of a user in the given courses with the configured completion backend.
+
+    The completion backend is called through a circuit breaker. Failed calls (including database errors of the
+    native backend) and calls that exceed the `LEARNING_PATHS_COMPLETION_TIMEOUT` deadline count as failures.
+    The completions of a call of the native backend that exceeds the deadline are still used. While the circuit is
+    open, the backend is not called. The courses that could not be fetched use their last known completions instead.
+    """
+    completions, incomplete = {}, True
+    if completion_circuit_breaker.allow_request():
+        deadline = time.monotonic() + settings.LEARNING_PATHS_COMPLETION_TIMEOUT
+        try:
+            completions, incomplete = _fetch_course_completions(user, course_keys)
+        except (APIException, RequestException, DatabaseError):
+            log.exception("Failed to fetch the course completions of user %s.", user.id)
+            completion_circuit_breaker.record_failure()
+        else:
+            if incomplete:
+                completion_circuit_breaker.record_failure()
+            elif time.monotonic() > deadline:
+                log.warning("Fetching the course completions of user %s exceeded the time budget.", user.id)
+                completion_circuit_breaker.record_failure()
+            else:
+                completion_circuit_breaker.record_success()
+            set_last_known_values("completion", user.id, completions)
+
+    if not incomplete:
+        return CourseCompletions(completions)
+
+    missing_course_keys = [course_key for course_key in course_keys if course_key not in completions]
+    last_known_completions = get_last_known_values("completion", user.id, missing_course_keys)
+    completions.update(last_known_completions)
+    return CourseCompletions(
+        completions,
+        incomplete=len(last_known_completions) < len(missing_course_keys),
+        stale=bool(last_known_completions),
+    )
+
+
+def calculate_aggregate_progress(user, learning_path) -> AggregateProgress:
     """
     Calculate the aggregate progress for all courses in the learning path.
     """
-    steps = LearningPathStep.objects.filter(learning_path=learning_path)
+    # Use the prefetched steps if they are available.
+    course_keys = [step.course_key for step in learning_path.steps.all()]
 
-    client = get_catalog_api_client(user)
-    # TODO: Create a native Python API in the completion aggregator
-    # to avoid the overhead of making HTTP requests and improve performance.
+    if not course_keys:
+        return AggregateProgress(0.0)
 
-    total_completion = 0.0
+    completions, incomplete, stale = fetch_course_completions(user, course_keys)
+    return AggregateProgress(sum(completions.values()) / len(course_keys), incomplete, stale)
 
-    for step in steps:
-        course_completion = get_course_completion(user.username, step.course_key, client)
-        total_completion += course_completion
 
-    total_courses = len(steps)
+def get_aggregate_progress(user, learning_path, max_age: int | None = None) -> AggregateProgress:
+    """
+    Get the aggregate progress for all courses in the learning path.
 
-    if total_courses == 0:
-        return 0.0
+    The progress is cached until the steps of the learning path or the course completions of the user change.
+
+    :param max_age: The maximum accepted age (in seconds) of the cached progress.
+    """
+    if not settings.LEARNING_PATHS_PROGRESS_CACHE_TIMEOUT:
+        return calculate_aggregate_progress(user, learning_path)
 
-    aggregate_progress = total_completion / total_courses
+    cache_key = get_progress_cache_key(user.id, learning_path.id)
+    if (progress := get_cached_progress(cache_key, max_age)) is not None:
+        return AggregateProgress(progress)
+
+    aggregate_progress = calculate_aggregate_progress(user, learning_path)
+    # Do not cache partial or stale results.
+    if not (aggregate_progress.incomplete or aggregate_progress.stale):
+        set_cached_progress(cache_key, aggregate_progress.progress)
     return aggregate_progress
+
+
+def get_materialized_progress(user, learning_path) -> LearningPathProgress | None:
+    """
+    Get the materialized progress of a user in the learning path.
+
+    Returns None if the materialized progress is disabled or not available for this enrollment.
+    """
+    if not settings.LEARNING_PATHS_USE_MATERIALIZED_PROGRESS:
+        return None
+
+    return LearningPathProgress.objects.filter(
+        enrollment__user=user,
+        enrollment__learning_path=learning_path,
+        enrollment__is_active=True,
+    ).first()
+
+
+def _has_grading_criteria(learning_path) -> bool:
+    """Check whether a learning path has grading criteria."""
+    try:
+        return learning_path.grading_criteria is not None
+    except ObjectDoesNotExist:
+        return False
+
+
+def get_progress_and_grades(user, learning_paths: list) -> dict[int, tuple[AggregateProgress, AggregateGrade | None]]:
+    """
+    Get the aggregate progress and grade of a user in multiple learning paths.
+
+    The cached values are reused. The remaining course completions and grades are fetched once per
+    distinct course, even if a course is a step of multiple learning paths. The grades are only fetched for
+    learning paths with grading criteria; the grade of other learning paths is None.
+    The steps and grading criteria of the learning paths should be prefetched.
+
+    :returns: A dictionary mapping the learning path IDs to their aggregate progress and grade.
+    """
+    steps = {learning_path.id: list(learning_path.steps.all()) for learning_path in learning_paths}
+    progress_cache_keys, progress = {}, {}
+    grade_cache_keys, grades = {}, {}
+    graded_path_ids = {learning_path.id for learning_path in learning_paths if _has_grading_criteria(learning_path)}
+
+    for learning_path in learning_paths:
+        path_steps = steps[learning_path.id]
+        progress_cache_keys[learning_path.id] = get_progress_cache_key(user.id, learning_path.id)
+        if (cached_progress := get_cached_progress(progress_cache_keys[learning_path.id])) is not None:
+            progress[learning_path.id] = AggregateProgress(cached_progress)
+        if learning_path.id not in graded_path_ids:
+            grades[learning_path.id] = None
+            continue
+        grade_cache_keys[learning_path.id] = get_grade_cache_key(
+            user.id, learning_path.id, [(step.course_key, step.weight) for step in path_steps]
+        )
+        if (cached_grade := get_cached_grade(grade_cache_keys[learning_path.id])) is not None:
+            grades[learning_path.id] = AggregateGrade(cached_grade)
+
+    completion_course_keys = {
+        step.course_key for path_id, path_steps in steps.items() if path_id not in progress for step in path_steps
+    }
+    course_completions = (
+        fetch_course_completions(user, list(completion_course_keys))
+        if completion_course_keys
+        else CourseCompletions({})
+    )
+    grade_course_keys = {
+        step.course_key for path_id, path_steps in steps.items() if path_id not in grades for step in path_steps
+    }
+    course_grades = get_course_grades(user, grade_course_keys)
+
+    for learning_path in learning_paths:
+        path_steps = steps[learning_path.id]
+        if learning_path.id not in progress:
+            path_completions = [course_completions.completions.get(step.course_key) for step in path_steps]
+            path_progress = AggregateProgress(
+                sum(completion or 0.0 for completion in path_completions) / len(path_steps) if path_steps else 0.0,
+                incomplete=None in path_completions,
+                stale=course_completions.stale,
+            )
+            if not (path_progress.incomplete or path_progress.stale):
+                set_cached_progress(progress_cache_keys[learning_path.id], path_progress.progress)
+            progress[learning_path.id] = path_progress
+
+        if learning_path.id not in grades:
+            total_weight = sum(step.weight for step in path_steps)
+            weighted_sum = sum(course_grades.grades[step.course_key] * step.weight for step in path_steps)
+            grade = weighted_sum / total_weight if total_weight > 0 else 0.0
+            grades[learning_path.id] = AggregateGrade(grade, stale=course_grades.stale)
+            if not course_grades.stale:
+                set_cached_grade(grade_cache_keys[learning_path.id], grade)
+
+    return {
+        learning_path.id: (progress[learning_path.id], grades[learning_path.id]) for learning_path in learning_paths
+    }
+
+
+def get_learning_paths_etag(request, *args, **kwargs) -> str:
+    """
+    Return the ETag of the learning path list, detail, and program responses of the current user.
+
+    The ETag is calculated from the catalog version, which is bumped whenever a learning path, its steps, skills,
+    grading criteria, or course dates change, and from the last modification time and the number of the enrollments
+    of the user. Therefore, it changes whenever the response can change, and it costs two queries.
+    The last modification time and the number of the learning paths and their steps are included too, so writes
+    that do not send signals (e.g., `bulk_create` or `loaddata`) and caches that are not shared between processes
+    do not cause stale responses.
+    The path and query string of the request are included, so different pages and learning paths have different ETags.
+    """
+    user = request.user
+    validators = [
+        request.build_absolute_uri(),
+        user.id,
+        user.is_staff,
+        get_catalog_version(),
+        tuple(
+            LearningPath.objects.aggregate(
+                Max("modified"), Count("pk", distinct=True), Max("steps__modified"), Count("steps__pk", distinct=True)
+            ).values()
+        ),
+        tuple(LearningPathEnrollment.objects.filter(user=user).aggregate(Max("modified"), Count("pk")).values()),
+    ]
+    return hashlib.sha256(repr(validators).encode()).hexdigest()
+
+
+def fetch_course_dates(course_keys: Iterable[CourseKey]) -> dict[CourseKey, tuple[datetime | None, datetime | None]]:
+    """
+    Get the start and end dates of multiple courses.
+
+    The dates are cached in this process until their version in the shared cache is bumped (when a course is
+    published in any process). The dates that are not cached are retrieved with a single query.
+    """
+    course_keys = set(course_keys)
+    versions = get_course_dates_versions(course_keys)
+    course_dates = get_cached_course_dates(versions)
+    if missing_course_keys := course_keys - course_dates.keys():
+        fetched_course_dates = get_course_dates_many(list(missing_course_keys))
+        set_cached_course_dates(fetched_course_dates, versions)
+        course_dates.update(fetched_course_dates)
+    return course_dates
@@ -3,56 +3,131 @@ Views for LearningPath.
 """
 
 import logging
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from functools import cached_property
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.exceptions import ObjectDoesNotExist, PermissionDenied, ValidationError
-from django.core.validators import validate_email
-from django.db.models import QuerySet
+from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
+from django.db import transaction
+from django.db.models import Prefetch, QuerySet
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import CourseKey
 from rest_framework import generics, status, viewsets
 from rest_framework.exceptions import NotFound, ParseError
+from rest_framework.fields import BooleanField
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from learning_paths.api.v1.serializers import (
+    BulkEnrollmentJobSerializer,
     LearningPathAsProgramSerializer,
     LearningPathDetailSerializer,
     LearningPathEnrollmentSerializer,
     LearningPathGradeSerializer,
     LearningPathListSerializer,
+    LearningPathProgressAndGradeSerializer,
     LearningPathProgressSerializer,
 )
+from learning_paths.bulk_enrollment import (
+    BULK_OPERATION_REPORT_FIELDS,
+    bulk_enroll,
+    bulk_unenroll,
+    get_bulk_enroll_diff,
+    get_bulk_unenroll_diff,
+    iter_bulk_operation_report,
+)
+from learning_paths.cache import (
+    get_cached_catalog,
+    get_catalog_cache_key,
+    set_cached_catalog,
+)
 from learning_paths.compat import enroll_user_in_course
+from learning_paths.grades import AggregateGrade
 from learning_paths.keys import LearningPathKey
 from learning_paths.models import (
+    AcquiredSkill,
+    BulkEnrollmentJob,
     LearningPath,
     LearningPathEnrollment,
-    LearningPathEnrollmentAllowed,
-    LearningPathEnrollmentAudit,
+    RequiredSkill,
+)
+from learning_paths.reports import (
+    REPORT_CONTENT_TYPES,
+    REPORT_FORMAT_CSV,
+    REPORT_FORMATS,
+    iter_progress_report,
+    render_report,
 )
+from learning_paths.tasks import process_bulk_enrollment_job
 
+from .fast_serializers import (
+    get_learning_path_values,
+    get_program_values,
+    serialize_learning_paths,
+    serialize_learning_paths_as_programs,
+)
 from .filters import AdminOrSelfFilterBackend
+from .pagination import OptInCursorPaginationMixin
+from .parsers import CSVParser, EmailRows, StreamingJSONParser, parse_csv_emails
 from .permissions import IsAdminOrSelf
-from .utils import get_aggregate_progress
+from .utils import (
+    AggregateProgress,
+    fetch_course_dates,
+    get_aggregate_progress,
+    get_learning_paths_etag,
+    get_materialized_progress,
+    get_progress_and_grades,
+)
 
 logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
 
-class LearningPathAsProgramViewSet(viewsets.ReadOnlyModelViewSet):
+def _parse_field_list(param: str, value: str | None, available_fields: Sequence[str]) -> set[str]:
+    """
+    Parse a comma-separated list of fields from a query param.
+
+    :returns: The listed fields, or all available fields if the query param is not provided.
+    :raises ParseError: If the list contains an unknown field.
+    """
+    if value is None:
+        return set(available_fields)
+    fields = {field.strip() for field in value.split(",") if field.strip()}
+    if unknown_fields := fields - set(available_fields):
+        raise ParseError(
+            f"Unknown {param}: {', '.join(sorted(unknown_fields))}. Available {param}: {', '.join(available_fields)}."
+        )
+    return fields
+
+
+def _get_max_age(request: Request) -> int | None:
+    """Parse the `max_age` query parameter of the progress APIs."""
+    if (max_age := request.query_params.get("max_age")) is None:
+        return None
+    if not max_age.isdigit():
+        raise ParseError("max_age must be a non-negative integer.")
+    return int(max_age)
+
+
+class LearningPathAsProgramViewSet(OptInCursorPaginationMixin, viewsets.ReadOnlyModelViewSet):
     """
     This viewset exposes LearningPaths as Programs to be ingested
     by the course-discovery's refresh_course_metadata command.
     URL is: GET <LMS_URL>/api/v1/programs
     The command makes use of the ProgramsApiDataLoader.
     https://github.com/openedx/course-discovery/blob/d6a57fd69479b3d5f5afb682d2668b58503a6af6/course_discovery/apps/course_metadata/data_loaders/api.py#L843
+
+    Use `pagination=cursor` to paginate the programs with a cursor, ordered by ID.
     """
 
     permission_classes = (IsAuthenticated,)
@@ -60,8 +135,20 @@ class LearningPathAsProgramViewSet(viewsets.ReadOnlyModelViewSet):
     pagination_class = PageNumberPagination
 
     def get_queryset(self):
-        """Get the learning paths visible to the current user."""
-        return LearningPath.objects.get_paths_visible_to_user(self.request.user)
+        """Get the learning paths visible to the current user, with their steps."""
+        return LearningPath.objects.get_paths_visible_to_user(self.request.user).prefetch_related("steps")
+
+    @method_decorator(condition(etag_func=get_learning_paths_etag))
+    def list(self, request, *args, **kwargs):
+        """List the programs, or return 304 if they have not changed since the request with the given ETag."""
+        if not settings.LEARNING_PATHS_FAST_SERIALIZATION:
+            return super().list(request, *args, **kwargs)
+
+        learning_paths = get_program_values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(learning_paths)
+        if page is not None:
+            return self.get_paginated_response(serialize_learning_paths_as_programs(page))
+        return Response(serialize_learning_paths_as_programs(learning_paths))
 
 
 class LearningPathUserProgressView(APIView):
@@ -74,13 +161,21 @@ class LearningPathUserProgressView(APIView):
     def get(self, request, learning_path_key_str: str):
         """
         Fetch the learning path progress
+
+        Query params:
+            max_age (optional): The maximum age (in seconds) of the cached progress that the client accepts.
+                Use 0 to always recalculate the progress.
         """
+        max_age = _get_max_age(request)
         learning_path = get_object_or_404(
             LearningPath.objects.get_paths_visible_to_user(self.request.user),
             key=learning_path_key_str,
         )
 
-        progress = get_aggregate_progress(request.user, learning_path)
+        if materialized_progress := get_materialized_progress(request.user, learning_path):
+            aggregate_progress = AggregateProgress(materialized_progress.progress)
+        else:
+            aggregate_progress = get_aggregate_progress(request.user, learning_path, max_age=max_age)
         required_completion = None
         try:
             grading_criteria = learning_path.grading_criteria
@@ -90,8 +185,10 @@ class LearningPathUserProgressView(APIView):
 
         data = {
             "learning_path_key": learning_path_key_str,
-            "progress": progress,
+            "progress": aggregate_progress.progress,
             "required_completion": required_completion,
+            "incomplete": aggregate_progress.incomplete,
+            "stale": aggregate_progress.stale,
         }
 
         serializer = LearningPathProgressSerializer(data=data)
@@ -125,12 +222,16 @@ class LearningPathUserGradeView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        grade = grading_criteria.calculate_grade(request.user)
+        if materialized_progress := get_materialized_progress(request.user, learning_path):
+            aggregate_grade = AggregateGrade(materialized_progress.grade)
+        else:
+            aggregate_grade = grading_criteria.calculate_grade(request.user)
 
         data = {
             "learning_path_key": learning_path_key_str,
-            "grade": grade,
+            "grade": aggregate_grade.grade,
             "required_grade": grading_criteria.required_grade,
+            "stale": aggregate_grade.stale,
         }
 
         serializer = LearningPathGradeSerializer(data=data)
@@ -139,32 +240,345 @@ class LearningPathUserGradeView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class LearningPathViewSet(viewsets.ReadOnlyModelViewSet):
+class LearningPathUserProgressAndGradeView(APIView):
+    """
+    API view to return the aggregate progress and grade of a user in a learning path.
+
+    This returns the same data as the progress and grade APIs combined, but it checks the visibility
+    of the learning path and fetches its steps only once.
+    """
+
+    permission_classes = (IsAuthenticated,)
+
+    def get(self, request, learning_path_key_str: str):
+        """
+        Fetch the learning path progress and grade
+
+        Query params:
+            max_age (optional): The maximum age (in seconds) of the cached progress that the client accepts.
+                Use 0 to always recalculate the progress.
+        """
+        max_age = _get_max_age(request)
+        learning_path = get_object_or_404(
+            LearningPath.objects.get_paths_visible_to_user(self.request.user)
+            .select_related("grading_criteria")
+            .prefetch_related("steps"),
+            key=learning_path_key_str,
+        )
+
+        try:
+            grading_criteria = learning_path.grading_criteria
+        except ObjectDoesNotExist:
+            grading_criteria = None
+
+        aggregate_grade = None
+        if materialized_progress := get_materialized_progress(request.user, learning_path):
+            aggregate_progress = AggregateProgress(materialized_progress.progress)
+            if grading_criteria:
+                aggregate_grade = AggregateGrade(materialized_progress.grade)
+        else:
+            aggregate_progress = get_aggregate_progress(request.user, learning_path, max_age=max_age)
+            if grading_criteria:
+                aggregate_grade = grading_criteria.calculate_grade(request.user)
+
+        data = {
+            "learning_path_key": learning_path_key_str,
+            "progress": aggregate_progress.progress,
+            "required_completion": grading_criteria.required_completion if grading_criteria else None,
+            "incomplete": aggregate_progress.incomplete,
+            "stale": aggregate_progress.stale or bool(aggregate_grade and aggregate_grade.stale),
+            "grade": aggregate_grade.grade if aggregate_grade else None,
+            "required_grade": grading_criteria.required_grade if grading_criteria else None,
+        }
+
+        serializer = LearningPathProgressAndGradeSerializer(data=data)
+        if serializer.is_valid():
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class UserLearningPathsProgressView(APIView):
+    """
+    API view to return the progress and grade of the current user in all learning paths they are enrolled in.
+
+    The course completions and grades are fetched once per distinct course, even if a course
+    is a step of multiple learning paths.
+    """
+
+    permission_classes = (IsAuthenticated,)
+
+    def get(self, request):
+        """
+        Fetch the progress and grade in all learning paths of the current user.
+
+        The learning paths are ordered by the enrollment date (the most recent first).
+        """
+        enrollments = (
+            LearningPathEnrollment.objects.filter(user=request.user, is_active=True)
+            .select_related("learning_path__grading_criteria")
+            .prefetch_related("learning_path__steps")
+            .order_by("-created")
+        )
+        use_materialized_progress = settings.LEARNING_PATHS_USE_MATERIALIZED_PROGRESS
+        if use_materialized_progress:
+            enrollments = enrollments.select_related("progress")
+        enrollments = list(enrollments)
+
+        materialized = {}
+        if use_materialized_progress:
+            for enrollment in enrollments:
+                try:
+                    materialized[enrollment.learning_path_id] = enrollment.progress
+                except ObjectDoesNotExist:
+                    pass
+
+        calculated = get_progress_and_grades(
+            request.user,
+            [enrollment.learning_path for enrollment in enrollments if enrollment.learning_path_id not in materialized],
+        )
+
+        data = []
+        for enrollment in enrollments:
+            learning_path = enrollment.learning_path
+            if row := materialized.get(learning_path.id):
+                aggregate_progress, aggregate_grade = AggregateProgress(row.progress), AggregateGrade(row.grade)
+            else:
+                aggregate_progress, aggregate_grade = calculated[learning_path.id]
+
+            try:
+                grading_criteria = learning_path.grading_criteria
+            except ObjectDoesNotExist:
+                grading_criteria = None
+
+            data.append(
+                {
+                    "learning_path_key": str(learning_path.key),
+                    "progress": aggregate_progress.progress,
+                    "required_completion": grading_criteria.required_completion if grading_criteria else None,
+                    "incomplete": aggregate_progress.incomplete,
+                    "stale": aggregate_progress.stale or bool(aggregate_grade and aggregate_grade.stale),
+                    "grade": aggregate_grade.grade if grading_criteria and aggregate_grade else None,
+                    "required_grade": grading_criteria.required_grade if grading_criteria else None,
+                }
+            )
+
+        return Response(LearningPathProgressAndGradeSerializer(data, many=True).data)
+
+
+class LearningPathProgressReportView(APIView):
+    """
+    API view to stream the progress of all learners enrolled in a Learning Path.
+
+    Only staff users can access this report.
+    """
+
+    permission_classes = (IsAdminUser,)
+
+    def get(self, request, learning_path_key_str: str):
+        """
+        Stream the username, progress, grade, and pass status of each active enrollment.
+
+        The `report_format` query parameter selects the output format: `csv` (default) or `ndjson`.
+        """
+        report_format = request.query_params.get("report_format", REPORT_FORMAT_CSV)
+        if report_format not in REPORT_FORMATS:
+            raise ParseError(f"report_format must be one of: {', '.join(REPORT_FORMATS)}.")
+
+        learning_path = get_object_or_404(LearningPath, key=learning_path_key_str)
+        response = StreamingHttpResponse(
+            render_report(iter_progress_report(learning_path), report_format),
+            content_type=REPORT_CONTENT_TYPES[report_format],
+        )
+        response["Content-Disposition"] = f'attachment; filename="{learning_path.key}-progress.{report_format}"'
+        return response
+
+
+class LearningPathViewSet(OptInCursorPaginationMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for listing all learning paths and retrieving a specific learning path's details,
     including steps and associated skills.
+
+    Query params:
+        fields (optional): Comma-separated list of the returned fields. Defaults to all fields.
+        expand (optional): Comma-separated list of the returned nested relations (`steps`, and `required_skills`
+            and `acquired_skills` in the details). Defaults to all nested relations.
+        pagination (optional): Use `cursor` to paginate the list with a cursor, ordered by ID, instead of page
+            numbers. The `page_size` query param sets the size of the pages.
+
+    The related data (e.g., the steps and their course dates) is retrieved only if it is returned.
     """
 
     permission_classes = (IsAuthenticated,)
     pagination_class = PageNumberPagination
     lookup_field = "key"
+    expandable_fields = ("steps", "required_skills", "acquired_skills")
 
     def get_queryset(self):
         """
-        Get all learning paths and prefetch the related data.
+        Get all learning paths and load the related data needed by the serializer.
+
+        The grading criteria are joined, and the steps and skills (with their `Skill`) are prefetched.
         """
         user = self.request.user
-        queryset = LearningPath.objects.get_paths_visible_to_user(user).prefetch_related(
-            "steps",
-            "grading_criteria",
-        )
+        queryset = LearningPath.objects.get_paths_visible_to_user(user)
+        if self._is_requested("required_completion"):
+            queryset = queryset.select_related("grading_criteria")
+        if self._is_requested("steps"):
+            queryset = queryset.prefetch_related("steps")
+        if self.action != "list":
+            if self._is_requested("required_skills"):
+                queryset = queryset.prefetch_related(
+                    Prefetch("requiredskill_set", queryset=RequiredSkill.objects.select_related("skill"))
+                )
+            if self._is_requested("acquired_skills"):
+                queryset = queryset.prefetch_related(
+                    Prefetch("acquiredskill_set", queryset=AcquiredSkill.objects.select_related("skill"))
+                )
         return queryset
 
+    @cached_property
+    def requested_fields(self) -> list[str] | None:
+        """
+        Get the fields requested with the `fields` and `expand` query params, in the order of the serializer.
+
+        Returns None if all fields are requested.
+        """
+        fields = self.request.query_params.get("fields")
+        expand = self.request.query_params.get("expand")
+        if fields is None and expand is None:
+            return None
+
+        available_fields = self.get_serializer_class().Meta.fields
+        expandable_fields = [field for field in available_fields if field in self.expandable_fields]
+        requested_fields = _parse_field_list("fields", fields, available_fields)
+        expanded_fields = _parse_field_list("expand", expand, expandable_fields)
+        return [
+            field
+            for field in available_fields
+            if field in requested_fields and (field not in expandable_fields or field in expanded_fields)
+        ]
+
+    def _is_requested(self, field: str) -> bool:
+        """Check whether the field is requested."""
+        return self.requested_fields is None or field in self.requested_fields
+
     def get_serializer_class(self):
         if self.action == "list":
             return LearningPathListSerializer
         return LearningPathDetailSerializer
 
+    def get_serializer(self, *args, **kwargs):
+        """
+        Limit the serializer to the requested fields.
+
+        If the steps are requested, prefetch the dates of all courses in the serialized learning paths with a single
+        query.
+        """
+        kwargs.setdefault("fields", self.requested_fields)
+        if args and self._is_requested("steps"):
+            learning_paths = args[0] if kwargs.get("many") else [args[0]]
+            kwargs.setdefault("context", self.get_serializer_context())
+            kwargs["context"]["course_dates"] = fetch_course_dates(
+                step.course_key for learning_path in learning_paths for step in learning_path.steps.all()
+            )
+        return super().get_serializer(*args, **kwargs)
+
+    def _get_catalog(self) -> list[tuple[int, bool, dict]]:
+        """
+        Get the serialized catalog of all learning paths, shared by all users.
+
+        Each entry is a tuple of the learning path ID, its `invite_only` flag, and its serialized data
+        without the enrollment date.
+        """
+        cache_key = get_catalog_cache_key(self.request.build_absolute_uri("/"))
+        if (catalog := get_cached_catalog(cache_key)) is not None:
+            return catalog
+
+        if settings.LEARNING_PATHS_FAST_SERIALIZATION:
+            learning_paths = list(get_learning_path_values(LearningPath.objects.order_by("pk")))
+            catalog = [
+                (learning_path["id"], learning_path["invite_only"], data)
+                for learning_path, data in zip(learning_paths, serialize_learning_paths(learning_paths, self.request))
+            ]
+        else:
+            learning_paths = (
+                LearningPath.objects.select_related("grading_criteria").prefetch_related("steps").order_by("pk")
+            )
+            serializer = self.get_serializer(learning_paths, many=True)
+            catalog = [
+                (learning_path.id, learning_path.invite_only, data)
+                for learning_path, data in zip(learning_paths, serializer.data)
+            ]
+        set_cached_catalog(cache_key, catalog)
+        return catalog
+
+    @method_decorator(condition(etag_func=get_learning_paths_etag))
+    def retrieve(self, request, *args, **kwargs):
+        """Retrieve a learning path, or return 304 if it has not changed since the request with the given ETag."""
+        if not settings.LEARNING_PATHS_FAST_SERIALIZATION:
+            return super().retrieve(request, *args, **kwargs)
+
+        queryset = get_learning_path_values(
+            self.filter_queryset(self.get_queryset()), detail=True, fields=self.requested_fields
+        )
+        try:
+            learning_path = get_object_or_404(queryset, **{self.lookup_field: self.kwargs[self.lookup_field]})
+        except InvalidKeyError as exc:
+            raise NotFound("Invalid learning path key format.") from exc
+        return Response(
+            serialize_learning_paths([learning_path], request, detail=True, fields=self.requested_fields)[0]
+        )
+
+    @method_decorator(condition(etag_func=get_learning_paths_etag))
+    def list(self, request, *args, **kwargs):
+        """
+        List the learning paths visible to the user.
+
+        The catalog of learning paths is serialized once for all users and cached. It is merged with the enrollments
+        of the user, with the same visibility rules and ordering as `get_paths_visible_to_user`. Requests for a subset
+        of the fields skip the catalog, so the related data that is not requested is not retrieved. Requests with the
+        cursor pagination also skip the catalog, so they are paginated in the database.
+        """
+        if (
+            not settings.LEARNING_PATHS_CATALOG_CACHE_TIMEOUT
+            or self.requested_fields is not None
+            or self.uses_cursor_pagination()
+        ):
+            return self._list_uncached(request, *args, **kwargs)
+
+        enrollment_dates = dict(
+            LearningPathEnrollment.objects.filter(user=request.user, is_active=True).values_list(
+                "learning_path_id", "created"
+            )
+        )
+        items = [
+            {**data, "enrollment_date": enrollment_dates.get(learning_path_id)}
+            for learning_path_id, invite_only, data in self._get_catalog()
+            if request.user.is_staff or not invite_only or learning_path_id in enrollment_dates
+        ]
+        # Order by enrollment date (the most recent first), with the non-enrolled paths at the end.
+        items.sort(
+            key=lambda item: (True, item["enrollment_date"]) if item["enrollment_date"] else (False,),
+            reverse=True,
+        )
+
+        page = self.paginate_queryset(items)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(items)
+
+    def _list_uncached(self, request, *args, **kwargs):
+        """List the learning paths visible to the user without the cached catalog."""
+        if not settings.LEARNING_PATHS_FAST_SERIALIZATION:
+            return super().list(request, *args, **kwargs)
+
+        fields = self.requested_fields
+        learning_paths = get_learning_path_values(self.filter_queryset(self.get_queryset()), fields=fields)
+        page = self.paginate_queryset(learning_paths)
+        if page is not None:
+            return self.get_paginated_response(serialize_learning_paths(page, request, fields=fields))
+        return Response(serialize_learning_paths(learning_paths, request, fields=fields))
+
     def get_object(self):
         """Gracefully handle an invalid learning path key format."""
         try:
@@ -280,12 +694,14 @@ class LearningPathEnrollmentView(APIView):
         )
 
 
-class ListEnrollmentsView(generics.ListAPIView):
+class ListEnrollmentsView(OptInCursorPaginationMixin, generics.ListAPIView):
     """
     List Learning Path Enrollments.
 
     For staff, this returns enrollments from all learning paths for all users.
     For non-staff, this returns all enrollments for the current user.
+
+    Use `pagination=cursor` to paginate the enrollments with a cursor, ordered by ID.
     """
 
     permission_classes = [IsAuthenticated]
@@ -297,16 +713,41 @@ class ListEnrollmentsView(generics.ListAPIView):
 class BulkEnrollView(APIView):
     """
     Bulk enrollment/unenrollment API for LearningPathEnrollment.
+
+    Instead of the `emails` parameter, the emails can be sent as a list of rows:
+
+    * a JSON array body of email addresses (or objects with an `email`),
+    * a CSV body (`Content-Type: text/csv`) with an `email` column,
+    * an uploaded CSV `file` with an `email` column.
+
+    The rows are parsed and processed in chunks of `LEARNING_PATHS_BULK_ENROLLMENT_CHUNK_SIZE`, and the `row`
+    (0-based), `email`, `result`, and `error` of each row are streamed as a CSV or NDJSON report
+    (`report_format` query parameter). With a JSON array or CSV body, the other parameters are sent in the
+    query string.
     """
 
     permission_classes = [IsAdminUser]
+    parser_classes = [StreamingJSONParser, CSVParser, FormParser, MultiPartParser]
 
     @staticmethod
-    def _process_input_data(request: Request) -> tuple[list[str], list[str]]:
-        """Extract and validate input data from request."""
-        data = request.data
-        learning_paths_keys = data.get("learning_paths", "").split(",")
-        emails = data.get("emails", "").split(",")
+    def _get_params(request: Request) -> Mapping:
+        """Get the parameters of the bulk operation, which are in the query string if the body is a list of rows."""
+        return request.query_params if isinstance(request.data, EmailRows) else request.data
+
+    def _process_input_data(self, request: Request) -> tuple[list[str], list[str] | EmailRows]:
+        """
+        Extract and validate input data from request.
+
+        The emails of a JSON array body, a CSV body, or an uploaded CSV `file` are parsed while they are processed.
+        """
+        params = self._get_params(request)
+        learning_paths_keys = params.get("learning_paths", "").split(",")
+        if isinstance(request.data, EmailRows):
+            emails = request.data
+        elif (csv_file := request.FILES.get("file")) is not None:
+            emails = parse_csv_emails(csv_file)
+        else:
+            emails = params.get("emails", "").split(",")
 
         return learning_paths_keys, emails
 
@@ -323,24 +764,102 @@ class BulkEnrollView(APIView):
 
         return LearningPath.objects.filter(key__in=valid_learning_paths_keys)
 
-    @staticmethod
-    def _create_audit_data(request: Request, state_transition: str) -> dict[str, str]:
+    def _create_audit_data(self, request: Request) -> dict[str, str]:
         """Create audit data dictionary."""
+        params = self._get_params(request)
         return {
             "enrolled_by": request.user,
-            "reason": request.data.get("reason", ""),
-            "org": request.data.get("org", ""),
-            "role": request.data.get("role", ""),
-            "state_transition": state_transition,
+            "reason": params.get("reason", ""),
+            "org": params.get("org", ""),
+            "role": params.get("role", ""),
         }
 
-    def _setup_bulk_operation(self, request: Request) -> tuple[QuerySet[LearningPath], QuerySet[User], list[str]]:
+    def _setup_bulk_operation(self, request: Request) -> tuple[QuerySet[LearningPath], list[str] | EmailRows]:
         """Common setup for bulk operations."""
         learning_paths_keys, emails = self._process_input_data(request)
         learning_paths = self._validate_learning_paths(learning_paths_keys)
-        existing_users = User.objects.filter(email__in=emails)
 
-        return learning_paths, existing_users, emails
+        return learning_paths, emails
+
+    def _get_flag(self, request: Request, name: str) -> bool:
+        """Check whether a boolean parameter (e.g., `async` or `dry_run`) is set."""
+        return self._get_params(request).get(name) in BooleanField.TRUE_VALUES
+
+    def _create_job(
+        self, request: Request, action: str, learning_paths: QuerySet[LearningPath], emails: Iterable[str]
+    ) -> Response:
+        """Create a bulk enrollment job and schedule it after the current transaction is committed."""
+        audit_data = self._create_audit_data(request)
+        emails = list(emails)
+        job = BulkEnrollmentJob.objects.create(
+            action=action,
+            created_by=request.user,
+            learning_paths=[str(key) for key in learning_paths.values_list("key", flat=True)],
+            emails=emails,
+            total=len(emails),
+            reason=audit_data["reason"],
+            org=audit_data["org"],
+            role=audit_data["role"],
+        )
+        transaction.on_commit(lambda: process_bulk_enrollment_job.delay(job.pk))
+
+        # The status URL is relative to this view, so it does not depend on the URL namespace of the plugin.
+        status_url = request.build_absolute_uri(f"jobs/{job.uuid}/")
+        return Response(
+            {"job_id": str(job.uuid), "status": job.status, "status_url": status_url},
+            status=status.HTTP_202_ACCEPTED,
+            headers={"Location": status_url},
+        )
+
+    def _stream_report(
+        self, request: Request, action: str, learning_paths: QuerySet[LearningPath], emails: EmailRows
+    ) -> StreamingHttpResponse:
+        """Process the emails in chunks while they are parsed, and stream the result of each row."""
+        report_format = request.query_params.get("report_format", REPORT_FORMAT_CSV)
+        if report_format not in REPORT_FORMATS:
+            raise ParseError(f"report_format must be one of: {', '.join(REPORT_FORMATS)}.")
+
+        rows = iter_bulk_operation_report(
+            action,
+            learning_paths,
+            emails,
+            self._create_audit_data(request),
+            settings.LEARNING_PATHS_BULK_ENROLLMENT_CHUNK_SIZE,
+        )
+        return StreamingHttpResponse(
+            render_report(self._handle_parse_errors(rows), report_format, BULK_OPERATION_REPORT_FIELDS),
+            content_type=REPORT_CONTENT_TYPES[report_format],
+        )
+
+    @staticmethod
+    def _handle_parse_errors(rows: Iterator[dict]) -> Iterator[dict]:
+        """End the report with an error row if the rest of the body cannot be parsed."""
+        try:
+            yield from rows
+        except ParseError as exc:
+            logger.warning("BulkEnrollView: Invalid input: %s", exc.detail)
+            yield {"row": "", "email": "", "result": "error", "error": str(exc.detail)}
+
+    def _run_bulk_operation(self, request: Request, action: str) -> Response | StreamingHttpResponse:
+        """
+        Run the bulk operation synchronously, as a job, or on the streamed rows of the request body.
+
+        With `dry_run`, only the counters of the bulk operation are returned, and nothing is changed.
+        """
+        learning_paths, emails = self._setup_bulk_operation(request)
+        if self._get_flag(request, "dry_run"):
+            diff = get_bulk_enroll_diff if action == BulkEnrollmentJob.ENROLL else get_bulk_unenroll_diff
+            return Response(diff(learning_paths, list(emails)), status=status.HTTP_200_OK)
+        if self._get_flag(request, "async"):
+            return self._create_job(request, action, learning_paths, emails)
+        if isinstance(emails, EmailRows):
+            return self._stream_report(request, action, learning_paths, emails)
+
+        if action == BulkEnrollmentJob.ENROLL:
+            counts = bulk_enroll(learning_paths, emails, self._create_audit_data(request))
+            return Response(counts, status=status.HTTP_201_CREATED)
+        counts = bulk_unenroll(learning_paths, emails, self._create_audit_data(request))
+        return Response(counts, status=status.HTTP_204_NO_CONTENT)
 
     def post(self, request: Request, *args, **kwargs) -> Response:
         """
@@ -364,6 +883,11 @@ class BulkEnrollView(APIView):
         `reason` (str, optional): Reason for enrollment, used for audit.
         `org` (str, optional): Organization identifier, used for audit.
         `role` (str, optional): User role, used for audit.
+        `async` (bool, optional): Run the enrollment as a background job. The response is 202
+          with the `job_id` and the `status_url` of the job.
+        `dry_run` (bool, optional): Return the counters of the enrollment without enrolling anyone. The
+          created enrollments are split into `newly_enrolled` and `reactivated`, and the `already_enrolled`,
+          `made_allowed`, and `invalid` ones are counted too.
 
         * For existing users, it creates a new LearningPathEnrollment record, automatically
           enrolling them in the learning path. It also creates a LearningPathAllowed record
@@ -372,59 +896,7 @@ class BulkEnrollView(APIView):
           with just the email address, allowing them to get enrolled when they register.
 
         """
-        learning_paths, existing_users, emails = self._setup_bulk_operation(request)
-        non_existing_emails = set(emails) - set(u.email for u in existing_users)
-
-        enrollments_created = []
-        enrollment_allowed_created = []
-
-        for learning_path in learning_paths:
-            # Create LearningPathEnrollment for existing users
-            for user in existing_users:
-                enrollment = LearningPathEnrollment.objects.filter(user=user, learning_path=learning_path).first()
-                enrolled_now = False
-                audit_data = self._create_audit_data(request, LearningPathEnrollmentAudit.UNENROLLED_TO_ENROLLED)
-                if enrollment:
-                    if not enrollment.is_active:
-                        enrollment.is_active = True
-                        enrolled_now = True
-                    else:
-                        audit_data["state_transition"] = LearningPathEnrollmentAudit.ENROLLED_TO_ENROLLED
-                else:
-                    enrollment = LearningPathEnrollment(user=user, learning_path=learning_path)
-                    enrolled_now = True
-
-                # Set enrollment audit data that will be used by the post_save receiver.
-                enrollment._audit = audit_data  # pylint: disable=protected-access
-                enrollment.save()
-                if enrolled_now:
-                    enrollments_created.append(enrollment)
-
-            # Create LearningPathEnrollmentAllowed for non-existing users
-            for email in non_existing_emails:
-                try:
-                    validate_email(email)
-                except ValidationError:
-                    logger.warning("BulkEnrollView: Invalid email: %s", email)
-                    continue
-                allowed, created = LearningPathEnrollmentAllowed.objects.get_or_create(
-                    email=email, learning_path=learning_path
-                )
-                if created or (not allowed.user and not allowed.is_active):
-                    allowed.is_active = True
-                    enrollment_allowed_created.append(allowed)
-
-                audit_data = self._create_audit_data(request, LearningPathEnrollmentAudit.UNENROLLED_TO_ALLOWEDTOENROLL)
-                allowed._audit = audit_data  # pylint: disable=protected-access
-                allowed.save()
-
-        return Response(
-            {
-                "enrollments_created": len(enrollments_created),
-                "enrollment_allowed_created": len(enrollment_allowed_created),
-            },
-            status=status.HTTP_201_CREATED,
-        )
+        return self._run_bulk_operation(request, BulkEnrollmentJob.ENROLL)
 
     def delete(self, request, *args, **kwargs) -> Response:
         """
@@ -448,61 +920,45 @@ class BulkEnrollView(APIView):
         `reason` (str, optional): Reason for unenrollment, used for audit.
         `org` (str, optional): Organization identifier, used for audit.
         `role` (str, optional): User role, used for audit.
+        `async` (bool, optional): Run the unenrollment as a background job. The response is 202
+          with the `job_id` and the `status_url` of the job.
+        `dry_run` (bool, optional): Return the counters of the unenrollment without unenrolling anyone,
+          together with the number of enrollments that are `already_unenrolled` and `invalid` emails.
 
         * For existing users, it deactivates their LearningPathEnrollment records.
         * For emails with active LearningPathEnrollmentAllowed records, it deactivates those records.
 
         """
-        learning_paths, existing_users, emails = self._setup_bulk_operation(request)
+        return self._run_bulk_operation(request, BulkEnrollmentJob.UNENROLL)
 
-        enrollments_unenrolled = []
-        enrollment_allowed_deactivated = []
 
-        for learning_path in learning_paths:
-            for user in existing_users:
-                enrollment = LearningPathEnrollment.objects.filter(user=user, learning_path=learning_path).first()
-
-                if enrollment:
-                    if enrollment.is_active:
-                        state_transition = LearningPathEnrollmentAudit.ENROLLED_TO_UNENROLLED
-                        enrollment.is_active = False
-                        enrollments_unenrolled.append(enrollment)
-                    else:
-                        state_transition = LearningPathEnrollmentAudit.UNENROLLED_TO_UNENROLLED
-                    audit_data = self._create_audit_data(request, state_transition)
-                    enrollment._audit = audit_data  # pylint: disable=protected-access
-                    enrollment.save()
+class BulkEnrollmentJobView(generics.RetrieveAPIView):
+    """
+    API for retrieving the status of an asynchronous bulk enrollment job.
+
+    Example response::
+
+        {
+            "job_id": "c2b2a4a0-2b8f-4b8a-9a4e-0d4f3c1e5b6a",
+            "action": "enroll",
+            "status": "running",
+            "total": 20000,
+            "processed": 5000,
+            "counts": {"enrollments_created": 4990, "enrollment_allowed_created": 8},
+            "errors": [{"row": 42, "email": "invalid", "error": "Invalid email address."}],
+            "created": "2025-01-01T00:00:00Z",
+            "modified": "2025-01-01T00:01:00Z"
+        }
 
-            for email in emails:
-                try:
-                    validate_email(email)
-                except ValidationError:
-                    logger.warning("BulkEnrollView: Invalid email: %s", email)
-                    continue
-
-                enrollment_allowed = LearningPathEnrollmentAllowed.objects.filter(
-                    email=email,
-                    learning_path=learning_path,
-                ).first()
-
-                if enrollment_allowed:
-                    if enrollment_allowed.is_active:
-                        state_transition = LearningPathEnrollmentAudit.ALLOWEDTOENROLL_TO_UNENROLLED
-                        enrollment_allowed.is_active = False
-                        enrollment_allowed_deactivated.append(enrollment_allowed)
-                    else:
-                        state_transition = LearningPathEnrollmentAudit.UNENROLLED_TO_UNENROLLED
-                    audit_data = self._create_audit_data(request, state_transition)
-                    enrollment_allowed._audit = audit_data  # pylint: disable=protected-access
-                    enrollment_allowed.save()
+    The `counts` are the same as the ones of the synchronous bulk operation. The `row` of each error is the
+    0-based position of the email in the request.
+    """
 
-        return Response(
-            {
-                "enrollments_unenrolled": len(enrollments_unenrolled),
-                "enrollment_allowed_deactivated": len(enrollment_allowed_deactivated),
-            },
-            status=status.HTTP_204_NO_CONTENT,
-        )
+    permission_classes = [IsAdminUser]
+    serializer_class = BulkEnrollmentJobSerializer
+    queryset = BulkEnrollmentJob.objects.defer("emails")
+    lookup_field = "uuid"
+    lookup_url_kwarg = "job_id"
 
 
 class LearningPathCourseEnrollmentView(APIView):
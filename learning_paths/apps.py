@@ -46,8 +46,30 @@ class LearningPathsConfig(AppConfig):
                         PluginSignals.RECEIVER_FUNC_NAME: "process_pending_enrollments",
                         PluginSignals.SIGNAL_PATH: "django.db.models.signals.post_save",
                         PluginSignals.SENDER_PATH: "django.contrib.auth.models.User",
-                    }
+                    },
+                    {
+                        PluginSignals.RECEIVER_FUNC_NAME: "invalidate_user_progress",
+                        PluginSignals.SIGNAL_PATH: "django.db.models.signals.post_save",
+                        PluginSignals.SENDER_PATH: "completion.models.BlockCompletion",
+                    },
+                    {
+                        PluginSignals.RECEIVER_FUNC_NAME: "update_materialized_completion",
+                        PluginSignals.SIGNAL_PATH: "django.db.models.signals.post_save",
+                        PluginSignals.SENDER_PATH: "completion.models.BlockCompletion",
+                    },
+                    {
+                        PluginSignals.RECEIVER_FUNC_NAME: "invalidate_course_overview_dates",
+                        PluginSignals.SIGNAL_PATH: "django.db.models.signals.post_save",
+                        PluginSignals.SENDER_PATH: (
+                            "openedx.core.djangoapps.content.course_overviews.models.CourseOverview"
+                        ),
+                    },
                 ],
             }
         },
     }
+
+    def ready(self):
+        """Connect the signal handlers of the app models, also outside of the LMS (e.g., in tests)."""
+        # pylint: disable=import-outside-toplevel,unused-import
+        from learning_paths import receivers
@@ -0,0 +1,547 @@
+"""
+Set-based bulk enrollment and unenrollment of users in learning paths.
+
+The existing enrollments and allowed enrollments are loaded with a few queries, and the new and changed rows and their
+audit records are written with bulk inserts and updates. Bulk writes do not send the `post_save` signals, so the audit
+records are created here with the same semantics as the `create_enrollment_audit` and `create_enrollment_allowed_audit`
+receivers: the `reason`, `org`, and `role` that are not provided are copied from the latest audit of the record.
+
+Large bulk operations can be run asynchronously as a `BulkEnrollmentJob`, which is processed in chunks by
+`run_bulk_enrollment_job`, or on a stream of emails with `iter_bulk_operation_report`.
+"""
+
+import logging
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+from django.db.models import Model, OuterRef, Subquery
+from django.utils import timezone
+
+from learning_paths.models import (
+    BulkEnrollmentJob,
+    LearningPath,
+    LearningPathEnrollment,
+    LearningPathEnrollmentAllowed,
+    LearningPathEnrollmentAudit,
+)
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+AUDIT_FIELDS = ("reason", "org", "role")
+# The maximum number of rows written by a single bulk insert or update.
+BATCH_SIZE = 1000
+
+
+INVALID_EMAIL_ERROR = "Invalid email address."
+
+# The results of the rows of a bulk operation report.
+RESULT_ENROLLED = "enrolled"
+RESULT_ALLOWED = "allowed"
+RESULT_UNENROLLED = "unenrolled"
+RESULT_INVALID = "invalid"
+BULK_OPERATION_REPORT_FIELDS = ["row", "email", "result", "error"]
+
+
+def _is_valid_email(email: str) -> bool:
+    """Check whether the email address is valid."""
+    try:
+        validate_email(email)
+    except ValidationError:
+        return False
+    return True
+
+
+def get_valid_emails(emails: Iterable[str]) -> list[str]:
+    """Get the valid email addresses, in the same order and with the same duplicates."""
+    valid_emails = []
+    invalid_emails = set()
+    for email in emails:
+        if email in invalid_emails:
+            continue
+        if not _is_valid_email(email):
+            logger.warning("BulkEnrollView: Invalid email: %s", email)
+            invalid_emails.add(email)
+            continue
+        valid_emails.append(email)
+    return valid_emails
+
+
+def get_invalid_emails(emails: Iterable[str]) -> set[str]:
+    """
+    Get the emails that are skipped by the bulk operations.
+
+    These are the invalid email addresses that do not belong to any user.
+    """
+    invalid_emails = {email for email in emails if not _is_valid_email(email)}
+    if invalid_emails:
+        invalid_emails -= set(User.objects.filter(email__in=invalid_emails).values_list("email", flat=True))
+    return invalid_emails
+
+
+def _get_latest_audit_values(
+    model: type[LearningPathEnrollment | LearningPathEnrollmentAllowed], ids: Iterable[int], audit_data: dict
+) -> dict[int, dict[str, str]]:
+    """
+    Get the `reason`, `org`, and `role` of the latest audit of each record, if they are missing from the audit data.
+
+    :returns: A mapping of the record IDs to the audit values copied from their latest audit.
+    """
+    missing_fields = [field for field in AUDIT_FIELDS if not audit_data.get(field)]
+    if not missing_fields or not (ids := list(ids)):
+        return {}
+
+    relation = "enrollment" if model is LearningPathEnrollment else "enrollment_allowed"
+    latest_audit = LearningPathEnrollmentAudit.objects.filter(**{relation: OuterRef("pk")}).order_by("-created", "-pk")
+    latest_audit_values = {}
+    for ids_batch in _batched(ids):
+        for pk, *values in (
+            model.objects.filter(pk__in=ids_batch)
+            .annotate(**{f"latest_{field}": Subquery(latest_audit.values(field)[:1]) for field in missing_fields})
+            .values_list("pk", *(f"latest_{field}" for field in missing_fields))
+        ):
+            latest_audit_values[pk] = {field: value for field, value in zip(missing_fields, values) if value}
+    return latest_audit_values
+
+
+def _create_audits(
+    records: Iterable[tuple[LearningPathEnrollment | LearningPathEnrollmentAllowed, str]],
+    audit_data: dict,
+):
+    """
+    Create the audit records of the enrollments or allowed enrollments with a bulk insert.
+
+    :param records: Pairs of an enrollment (or allowed enrollment) and its state transition.
+    :param audit_data: The `enrolled_by`, `reason`, `org`, and `role` of the audit records.
+    """
+    records = list(records)
+    if not records:
+        return
+
+    model = type(records[0][0])
+    relation = "enrollment" if model is LearningPathEnrollment else "enrollment_allowed"
+    latest_audit_values = _get_latest_audit_values(model, {record.pk for record, _ in records}, audit_data)
+    audits = []
+    for record, state_transition in records:
+        values = {field: audit_data.get(field, "") for field in AUDIT_FIELDS}
+        values.update(latest_audit_values.get(record.pk, {}))
+        audits.append(
+            LearningPathEnrollmentAudit(
+                **{relation: record},
+                state_transition=state_transition,
+                enrolled_by=audit_data.get("enrolled_by"),
+                **values,
+            )
+        )
+    LearningPathEnrollmentAudit.objects.bulk_create(audits, batch_size=BATCH_SIZE)
+
+
+def _batched(items: Sequence) -> Iterable[Sequence]:
+    """Split the items into batches of `BATCH_SIZE`."""
+    for start in range(0, len(items), BATCH_SIZE):
+        end = start + BATCH_SIZE
+        yield items[start:end]
+
+
+def _get_non_existing_emails(emails: Iterable[str], user_emails: Iterable[str]) -> list[str]:
+    """
+    Get the sorted emails without an account, without their case-insensitive duplicates.
+
+    The emails are compared case-insensitively, because the database can match them case-insensitively (e.g., in
+    MySQL). Otherwise, the case variants of an email would get duplicate allowed enrollments.
+    """
+    user_emails = {email.lower() for email in user_emails}
+    non_existing_emails = {}
+    for email in sorted(set(emails)):
+        if email.lower() not in user_emails:
+            non_existing_emails.setdefault(email.lower(), email)
+    return list(non_existing_emails.values())
+
+
+def _get_records(
+    model: type[LearningPathEnrollment | LearningPathEnrollmentAllowed],
+    learning_paths: Sequence[LearningPath],
+    field: str,
+    values: Sequence,
+) -> dict[tuple, Model]:
+    """
+    Get the enrollments (or allowed enrollments) of the users (or emails) in the learning paths.
+
+    :returns: A mapping of the learning path IDs and the user IDs (or lowercase emails) to the records. The emails are
+        lowercase because they can be matched case-insensitively by the database (e.g., in MySQL).
+    """
+    records = {}
+    for values_batch in _batched(list(values)):
+        for record in model.objects.filter(learning_path__in=learning_paths, **{f"{field}__in": values_batch}):
+            value = getattr(record, field)
+            records[(record.learning_path_id, value.lower() if isinstance(value, str) else value)] = record
+    return records
+
+
+def bulk_enroll(learning_paths: Sequence[LearningPath], emails: Sequence[str], audit_data: dict) -> dict[str, int]:
+    """
+    Enroll the users with the given emails in the learning paths.
+
+    Users with an account are enrolled (or re-enrolled) in the learning paths. The emails without an account get
+    allowed enrollments that are processed when the users register.
+
+    :param learning_paths: The learning paths.
+    :param emails: The email addresses of the users.
+    :param audit_data: The `enrolled_by`, `reason`, `org`, and `role` of the audit records.
+    :returns: The number of created enrollments and allowed enrollments.
+    """
+    learning_paths = list(learning_paths)
+    users = list(User.objects.filter(email__in=emails))
+    user_ids = [user.id for user in users]
+    non_existing_emails = get_valid_emails(_get_non_existing_emails(emails, (user.email for user in users)))
+    now = timezone.now()
+
+    with transaction.atomic():
+        enrollments = _get_records(LearningPathEnrollment, learning_paths, "user_id", user_ids)
+        new_enrollments = []
+        enrollment_transitions = {}
+        for learning_path in learning_paths:
+            for user_id in user_ids:
+                key = (learning_path.id, user_id)
+                if (enrollment := enrollments.get(key)) is None:
+                    new_enrollments.append(LearningPathEnrollment(user_id=user_id, learning_path=learning_path))
+                    enrollment_transitions[key] = LearningPathEnrollmentAudit.UNENROLLED_TO_ENROLLED
+                elif enrollment.is_active:
+                    enrollment_transitions[key] = LearningPathEnrollmentAudit.ENROLLED_TO_ENROLLED
+                else:
+                    enrollment.is_active = True
+                    enrollment_transitions[key] = LearningPathEnrollmentAudit.UNENROLLED_TO_ENROLLED
+        for enrollment in enrollments.values():
+            enrollment.modified = now
+        LearningPathEnrollment.objects.bulk_update(
+            enrollments.values(), ["is_active", "modified"], batch_size=BATCH_SIZE
+        )
+        LearningPathEnrollment.objects.bulk_create(new_enrollments, batch_size=BATCH_SIZE)
+        if new_enrollments:
+            # Reload the enrollments to get the IDs of the created ones on all databases.
+            enrollments = _get_records(LearningPathEnrollment, learning_paths, "user_id", user_ids)
+
+        allowed_enrollments = _get_records(LearningPathEnrollmentAllowed, learning_paths, "email", non_existing_emails)
+        new_allowed_enrollments = []
+        allowed_enrollments_activated = 0
+        for learning_path in learning_paths:
+            for email in non_existing_emails:
+                if (allowed := allowed_enrollments.get((learning_path.id, email.lower()))) is None:
+                    new_allowed_enrollments.append(
+                        LearningPathEnrollmentAllowed(email=email, learning_path=learning_path)
+                    )
+                elif not allowed.user_id and not allowed.is_active:
+                    allowed.is_active = True
+                    allowed_enrollments_activated += 1
+        for allowed in allowed_enrollments.values():
+            allowed.modified = now
+        LearningPathEnrollmentAllowed.objects.bulk_update(
+            allowed_enrollments.values(), ["is_active", "modified"], batch_size=BATCH_SIZE
+        )
+        LearningPathEnrollmentAllowed.objects.bulk_create(new_allowed_enrollments, batch_size=BATCH_SIZE)
+        if new_allowed_enrollments:
+            allowed_enrollments = _get_records(
+                LearningPathEnrollmentAllowed, learning_paths, "email", non_existing_emails
+            )
+
+        _create_audits(
+            ((enrollments[key], state_transition) for key, state_transition in enrollment_transitions.items()),
+            audit_data,
+        )
+        _create_audits(
+            (
+                (
+                    allowed_enrollments[(learning_path.id, email.lower())],
+                    LearningPathEnrollmentAudit.UNENROLLED_TO_ALLOWEDTOENROLL,
+                )
+                for learning_path in learning_paths
+                for email in non_existing_emails
+            ),
+            audit_data,
+        )
+
+    return {
+        "enrollments_created": sum(
+            state_transition == LearningPathEnrollmentAudit.UNENROLLED_TO_ENROLLED
+            for state_transition in enrollment_transitions.values()
+        ),
+        "enrollment_allowed_created": len(new_allowed_enrollments) + allowed_enrollments_activated,
+    }
+
+
+def bulk_unenroll(learning_paths: Sequence[LearningPath], emails: Sequence[str], audit_data: dict) -> dict[str, int]:
+    """
+    Unenroll the users with the given emails from the learning paths.
+
+    The enrollments of the users with an account and the allowed enrollments of the emails are deactivated.
+
+    :param learning_paths: The learning paths.
+    :param emails: The email addresses of the users.
+    :param audit_data: The `enrolled_by`, `reason`, `org`, and `role` of the audit records.
+    :returns: The number of deactivated enrollments and allowed enrollments.
+    """
+    learning_paths = list(learning_paths)
+    user_ids = list(User.objects.filter(email__in=emails).values_list("id", flat=True))
+    valid_emails = get_valid_emails(emails)
+    now = timezone.now()
+
+    with transaction.atomic():
+        enrollments = _get_records(LearningPathEnrollment, learning_paths, "user_id", user_ids)
+        enrollment_audits = []
+        enrollments_unenrolled = 0
+        for learning_path in learning_paths:
+            for user_id in user_ids:
+                if (enrollment := enrollments.get((learning_path.id, user_id))) is None:
+                    continue
+                if enrollment.is_active:
+                    enrollment.is_active = False
+                    enrollments_unenrolled += 1
+                    enrollment_audits.append((enrollment, LearningPathEnrollmentAudit.ENROLLED_TO_UNENROLLED))
+                else:
+                    enrollment_audits.append((enrollment, LearningPathEnrollmentAudit.UNENROLLED_TO_UNENROLLED))
+                enrollment.modified = now
+        LearningPathEnrollment.objects.bulk_update(
+            enrollments.values(), ["is_active", "modified"], batch_size=BATCH_SIZE
+        )
+
+        allowed_enrollments = _get_records(LearningPathEnrollmentAllowed, learning_paths, "email", valid_emails)
+        allowed_audits = []
+        allowed_enrollments_deactivated = 0
+        for learning_path in learning_paths:
+            # Repeated emails are processed again, like the repeated requests for the same email.
+            for email in valid_emails:
+                if (allowed := allowed_enrollments.get((learning_path.id, email.lower()))) is None:
+                    continue
+                if allowed.is_active:
+                    allowed.is_active = False
+                    allowed_enrollments_deactivated += 1
+                    allowed_audits.append((allowed, LearningPathEnrollmentAudit.ALLOWEDTOENROLL_TO_UNENROLLED))
+                else:
+                    allowed_audits.append((allowed, LearningPathEnrollmentAudit.UNENROLLED_TO_UNENROLLED))
+                allowed.modified = now
+        LearningPathEnrollmentAllowed.objects.bulk_update(
+            allowed_enrollments.values(), ["is_active", "modified"], batch_size=BATCH_SIZE
+        )
+
+        _create_audits(enrollment_audits, audit_data)
+        _create_audits(allowed_audits, audit_data)
+
+    return {
+        "enrollments_unenrolled": enrollments_unenrolled,
+        "enrollment_allowed_deactivated": allowed_enrollments_deactivated,
+    }
+
+
+def _get_enrollment_states(learning_path_ids: Sequence[int], user_ids: Iterable[int]) -> dict[tuple[int, int], bool]:
+    """Get whether the existing enrollments of the users in the learning paths are active."""
+    return {
+        (learning_path_id, user_id): is_active
+        for learning_path_id, user_id, is_active in LearningPathEnrollment.objects.filter(
+            learning_path_id__in=learning_path_ids, user_id__in=user_ids
+        ).values_list("learning_path_id", "user_id", "is_active")
+    }
+
+
+def _get_allowed_enrollment_states(
+    learning_path_ids: Sequence[int], emails: Iterable[str]
+) -> dict[tuple[int, str], tuple[int | None, bool]]:
+    """
+    Get the user and whether the existing allowed enrollments of the emails in the learning paths are active.
+
+    The emails are lowercase, like in `_get_records`.
+    """
+    return {
+        (learning_path_id, email.lower()): (user_id, is_active)
+        for learning_path_id, email, user_id, is_active in LearningPathEnrollmentAllowed.objects.filter(
+            learning_path_id__in=learning_path_ids, email__in=emails
+        ).values_list("learning_path_id", "email", "user_id", "is_active")
+    }
+
+
+def get_bulk_enroll_diff(learning_paths: Iterable[LearningPath], emails: Sequence[str]) -> dict[str, int]:
+    """
+    Get the changes that `bulk_enroll` would make, without making them.
+
+    The existing enrollments and allowed enrollments are read with a constant number of queries, and compared with the
+    requested ones with set operations.
+
+    :returns: The `enrollments_created` and `enrollment_allowed_created` counters of `bulk_enroll`. The created
+        enrollments are split into the `newly_enrolled` and `reactivated` ones, and the `already_enrolled` ones are
+        counted too. `made_allowed` is the same as `enrollment_allowed_created`, and `invalid` is the number of
+        skipped emails.
+    """
+    learning_path_ids = [learning_path.id for learning_path in learning_paths]
+    users = dict(User.objects.filter(email__in=emails).values_list("email", "id"))
+    non_existing_emails = _get_non_existing_emails(emails, users)
+    valid_emails = {email for email in non_existing_emails if _is_valid_email(email)}
+
+    enrollment_states = _get_enrollment_states(learning_path_ids, users.values())
+    already_enrolled = sum(enrollment_states.values())
+    reactivated = len(enrollment_states) - already_enrolled
+    newly_enrolled = len(learning_path_ids) * len(set(users.values())) - len(enrollment_states)
+
+    allowed_states = _get_allowed_enrollment_states(learning_path_ids, valid_emails)
+    made_allowed = 0
+    for learning_path_id in learning_path_ids:
+        for email in valid_emails:
+            user_id, is_active = allowed_states.get((learning_path_id, email.lower()), (None, False))
+            made_allowed += not user_id and not is_active
+
+    return {
+        "enrollments_created": newly_enrolled + reactivated,
+        "enrollment_allowed_created": made_allowed,
+        "newly_enrolled": newly_enrolled,
+        "reactivated": reactivated,
+        "already_enrolled": already_enrolled,
+        "made_allowed": made_allowed,
+        "invalid": len(non_existing_emails) - len(valid_emails),
+    }
+
+
+def get_bulk_unenroll_diff(learning_paths: Iterable[LearningPath], emails: Sequence[str]) -> dict[str, int]:
+    """
+    Get the changes that `bulk_unenroll` would make, without making them.
+
+    The existing enrollments and allowed enrollments are read with a constant number of queries, and compared with the
+    requested ones with set operations.
+
+    :returns: The `enrollments_unenrolled` and `enrollment_allowed_deactivated` counters of `bulk_unenroll`, the number
+        of enrollments that are `already_unenrolled`, and the number of `invalid` (skipped) emails.
+    """
+    learning_path_ids = [learning_path.id for learning_path in learning_paths]
+    users = dict(User.objects.filter(email__in=emails).values_list("email", "id"))
+    unique_emails = set(emails)
+    valid_emails = {email for email in unique_emails if _is_valid_email(email)}
+
+    enrollment_states = _get_enrollment_states(learning_path_ids, users.values())
+    enrollments_unenrolled = sum(enrollment_states.values())
+    allowed_states = _get_allowed_enrollment_states(learning_path_ids, valid_emails)
+
+    return {
+        "enrollments_unenrolled": enrollments_unenrolled,
+        "enrollment_allowed_deactivated": sum(is_active for _, is_active in allowed_states.values()),
+        "already_unenrolled": len(enrollment_states) - enrollments_unenrolled,
+        "invalid": len(unique_emails - valid_emails - set(users)),
+    }
+
+
+def _process_job_chunk(job: BulkEnrollmentJob, first_rows: dict[str, int] | None, chunk_size: int) -> bool:
+    """
+    Process the next chunk of emails of a bulk enrollment job.
+
+    The job row is locked while the chunk is processed, and its progress is saved in the same transaction as the
+    enrollments. Therefore, each chunk is processed exactly once, even if the job is run by multiple workers.
+
+    :param job: The job, with the emails and the audit data.
+    :param first_rows: The first row of each email, if the repeated emails should be processed only once.
+    :param chunk_size: The maximum number of emails to process.
+    :returns: Whether a chunk was processed. `False` means that the job is completed.
+    """
+    with transaction.atomic():
+        progress = (
+            BulkEnrollmentJob.objects.select_for_update().only("status", "processed", "counts", "errors").get(pk=job.pk)
+        )
+        if progress.status == BulkEnrollmentJob.COMPLETED:
+            return False
+
+        start = progress.processed
+        end = start + chunk_size
+        rows = list(enumerate(job.emails[start:end], start=start))
+        if not rows:
+            progress.status = BulkEnrollmentJob.COMPLETED
+            progress.save(update_fields=["status", "modified"])
+            return False
+
+        emails = [email for row, email in rows if first_rows is None or first_rows[email] == row]
+        operation = bulk_enroll if job.action == BulkEnrollmentJob.ENROLL else bulk_unenroll
+        counts = operation(
+            LearningPath.objects.filter(key__in=job.learning_paths),
+            emails,
+            {"enrolled_by": job.created_by, "reason": job.reason, "org": job.org, "role": job.role},
+        )
+
+        invalid_emails = get_invalid_emails(email for _, email in rows)
+        progress.errors.extend(
+            {"row": row, "email": email, "error": INVALID_EMAIL_ERROR} for row, email in rows if email in invalid_emails
+        )
+        for name, count in counts.items():
+            progress.counts[name] = progress.counts.get(name, 0) + count
+        progress.processed = start + len(rows)
+        progress.status = BulkEnrollmentJob.RUNNING
+        progress.save(update_fields=["status", "processed", "counts", "errors", "modified"])
+    return True
+
+
+def run_bulk_enrollment_job(job_id: int, chunk_size: int | None = None):
+    """
+    Run a bulk enrollment job until all of its emails are processed.
+
+    The job resumes after the last processed chunk, so it can be run again after the worker was interrupted.
+
+    :param job_id: The ID of the `BulkEnrollmentJob`.
+    :param chunk_size: The number of emails processed at once. Defaults to `LEARNING_PATHS_BULK_ENROLLMENT_CHUNK_SIZE`.
+    """
+    chunk_size = chunk_size or settings.LEARNING_PATHS_BULK_ENROLLMENT_CHUNK_SIZE
+    job = BulkEnrollmentJob.objects.select_related("created_by").get(pk=job_id)
+    first_rows = None
+    if job.action == BulkEnrollmentJob.ENROLL:
+        # Repeated emails are enrolled only once, like in a single request.
+        first_rows = {}
+        for row, email in enumerate(job.emails):
+            first_rows.setdefault(email, row)
+
+    try:
+        while _process_job_chunk(job, first_rows, chunk_size):
+            pass
+    except Exception:
+        logger.exception("Bulk enrollment job %s failed.", job.uuid)
+        BulkEnrollmentJob.objects.filter(pk=job.pk).update(status=BulkEnrollmentJob.FAILED, modified=timezone.now())
+        raise
+
+
+def iter_bulk_operation_report(
+    action: str,
+    learning_paths: Iterable[LearningPath],
+    emails: Iterable[str],
+    audit_data: dict,
+    chunk_size: int,
+) -> Iterator[dict]:
+    """
+    Run a bulk operation on a stream of emails in chunks, and yield the result of each row.
+
+    Only one chunk of emails is kept in memory, so the emails can be parsed from the request body while the report is
+    streamed. Emails repeated in different chunks are processed again.
+
+    :param action: `BulkEnrollmentJob.ENROLL` or `BulkEnrollmentJob.UNENROLL`.
+    :param learning_paths: The learning paths.
+    :param emails: The email addresses of the users.
+    :param audit_data: The `enrolled_by`, `reason`, `org`, and `role` of the audit records.
+    :param chunk_size: The number of emails processed at once.
+    :returns: The `row` (0-based position of the email), `email`, `result`, and `error` of each row.
+    """
+    learning_paths = list(learning_paths)
+    enroll = action == BulkEnrollmentJob.ENROLL
+    operation = bulk_enroll if enroll else bulk_unenroll
+    rows = enumerate(emails)
+    while chunk := list(islice(rows, chunk_size)):
+        chunk_emails = [email for _, email in chunk]
+        operation(learning_paths, chunk_emails, audit_data)
+        user_emails = {
+            email.lower() for email in User.objects.filter(email__in=chunk_emails).values_list("email", flat=True)
+        }
+
+        for row, email in chunk:
+            if email.lower() in user_emails:
+                result = RESULT_ENROLLED if enroll else RESULT_UNENROLLED
+            elif _is_valid_email(email):
+                result = RESULT_ALLOWED if enroll else RESULT_UNENROLLED
+            else:
+                yield {"row": row, "email": email, "result": RESULT_INVALID, "error": INVALID_EMAIL_ERROR}
+                continue
+            yield {"row": row, "email": email, "result": result, "error": ""}
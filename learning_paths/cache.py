@@ -0,0 +1,289 @@
+"""
+Caching of the learning path catalog, progress, and grades.
+
+Cache keys include version numbers that are bumped by signal handlers when the cached data becomes outdated
+(e.g., when the steps of a learning path or the completions of a user change). This way, outdated entries are never
+read again and expire on their own.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from edx_django_utils.monitoring import set_custom_attribute
+from opaque_keys.edx.keys import CourseKey
+
+log = logging.getLogger(__name__)
+
+PROGRESS_CACHE_KEY = "learning_paths.progress.{user_id}.{learning_path_id}.{steps_version}.{completions_version}"
+GRADE_CACHE_KEY = "learning_paths.grade.{user_id}.{learning_path_id}.{steps_digest}.{grades_version}"
+STEPS_VERSION_CACHE_KEY = "learning_paths.steps_version.{learning_path_id}"
+COMPLETIONS_VERSION_CACHE_KEY = "learning_paths.completions_version.{user_id}"
+GRADES_VERSION_CACHE_KEY = "learning_paths.grades_version.{user_id}"
+CATALOG_CACHE_KEY = "learning_paths.catalog.{catalog_version}.{base_url_digest}"
+CATALOG_VERSION_CACHE_KEY = "learning_paths.catalog_version"
+COURSE_DATES_VERSION_CACHE_KEY = "learning_paths.course_dates_version.{course_key}"
+LAST_KNOWN_VALUE_CACHE_KEY = "learning_paths.last_known_{name}.{user_id}.{course_key}"
+
+# Course dates cached in this process, keyed by the course key. Each entry is a tuple of the expiration time
+# (from `time.monotonic`), the version of the course dates in the shared cache, and the course start and end dates.
+_course_dates_cache: dict[CourseKey, tuple[float, int, tuple[datetime | None, datetime | None]]] = {}
+_course_dates_lock = threading.Lock()
+
+# Hit/miss counters of the caches in this process.
+progress_cache_stats: Counter = Counter()
+grade_cache_stats: Counter = Counter()
+catalog_cache_stats: Counter = Counter()
+
+
+def _get_versions(*keys: str) -> list[int]:
+    """
+    Retrieve the current versions stored under the given cache keys.
+
+    Missing versions are initialized with the current timestamp, so that evicted versions never match
+    the versions of the entries cached before the eviction.
+    """
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns(), timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def _bump_version(key: str):
+    """Bump the version stored under the given cache key."""
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+def _get_cached_value(name: str, stats: Counter, cache_key: str, max_age: int | None = None) -> Any:
+    """Retrieve a cached value and record the cache hit or miss."""
+    entry = cache.get(cache_key)
+    if entry is not None and (max_age is None or time.time() - entry["timestamp"] <= max_age):
+        stats["hits"] += 1
+        set_custom_attribute(f"learning_paths.{name}_cache", "hit")
+        return entry["value"]
+
+    stats["misses"] += 1
+    set_custom_attribute(f"learning_paths.{name}_cache", "miss")
+    return None
+
+
+def _set_cached_value(cache_key: str, value: Any, timeout: int):
+    """Cache a value with the current timestamp."""
+    if timeout:
+        cache.set(cache_key, {"value": value, "timestamp": time.time()}, timeout)
+
+
+def get_progress_cache_key(user_id: int, learning_path_id: int) -> str:
+    """Return the cache key of the progress of a user in a learning path."""
+    steps_version, completions_version = _get_versions(
+        STEPS_VERSION_CACHE_KEY.format(learning_path_id=learning_path_id),
+        COMPLETIONS_VERSION_CACHE_KEY.format(user_id=user_id),
+    )
+    return PROGRESS_CACHE_KEY.format(
+        user_id=user_id,
+        learning_path_id=learning_path_id,
+        steps_version=steps_version,
+        completions_version=completions_version,
+    )
+
+
+def get_cached_progress(cache_key: str, max_age: int | None = None) -> float | None:
+    """
+    Retrieve the cached progress.
+
+    :param max_age: The maximum accepted age (in seconds) of the cached progress. If it is None,
+        the progress is accepted until it expires or becomes outdated.
+    :returns: The cached progress or None if it is not cached or is too old.
+    """
+    return _get_cached_value("progress", progress_cache_stats, cache_key, max_age)
+
+
+def set_cached_progress(cache_key: str, progress: float):
+    """Cache the progress for `LEARNING_PATHS_PROGRESS_CACHE_TIMEOUT` seconds."""
+    _set_cached_value(cache_key, progress, settings.LEARNING_PATHS_PROGRESS_CACHE_TIMEOUT)
+
+
+def get_grade_cache_key(user_id: int, learning_path_id: int, steps: Iterable[tuple[CourseKey, float]]) -> str:
+    """
+    Return the cache key of the grade of a user in a learning path.
+
+    The key includes a digest of the course keys and weights of the steps, so a grade is never read
+    for a different set of steps or weights than the one it was calculated for.
+    """
+    steps_digest = hashlib.sha256(repr(sorted((str(key), weight) for key, weight in steps)).encode()).hexdigest()
+    (grades_version,) = _get_versions(GRADES_VERSION_CACHE_KEY.format(user_id=user_id))
+    return GRADE_CACHE_KEY.format(
+        user_id=user_id,
+        learning_path_id=learning_path_id,
+        steps_digest=steps_digest,
+        grades_version=grades_version,
+    )
+
+
+def get_cached_grade(cache_key: str) -> float | None:
+    """Retrieve the cached grade."""
+    return _get_cached_value("grade", grade_cache_stats, cache_key)
+
+
+def set_cached_grade(cache_key: str, grade: float):
+    """Cache the grade for `LEARNING_PATHS_GRADE_CACHE_TIMEOUT` seconds."""
+    _set_cached_value(cache_key, grade, settings.LEARNING_PATHS_GRADE_CACHE_TIMEOUT)
+
+
+def invalidate_learning_path_steps(learning_path_id: int):
+    """Invalidate the cached data that depends on the steps of a learning path."""
+    log.debug("Invalidating cached progress for learning path %s.", learning_path_id)
+    _bump_version(STEPS_VERSION_CACHE_KEY.format(learning_path_id=learning_path_id))
+
+
+def invalidate_user_completions(user_id: int):
+    """Invalidate the cached data that depends on the course completions of a user."""
+    log.debug("Invalidating cached progress for user %s.", user_id)
+    _bump_version(COMPLETIONS_VERSION_CACHE_KEY.format(user_id=user_id))
+
+
+def invalidate_user_grades(user_id: int):
+    """Invalidate the cached data that depends on the course grades of a user."""
+    log.debug("Invalidating cached grades for user %s.", user_id)
+    _bump_version(GRADES_VERSION_CACHE_KEY.format(user_id=user_id))
+
+
+def get_catalog_version() -> int:
+    """Return the current version of the catalog of learning paths."""
+    (catalog_version,) = _get_versions(CATALOG_VERSION_CACHE_KEY)
+    return catalog_version
+
+
+def get_catalog_cache_key(base_url: str) -> str:
+    """
+    Return the cache key of the serialized catalog of learning paths.
+
+    The serialized catalog contains absolute URLs, so the key depends on the base URL of the request.
+    """
+    return CATALOG_CACHE_KEY.format(
+        catalog_version=get_catalog_version(),
+        base_url_digest=hashlib.sha256(base_url.encode()).hexdigest(),
+    )
+
+
+def get_cached_catalog(cache_key: str) -> list | None:
+    """Retrieve the cached serialized catalog."""
+    return _get_cached_value("catalog", catalog_cache_stats, cache_key)
+
+
+def set_cached_catalog(cache_key: str, catalog: list):
+    """Cache the serialized catalog for `LEARNING_PATHS_CATALOG_CACHE_TIMEOUT` seconds."""
+    _set_cached_value(cache_key, catalog, settings.LEARNING_PATHS_CATALOG_CACHE_TIMEOUT)
+
+
+def invalidate_catalog():
+    """Invalidate the cached catalog after a learning path, its steps, grading criteria, or skills change."""
+    log.debug("Invalidating the cached catalog of learning paths.")
+    _bump_version(CATALOG_VERSION_CACHE_KEY)
+
+
+def _get_last_known_cache_key(name: str, user_id: int, course_key: CourseKey) -> str:
+    """Return the cache key of the last known value of a user in a course."""
+    return LAST_KNOWN_VALUE_CACHE_KEY.format(name=name, user_id=user_id, course_key=course_key)
+
+
+def get_last_known_values(name: str, user_id: int, course_keys: Iterable[CourseKey]) -> dict[CourseKey, float]:
+    """
+    Retrieve the last known values (e.g., completions or grades) of a user in the given courses.
+
+    These values are used as a fallback when the LMS dependency that provides them is unavailable.
+    Courses without a known value are not included in the result.
+    """
+    cache_keys = {_get_last_known_cache_key(name, user_id, course_key): course_key for course_key in course_keys}
+    return {cache_keys[cache_key]: value for cache_key, value in cache.get_many(cache_keys).items()}
+
+
+def set_last_known_values(name: str, user_id: int, values: dict[CourseKey, float]):
+    """Store the last known values of a user for `LEARNING_PATHS_LAST_KNOWN_VALUE_TIMEOUT` seconds."""
+    if values:
+        cache.set_many(
+            {_get_last_known_cache_key(name, user_id, course_key): value for course_key, value in values.items()},
+            settings.LEARNING_PATHS_LAST_KNOWN_VALUE_TIMEOUT,
+        )
+
+
+def get_course_dates_versions(course_keys: Iterable[CourseKey]) -> dict[CourseKey, int]:
+    """
+    Retrieve the current versions of the dates of the given courses from the shared cache.
+
+    The versions are bumped when a course is published, so the dates cached in each process with an older version
+    are never read again. No versions are returned when the course dates cache is disabled.
+    """
+    course_keys = list(course_keys)
+    if not settings.LEARNING_PATHS_COURSE_DATES_CACHE_TIMEOUT or not course_keys:
+        return {}
+    versions = _get_versions(*(COURSE_DATES_VERSION_CACHE_KEY.format(course_key=key) for key in course_keys))
+    return dict(zip(course_keys, versions))
+
+
+def get_cached_course_dates(versions: dict[CourseKey, int]) -> dict[CourseKey, tuple[datetime | None, datetime | None]]:
+    """
+    Retrieve the course dates cached in this process.
+
+    :param versions: The current versions of the course dates, keyed by the course key.
+        Courses without cached (or with expired or outdated) dates are not included in the result.
+    """
+    current_time = time.monotonic()
+    cached_course_dates = {}
+    with _course_dates_lock:
+        for course_key, version in versions.items():
+            entry = _course_dates_cache.get(course_key)
+            if entry and entry[0] > current_time and entry[1] == version:
+                cached_course_dates[course_key] = entry[2]
+    return cached_course_dates
+
+
+def set_cached_course_dates(
+    course_dates: dict[CourseKey, tuple[datetime | None, datetime | None]],
+    versions: dict[CourseKey, int],
+):
+    """
+    Cache the course dates in this process for `LEARNING_PATHS_COURSE_DATES_CACHE_TIMEOUT` seconds.
+
+    :param versions: The versions of the course dates read before the dates were retrieved, so that dates retrieved
+        while a course was being published are stored with the outdated version. Courses without a version are not
+        cached.
+    """
+    if not (timeout := settings.LEARNING_PATHS_COURSE_DATES_CACHE_TIMEOUT):
+        return
+    expiration_time = time.monotonic() + timeout
+    with _course_dates_lock:
+        _course_dates_cache.update(
+            (course_key, (expiration_time, versions[course_key], dates))
+            for course_key, dates in course_dates.items()
+            if course_key in versions
+        )
+
+
+def invalidate_course_dates(course_key: CourseKey | None = None):
+    """
+    Invalidate the cached dates of a course in all processes.
+
+    Without a course key, the dates of all courses cached in this process are cleared.
+    """
+    if course_key is None:
+        with _course_dates_lock:
+            _course_dates_cache.clear()
+        return
+
+    log.debug("Invalidating the cached dates of course %s.", course_key)
+    _bump_version(COURSE_DATES_VERSION_CACHE_KEY.format(course_key=course_key))
+    with _course_dates_lock:
+        _course_dates_cache.pop(course_key, None)
@@ -0,0 +1,65 @@
+"""
+Circuit breakers for the LMS dependencies of the learning path progress and grades.
+
+The state of each circuit is kept in the Django cache, so it is shared by all workers. After
+`LEARNING_PATHS_CIRCUIT_BREAKER_FAILURE_THRESHOLD` consecutive failures, the circuit opens and the dependency is not
+called for `LEARNING_PATHS_CIRCUIT_BREAKER_RECOVERY_TIMEOUT` seconds. After that, the next call is a trial: a success
+closes the circuit, and a failure opens it again.
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from edx_django_utils.monitoring import set_custom_attribute
+
+log = logging.getLogger(__name__)
+
+FAILURES_CACHE_KEY = "learning_paths.circuit_breaker.{name}.failures"
+OPEN_CACHE_KEY = "learning_paths.circuit_breaker.{name}.open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker that stops calling a dependency after repeated failures.
+    """
+
+    def __init__(self, name: str):
+        """Initialize the circuit breaker of the dependency with the given name."""
+        self.name = name
+        self.failures_cache_key = FAILURES_CACHE_KEY.format(name=name)
+        self.open_cache_key = OPEN_CACHE_KEY.format(name=name)
+
+    def allow_request(self) -> bool:
+        """Return whether the dependency can be called."""
+        if cache.get(self.open_cache_key):
+            set_custom_attribute(f"learning_paths.circuit_breaker.{self.name}", "open")
+            return False
+        return True
+
+    def record_success(self):
+        """Close the circuit after a successful call."""
+        cache.delete(self.failures_cache_key)
+
+    def record_failure(self):
+        """Count a failed call and open the circuit when the failure threshold is reached."""
+        threshold = settings.LEARNING_PATHS_CIRCUIT_BREAKER_FAILURE_THRESHOLD
+        if cache.add(self.failures_cache_key, 1, timeout=None):
+            failures = 1
+        else:
+            try:
+                failures = cache.incr(self.failures_cache_key)
+            except ValueError:  # pragma: no cover
+                # The key expired between `add` and `incr`.
+                failures = 1
+
+        if failures >= threshold:
+            log.warning("Opening the %s circuit after %d failures.", self.name, failures)
+            cache.set(self.open_cache_key, True, settings.LEARNING_PATHS_CIRCUIT_BREAKER_RECOVERY_TIMEOUT)
+            # Keep the circuit one failure away from opening, so the trial call after the recovery timeout
+            # opens it again if it fails.
+            cache.set(self.failures_cache_key, threshold - 1, timeout=None)
+
+
+completion_circuit_breaker = CircuitBreaker("completion")
+grade_circuit_breaker = CircuitBreaker("grade")
@@ -5,6 +5,7 @@ Compatibility layer for testing without Open edX.
 import logging
 from datetime import datetime
 
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractBaseUser
 from opaque_keys.edx.keys import CourseKey
 
@@ -22,16 +23,80 @@ def get_user_course_grade(user: AbstractBaseUser, course_key: CourseKey):
     return course_grade
 
 
-def get_catalog_api_client(user: AbstractBaseUser):
+def get_user_course_completions(user: AbstractBaseUser, course_keys: list[CourseKey]) -> dict[CourseKey, float]:
     """
-    Retrieve the api client for user.
+    Retrieve the completion percentages of a user in multiple courses directly from the completion aggregator.
+
+    Courses without any completion data are reported as 0.0. Stale completions are recalculated, the same way
+    the completion aggregator API does.
+    """
+    # pylint: disable=import-outside-toplevel
+    from completion_aggregator.models import Aggregator, StaleCompletion
+    from completion_aggregator.serializers import AggregatorAdapter
+
+    completions = dict.fromkeys(course_keys, 0.0)
+    aggregators = Aggregator.objects.filter(user=user, aggregation_name="course", course_key__in=course_keys)
+    for course_key, percent in aggregators.values_list("course_key", "percent"):
+        completions[course_key] = percent
+
+    stale_course_keys = StaleCompletion.objects.filter(
+        username=user.username, course_key__in=course_keys, resolved=False
+    ).values_list("course_key", flat=True)
+    for course_key in set(stale_course_keys):
+        completions[course_key] = AggregatorAdapter(user=user, course_key=course_key, recalculate_stale=True).percent
+
+    return completions
+
+
+def get_course_user_completions(
+    course_key: CourseKey, user_ids: list[int], recalculate_stale: bool = False
+) -> dict[int, float]:
+    """
+    Retrieve the completion percentages of multiple users in a course directly from the completion aggregator.
+
+    Users without any completion data are reported as 0.0. Unlike `get_user_course_completions`, stale
+    completions are not recalculated by default, so this can be used for reports with many users. With
+    `recalculate_stale`, only the completions of the users with stale data are recalculated.
+    """
+    # pylint: disable=import-outside-toplevel
+    from completion_aggregator.models import Aggregator, StaleCompletion
+    from completion_aggregator.serializers import AggregatorAdapter
+
+    completions = dict.fromkeys(user_ids, 0.0)
+    aggregators = Aggregator.objects.filter(course_key=course_key, aggregation_name="course", user_id__in=user_ids)
+    completions.update(aggregators.values_list("user_id", "percent"))
+
+    if recalculate_stale:
+        stale_usernames = StaleCompletion.objects.filter(course_key=course_key, resolved=False).values("username")
+        for user in get_user_model().objects.filter(id__in=user_ids, username__in=stale_usernames):
+            completions[user.id] = AggregatorAdapter(user=user, course_key=course_key, recalculate_stale=True).percent
+
+    return completions
+
+
+def get_course_user_grades(course_key: CourseKey, user_ids: list[int]) -> dict[int, float]:
+    """
+    Retrieve the persisted grades of multiple users in a course with a single query.
+
+    Users without a persisted grade are reported as 0.0.
     """
     # pylint: disable=import-outside-toplevel, import-error
-    from openedx.core.djangoapps.catalog.utils import (
-        get_catalog_api_client as api_client,
-    )
+    from lms.djangoapps.grades.models import PersistentCourseGrade
+
+    grades = dict.fromkeys(user_ids, 0.0)
+    persistent_grades = PersistentCourseGrade.objects.filter(course_id=course_key, user_id__in=user_ids)
+    grades.update(persistent_grades.values_list("user_id", "percent_grade"))
+    return grades
+
+
+def create_user_jwt(user: AbstractBaseUser) -> str:
+    """
+    Create a JWT that identifies the user in the LMS APIs.
+    """
+    # pylint: disable=import-outside-toplevel, import-error
+    from openedx.core.djangoapps.oauth_dispatch.jwt import create_jwt_for_user
 
-    return api_client(user)
+    return create_jwt_for_user(user)
 
 
 def get_course_keys_with_outlines() -> list[CourseKey]:
@@ -58,6 +123,17 @@ def get_course_dates(course_key: CourseKey) -> tuple[datetime | None, datetime |
         return None, None
 
 
+def get_course_dates_many(course_keys: list[CourseKey]) -> dict[CourseKey, tuple[datetime | None, datetime | None]]:
+    """Retrieve the start and end dates of multiple courses with a single query."""
+    # pylint: disable=import-outside-toplevel, import-error
+    from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+
+    course_dates = dict.fromkeys(course_keys, (None, None))
+    for course_key, start, end in CourseOverview.objects.filter(id__in=course_keys).values_list("id", "start", "end"):
+        course_dates[course_key] = (start, end)
+    return course_dates
+
+
 def enroll_user_in_course(user: AbstractBaseUser, course_key: CourseKey) -> bool:
     """Enroll a user in a course."""
     # pylint: disable=import-outside-toplevel, import-error
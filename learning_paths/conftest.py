@@ -2,9 +2,14 @@
 
 # pylint: disable=redefined-outer-name
 
+from unittest.mock import patch
+
 import pytest
+from celery import current_app
+from django.core.cache import cache
 from django.test import override_settings
 
+from learning_paths.cache import invalidate_course_dates
 from learning_paths.tests.factories import (
     LearningPathEnrollmentFactory,
     LearningPathFactory,
@@ -12,6 +17,45 @@ from learning_paths.tests.factories import (
 )
 
 
+@pytest.fixture(autouse=True, scope="session")
+def configure_celery():
+    """Configure Celery from the Django settings, like the LMS does, so that the tasks run eagerly."""
+    current_app.config_from_object("django.conf:settings", namespace="CELERY")
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Clear the cache between tests."""
+    cache.clear()
+    invalidate_course_dates()
+    yield
+    cache.clear()
+    invalidate_course_dates()
+
+
+@pytest.fixture
+def course_dates():
+    """
+    Return the start and end dates of all courses in `mock_course_dates`.
+
+    Override this fixture in a test class to return specific dates.
+    """
+    return None, None
+
+
+@pytest.fixture
+def mock_course_dates(course_dates):
+    """Mock the course dates that are retrieved from edx-platform, and return the mock of the bulk retrieval."""
+    with (
+        patch("learning_paths.models.get_course_dates", return_value=course_dates),
+        patch(
+            "learning_paths.api.v1.utils.get_course_dates_many",
+            side_effect=lambda course_keys: dict.fromkeys(course_keys, course_dates),
+        ) as mock,
+    ):
+        yield mock
+
+
 @pytest.fixture
 def user():
     """Create a single user for testing."""
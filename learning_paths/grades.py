@@ -0,0 +1,84 @@
+"""
+Retrieval of the course grades used for the learning path grades.
+"""
+
+import logging
+import time
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import DatabaseError
+from opaque_keys.edx.keys import CourseKey
+
+from .cache import get_last_known_values, set_last_known_values
+from .circuit_breaker import grade_circuit_breaker
+from .compat import get_user_course_grade
+
+log = logging.getLogger(__name__)
+
+
+class CourseGrades(NamedTuple):
+    """
+    Course grades of a user.
+
+    `stale` is True when some grades could not be retrieved and were replaced with the last known values
+    (or 0.0 if no value is known).
+    """
+
+    grades: dict[CourseKey, float]
+    stale: bool = False
+
+
+class AggregateGrade(NamedTuple):
+    """
+    Aggregate grade of a user in a learning path.
+
+    `stale` is True when the grade was calculated from the last known course grades (or 0.0 for courses without
+    a known grade), because the grade dependency was unavailable.
+    """
+
+    grade: float
+    stale: bool = False
+
+
+def get_course_grades(user, course_keys: Iterable[CourseKey]) -> CourseGrades:
+    """
+    Retrieve the grades of a user in the given courses.
+
+    The grades are not retrieved while the grade circuit is open, or after `LEARNING_PATHS_GRADE_TIMEOUT` seconds
+    have passed. In these cases, and when retrieving a grade fails with a database error or a missing object,
+    the last known grade is used instead. Other errors are raised.
+    """
+    course_keys = list(dict.fromkeys(course_keys))
+    deadline = time.monotonic() + settings.LEARNING_PATHS_GRADE_TIMEOUT
+    grades = {}
+    failed = False
+
+    for course_key in course_keys:
+        if time.monotonic() > deadline:
+            log.warning("Retrieving the grades of user %s exceeded the time budget.", user.id)
+            grade_circuit_breaker.record_failure()
+            failed = True
+            break
+        if not grade_circuit_breaker.allow_request():
+            break
+        try:
+            grades[course_key] = get_user_course_grade(user, course_key).percent
+        except (DatabaseError, ObjectDoesNotExist):
+            log.exception("Failed to retrieve the grade of user %s in course %s.", user.id, course_key)
+            grade_circuit_breaker.record_failure()
+            failed = True
+
+    if grades and not failed:
+        grade_circuit_breaker.record_success()
+    set_last_known_values("grade", user.id, grades)
+
+    if missing_course_keys := [course_key for course_key in course_keys if course_key not in grades]:
+        last_known_grades = get_last_known_values("grade", user.id, missing_course_keys)
+        for course_key in missing_course_keys:
+            grades[course_key] = last_known_grades.get(course_key, 0.0)
+        return CourseGrades(grades, stale=True)
+
+    return CourseGrades(grades)
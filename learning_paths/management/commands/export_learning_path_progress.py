@@ -0,0 +1,63 @@
+"""
+Management command for exporting the progress of all learners enrolled in a Learning Path.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from learning_paths.models import LearningPath
+from learning_paths.reports import (
+    DEFAULT_CHUNK_SIZE,
+    REPORT_FORMAT_CSV,
+    REPORT_FORMATS,
+    iter_progress_report,
+    render_report,
+)
+
+
+class Command(BaseCommand):
+    """
+    Export the username, progress, grade, and pass status of each learner actively enrolled in a Learning Path.
+
+    The report is written as it is generated, so the memory usage does not depend on the number of learners.
+
+    Examples:
+
+        ./manage.py lms export_learning_path_progress path-v1:OpenedX+DemoX+DemoRun+DemoGroup
+        ./manage.py lms export_learning_path_progress path-v1:OpenedX+DemoX+DemoRun+DemoGroup \\
+            --format ndjson --output progress.ndjson
+    """
+
+    help = "Export the progress of all learners enrolled in a Learning Path."
+
+    def add_arguments(self, parser):
+        parser.add_argument("learning_path", help="Key of the Learning Path.")
+        parser.add_argument(
+            "--format",
+            choices=REPORT_FORMATS,
+            default=REPORT_FORMAT_CSV,
+            help="Output format of the report.",
+        )
+        parser.add_argument(
+            "--output",
+            help="Path of the output file. Defaults to the standard output.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Number of enrollments to process at once.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            learning_path = LearningPath.objects.get(key=options["learning_path"])
+        except LearningPath.DoesNotExist as exc:
+            raise CommandError(f"Learning Path {options['learning_path']} does not exist.") from exc
+
+        lines = render_report(iter_progress_report(learning_path, options["chunk_size"]), options["format"])
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8", newline="") as output:
+                output.writelines(lines)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending="")
@@ -0,0 +1,101 @@
+"""
+Management command for (re)building the materialized progress of Learning Path enrollments.
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand
+
+from learning_paths.compat import get_course_user_completions, get_course_user_grades
+from learning_paths.models import (
+    LearningPath,
+    LearningPathEnrollment,
+    LearningPathProgress,
+)
+
+log = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the materialized progress of active Learning Path enrollments.
+
+    The enrollments of each Learning Path are processed in chunks, so the memory usage does not depend on the
+    number of enrollments, and the course values are retrieved with a single query per course for each chunk.
+
+    Examples:
+
+        ./manage.py lms rebuild_learning_path_progress
+        ./manage.py lms rebuild_learning_path_progress --learning-path path-v1:OpenedX+DemoX+DemoRun+DemoGroup
+    """
+
+    help = "Rebuild the materialized progress of active Learning Path enrollments."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--learning-path",
+            action="append",
+            dest="learning_paths",
+            default=[],
+            help="Key of the Learning Path to rebuild. Can be repeated. Defaults to all Learning Paths.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of enrollments to process and save at once.",
+        )
+
+    @staticmethod
+    def build_progress(learning_path: LearningPath, chunk: list[LearningPathEnrollment]) -> list[LearningPathProgress]:
+        """
+        Calculate the materialized progress of the enrollments from the course completions and grades.
+
+        The values of each course are retrieved for all enrollments of the chunk at once. Stale completions are
+        recalculated, so the stored rows are not based on outdated values.
+        """
+        user_ids = [enrollment.user_id for enrollment in chunk]
+        steps = learning_path.steps.all()
+        completions = {
+            step.course_key: get_course_user_completions(step.course_key, user_ids, recalculate_stale=True)
+            for step in steps
+        }
+        grades = {step.course_key: get_course_user_grades(step.course_key, user_ids) for step in steps}
+
+        rows = []
+        for enrollment in chunk:
+            enrollment.learning_path = learning_path
+            progress = LearningPathProgress(
+                enrollment=enrollment,
+                course_completions={
+                    str(course_key): values[enrollment.user_id] for course_key, values in completions.items()
+                },
+                course_grades={str(course_key): values[enrollment.user_id] for course_key, values in grades.items()},
+            )
+            progress.update_aggregates()
+            rows.append(progress)
+        return rows
+
+    def handle(self, *args, **options):
+        learning_paths = LearningPath.objects.select_related("grading_criteria").prefetch_related("steps")
+        if options["learning_paths"]:
+            learning_paths = learning_paths.filter(key__in=options["learning_paths"])
+
+        total = 0
+        for learning_path in learning_paths:
+            enrollments = LearningPathEnrollment.objects.filter(learning_path=learning_path, is_active=True)
+            enrollments = enrollments.order_by("pk")
+            last_pk = 0
+            while chunk := list(enrollments.filter(pk__gt=last_pk)[: options["chunk_size"]]):
+                rows = self.build_progress(learning_path, chunk)
+                LearningPathProgress.objects.bulk_create(
+                    rows,
+                    update_conflicts=True,
+                    unique_fields=["enrollment"],
+                    update_fields=LearningPathProgress.AGGREGATE_FIELDS,
+                )
+                last_pk = chunk[-1].pk
+                total += len(rows)
+                log.info("Rebuilt the materialized progress of %d Learning Path enrollments.", total)
+
+        self.stdout.write(f"Rebuilt the materialized progress of {total} Learning Path enrollments.")
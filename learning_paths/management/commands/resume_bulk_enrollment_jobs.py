@@ -0,0 +1,56 @@
+"""
+Management command for resuming the interrupted asynchronous bulk enrollment jobs.
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from learning_paths.models import BulkEnrollmentJob
+from learning_paths.tasks import process_bulk_enrollment_job
+
+
+class Command(BaseCommand):
+    """
+    Schedule the bulk enrollment jobs that have not been updated for a while again.
+
+    The jobs resume after their last processed chunk. A job that is still running is not processed twice, because its
+    chunks are processed while the job is locked.
+
+    Examples:
+
+        ./manage.py lms resume_bulk_enrollment_jobs
+        ./manage.py lms resume_bulk_enrollment_jobs --stale-after 60 --include-failed
+    """
+
+    help = "Resume the interrupted asynchronous bulk enrollment jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--stale-after",
+            type=int,
+            default=600,
+            help="Number of seconds since the last update after which a pending or running job is resumed.",
+        )
+        parser.add_argument(
+            "--include-failed",
+            action="store_true",
+            help="Also resume the failed jobs.",
+        )
+
+    def handle(self, *args, **options):
+        statuses = [BulkEnrollmentJob.PENDING, BulkEnrollmentJob.RUNNING]
+        if options["include_failed"]:
+            statuses.append(BulkEnrollmentJob.FAILED)
+        stale_before = timezone.now() - timedelta(seconds=options["stale_after"])
+
+        job_ids = list(
+            BulkEnrollmentJob.objects.filter(status__in=statuses, modified__lt=stale_before).values_list(
+                "pk", flat=True
+            )
+        )
+        for job_id in job_ids:
+            process_bulk_enrollment_job.delay(job_id)
+
+        self.stdout.write(f"Resumed {len(job_ids)} bulk enrollment jobs.")
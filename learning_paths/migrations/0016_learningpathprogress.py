@@ -0,0 +1,68 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:30
+
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("learning_paths", "0015_make_skill_level_optional"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LearningPathProgress",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "created",
+                    model_utils.fields.AutoCreatedField(
+                        default=django.utils.timezone.now, editable=False, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    model_utils.fields.AutoLastModifiedField(
+                        default=django.utils.timezone.now, editable=False, verbose_name="modified"
+                    ),
+                ),
+                (
+                    "course_completions",
+                    models.JSONField(
+                        default=dict,
+                        help_text="Completion (0.0-1.0) of each course in the Learning Path, keyed by the course key.",
+                    ),
+                ),
+                (
+                    "course_grades",
+                    models.JSONField(
+                        default=dict,
+                        help_text="Grade (0.0-1.0) of each course in the Learning Path, keyed by the course key.",
+                    ),
+                ),
+                (
+                    "progress",
+                    models.FloatField(default=0.0, help_text="Aggregate progress (0.0-1.0) in the Learning Path."),
+                ),
+                ("grade", models.FloatField(default=0.0, help_text="Aggregate grade (0.0-1.0) in the Learning Path.")),
+                (
+                    "completed",
+                    models.BooleanField(default=False, help_text="Whether the required completion is reached."),
+                ),
+                ("passed", models.BooleanField(default=False, help_text="Whether the required grade is reached.")),
+                (
+                    "enrollment",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="progress",
+                        to="learning_paths.learningpathenrollment",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
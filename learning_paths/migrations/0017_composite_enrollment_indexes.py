@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("learning_paths", "0016_learningpathprogress"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="learningpathenrollment",
+            index=models.Index(fields=["learning_path", "user", "is_active"], name="lp_enroll_path_user_active_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="learningpathenrollment",
+            index=models.Index(fields=["user", "is_active"], name="lp_enroll_user_active_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="learningpathenrollmentallowed",
+            index=models.Index(fields=["email", "is_active"], name="lp_allowed_email_active_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="learningpathenrollmentaudit",
+            index=models.Index(fields=["enrollment", "created"], name="lp_audit_enroll_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="learningpathenrollmentaudit",
+            index=models.Index(fields=["enrollment_allowed", "created"], name="lp_audit_allowed_created_idx"),
+        ),
+    ]
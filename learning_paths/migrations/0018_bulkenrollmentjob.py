@@ -0,0 +1,78 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:06
+
+import uuid
+
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("learning_paths", "0017_composite_enrollment_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BulkEnrollmentJob",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "created",
+                    model_utils.fields.AutoCreatedField(
+                        default=django.utils.timezone.now, editable=False, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    model_utils.fields.AutoLastModifiedField(
+                        default=django.utils.timezone.now, editable=False, verbose_name="modified"
+                    ),
+                ),
+                ("uuid", models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ("action", models.CharField(choices=[("enroll", "Enroll"), ("unenroll", "Unenroll")], max_length=16)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("completed", "Completed"),
+                            ("failed", "Failed"),
+                        ],
+                        db_index=True,
+                        default="pending",
+                        max_length=16,
+                    ),
+                ),
+                ("learning_paths", models.JSONField(default=list, help_text="Keys of the learning paths.")),
+                (
+                    "emails",
+                    models.JSONField(
+                        default=list, help_text="Email addresses of the users, in the order of the request."
+                    ),
+                ),
+                ("reason", models.TextField(blank=True)),
+                ("org", models.CharField(blank=True, max_length=255)),
+                ("role", models.CharField(blank=True, max_length=255)),
+                ("processed", models.PositiveIntegerField(default=0, help_text="Number of emails processed so far.")),
+                ("counts", models.JSONField(default=dict, help_text="Counters of the processed enrollments.")),
+                ("errors", models.JSONField(default=list, help_text="Errors of the processed rows.")),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
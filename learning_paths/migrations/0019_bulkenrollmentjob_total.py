@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:52
+
+from django.db import migrations, models
+
+
+def set_total(apps, schema_editor):
+    """Store the number of emails of the existing jobs."""
+    BulkEnrollmentJob = apps.get_model("learning_paths", "BulkEnrollmentJob")
+    for job in BulkEnrollmentJob.objects.only("pk", "emails").iterator():
+        BulkEnrollmentJob.objects.filter(pk=job.pk).update(total=len(job.emails))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("learning_paths", "0018_bulkenrollmentjob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bulkenrollmentjob",
+            name="total",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Number of emails of the job, stored so that the status is read without the emails.",
+            ),
+        ),
+        migrations.RunPython(set_total, migrations.RunPython.noop),
+    ]
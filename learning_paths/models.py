@@ -9,17 +9,25 @@ from datetime import datetime
 from uuid import uuid4
 
 from django.contrib import auth
-from django.core.exceptions import ValidationError
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
-from django.db.models import OuterRef, Q
+from django.db.models import Q
+from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 from model_utils import FieldTracker
 from model_utils.models import TimeStampedModel
 from opaque_keys.edx.django.models import CourseKeyField
+from opaque_keys.edx.keys import CourseKey
 from slugify import slugify
 
-from .compat import get_course_dates, get_user_course_grade
+from .cache import get_cached_grade, get_grade_cache_key, set_cached_grade
+from .compat import (
+    get_course_dates,
+    get_course_user_completions,
+    get_course_user_grades,
+)
+from .grades import AggregateGrade, get_course_grades
 from .keys import LearningPathKeyField
 
 log = logging.getLogger(__name__)
@@ -47,19 +55,22 @@ class LearningPathManager(models.Manager):
         the date when the user enrolled in that learning path (None if not enrolled).
         Results are ordered by enrollment date (the most recent first), with non-enrolled paths at the end.
         """
-        queryset = self.get_queryset()
-
-        # Annotate each path with the enrollment date.
-        enrollment_subquery = LearningPathEnrollment.objects.filter(
-            learning_path=OuterRef("pk"), user=user, is_active=True
-        ).values("created")[:1]
-        queryset = queryset.annotate(enrollment_date=models.Subquery(enrollment_subquery))
+        # Join each path with the active enrollment of the user (if any). Users can have only one enrollment
+        # in a learning path, so the join does not duplicate the paths.
+        queryset = self.get_queryset().annotate(
+            user_enrollment=models.FilteredRelation(
+                "learningpathenrollment",
+                condition=Q(learningpathenrollment__user=user, learningpathenrollment__is_active=True),
+            ),
+            enrollment_date=models.F("user_enrollment__created"),
+        )
 
         # Apply visibility filtering based on the user role.
         if not user.is_staff:
             queryset = queryset.filter(Q(invite_only=False) | Q(enrollment_date__isnull=False))
 
         # Order by enrollment date (the most recent first), with null values at the end.
+        # Counting the paths (e.g., for pagination) skips the ordering and the unused annotations.
         return queryset.order_by(models.F("enrollment_date").desc(nulls_last=True))
 
 
@@ -297,6 +308,12 @@ class LearningPathEnrollment(TimeStampedModel):
         """Model options."""
 
         unique_together = ("user", "learning_path")
+        indexes = [
+            # Enrollment status of a user in a Learning Path.
+            models.Index(fields=["learning_path", "user", "is_active"], name="lp_enroll_path_user_active_idx"),
+            # Active enrollments of a user.
+            models.Index(fields=["user", "is_active"], name="lp_enroll_user_active_idx"),
+        ]
 
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     learning_path = models.ForeignKey(LearningPath, on_delete=models.CASCADE)
@@ -338,20 +355,182 @@ class LearningPathGradingCriteria(models.Model):
         """User-friendly string representation of this model."""
         return f"{self.learning_path.display_name} Grading Criteria"
 
-    def calculate_grade(self, user):
+    def calculate_grade(self, user) -> AggregateGrade:
         """
         Calculate the aggregate grade for a user across the learning path.
+
+        The grade is cached until the course grades of the user change. The cache key depends on the
+        course keys and weights of the steps, so changing the steps never returns an outdated grade.
+        When the course grades are unavailable, the grade is calculated from their last known values
+        and marked as stale.
         """
+        steps = [(step.course_key, step.weight) for step in self.learning_path.steps.all()]
+        cache_key = get_grade_cache_key(user.id, self.learning_path_id, steps)
+        if (grade := get_cached_grade(cache_key)) is not None:
+            return AggregateGrade(grade)
+
+        course_grades = get_course_grades(user, [course_key for course_key, _ in steps])
         total_weight = 0.0
         weighted_sum = 0.0
 
-        for step in self.learning_path.steps.all():
-            course_grade = get_user_course_grade(user, step.course_key)
-            course_weight = step.weight
-            weighted_sum += course_grade.percent * course_weight
+        for course_key, course_weight in steps:
+            weighted_sum += course_grades.grades[course_key] * course_weight
             total_weight += course_weight
 
-        return weighted_sum / total_weight if total_weight > 0 else 0.0
+        grade = weighted_sum / total_weight if total_weight > 0 else 0.0
+        # Do not cache grades calculated from the last known course grades.
+        if not course_grades.stale:
+            set_cached_grade(cache_key, grade)
+        return AggregateGrade(grade, stale=course_grades.stale)
+
+
+class LearningPathProgress(TimeStampedModel):
+    """
+    Materialized progress and grade of a user enrolled in a Learning Path.
+
+    The completion and grade of each course are stored, so that a change in a single course
+    only updates the contribution of the corresponding step instead of recalculating the whole Learning Path.
+
+    .. no_pii:
+    """
+
+    enrollment = models.OneToOneField(LearningPathEnrollment, related_name="progress", on_delete=models.CASCADE)
+    course_completions = models.JSONField(
+        default=dict,
+        help_text=_("Completion (0.0-1.0) of each course in the Learning Path, keyed by the course key."),
+    )
+    course_grades = models.JSONField(
+        default=dict,
+        help_text=_("Grade (0.0-1.0) of each course in the Learning Path, keyed by the course key."),
+    )
+    progress = models.FloatField(default=0.0, help_text=_("Aggregate progress (0.0-1.0) in the Learning Path."))
+    grade = models.FloatField(default=0.0, help_text=_("Aggregate grade (0.0-1.0) in the Learning Path."))
+    completed = models.BooleanField(default=False, help_text=_("Whether the required completion is reached."))
+    passed = models.BooleanField(default=False, help_text=_("Whether the required grade is reached."))
+
+    AGGREGATE_FIELDS = ["course_completions", "course_grades", "progress", "grade", "completed", "passed", "modified"]
+    # The number of rows of a Learning Path that are recalculated and saved at once.
+    UPDATE_BATCH_SIZE = 500
+
+    def __str__(self):
+        """User-friendly string representation of this model."""
+        return f"{self.enrollment}: {self.progress:.0%}"
+
+    def update_aggregates(self):
+        """
+        Recalculate the aggregate progress, grade, and flags from the stored course values.
+
+        Courses without a stored value are counted as 0.0.
+        """
+        learning_path = self.enrollment.learning_path
+        steps = list(learning_path.steps.all())
+
+        completions = [self.course_completions.get(str(step.course_key), 0.0) for step in steps]
+        self.progress = sum(completions) / len(steps) if steps else 0.0
+
+        total_weight = sum(step.weight for step in steps)
+        weighted_sum = sum(self.course_grades.get(str(step.course_key), 0.0) * step.weight for step in steps)
+        self.grade = weighted_sum / total_weight if total_weight > 0 else 0.0
+
+        try:
+            grading_criteria = learning_path.grading_criteria
+        except ObjectDoesNotExist:
+            self.completed = self.passed = False
+        else:
+            self.completed = self.progress >= grading_criteria.required_completion
+            self.passed = self.grade >= grading_criteria.required_grade
+
+    @classmethod
+    def _with_related(cls) -> models.QuerySet:
+        """Return a queryset that loads everything needed for recalculating the aggregates."""
+        return cls.objects.select_related("enrollment__learning_path__grading_criteria").prefetch_related(
+            "enrollment__learning_path__steps"
+        )
+
+    @classmethod
+    def update_course(
+        cls,
+        user_id: int,
+        course_key: CourseKey,
+        completion: float | None = None,
+        grade: float | None = None,
+    ) -> int:
+        """
+        Update the completion and/or grade of a course for a user in all their Learning Paths containing this course.
+
+        The rows of inactive enrollments are updated too, so they are current when the enrollments are reactivated.
+
+        :returns: The number of updated rows.
+        """
+        rows = list(
+            cls._with_related().filter(
+                enrollment__user_id=user_id,
+                enrollment__learning_path__steps__course_key=course_key,
+            )
+        )
+        for row in rows:
+            if completion is not None:
+                row.course_completions[str(course_key)] = completion
+            if grade is not None:
+                row.course_grades[str(course_key)] = grade
+            row.update_aggregates()
+            row.modified = now()
+
+        return cls.objects.bulk_update(rows, cls.AGGREGATE_FIELDS)
+
+    @staticmethod
+    def _add_missing_courses(rows: list["LearningPathProgress"]):
+        """
+        Retrieve the completions and grades of the courses that are not stored in the rows yet.
+
+        The values of each missing course are retrieved for all users of the rows with a single query.
+        """
+        if not rows:
+            return
+
+        for step in rows[0].enrollment.learning_path.steps.all():
+            course_key = str(step.course_key)
+            missing = [
+                row for row in rows if course_key not in row.course_completions or course_key not in row.course_grades
+            ]
+            if not missing:
+                continue
+
+            user_ids = [row.enrollment.user_id for row in missing]
+            completions = get_course_user_completions(step.course_key, user_ids)
+            grades = get_course_user_grades(step.course_key, user_ids)
+            for row in missing:
+                row.course_completions.setdefault(course_key, completions[row.enrollment.user_id])
+                row.course_grades.setdefault(course_key, grades[row.enrollment.user_id])
+
+    @classmethod
+    def update_learning_path(cls, learning_path_id: int) -> int:
+        """
+        Recalculate the aggregates of all rows of a Learning Path after its steps or grading criteria change.
+
+        The rows are processed in chunks of `UPDATE_BATCH_SIZE`. The completions and grades of courses added to
+        the Learning Path are retrieved for each chunk.
+
+        :returns: The number of updated rows.
+        """
+        rows = (
+            cls._with_related()
+            .select_related("enrollment")
+            .filter(enrollment__learning_path_id=learning_path_id)
+            .order_by("pk")
+        )
+
+        last_pk = 0
+        total = 0
+        while chunk := list(rows.filter(pk__gt=last_pk)[: cls.UPDATE_BATCH_SIZE]):
+            cls._add_missing_courses(chunk)
+            for row in chunk:
+                row.update_aggregates()
+                row.modified = now()
+            total += cls.objects.bulk_update(chunk, cls.AGGREGATE_FIELDS)
+            last_pk = chunk[-1].pk
+
+        return total
 
 
 class LearningPathEnrollmentAllowed(TimeStampedModel):
@@ -370,6 +549,10 @@ class LearningPathEnrollmentAllowed(TimeStampedModel):
         """Model options."""
 
         unique_together = ("email", "learning_path")
+        indexes = [
+            # Pending enrollments of an email (e.g., when a user registers).
+            models.Index(fields=["email", "is_active"], name="lp_allowed_email_active_idx"),
+        ]
 
     email = models.EmailField(db_index=True)
     learning_path = models.ForeignKey(LearningPath, on_delete=models.CASCADE)
@@ -392,6 +575,15 @@ class LearningPathEnrollmentAudit(TimeStampedModel):
     .. no_pii:
     """
 
+    class Meta:
+        """Model options."""
+
+        indexes = [
+            # Latest audit of an enrollment or an allowed enrollment.
+            models.Index(fields=["enrollment", "created"], name="lp_audit_enroll_created_idx"),
+            models.Index(fields=["enrollment_allowed", "created"], name="lp_audit_allowed_created_idx"),
+        ]
+
     # State transition constants (copied from edx-platform to maintain consistency)
     UNENROLLED_TO_ALLOWEDTOENROLL = "from unenrolled to allowed to enroll"
     ALLOWEDTOENROLL_TO_ENROLLED = "from allowed to enroll to enrolled"
@@ -444,3 +636,54 @@ class LearningPathEnrollmentAudit(TimeStampedModel):
             learning_path = self.enrollment_allowed.learning_path.key
 
         return f"{self.state_transition} for {enrollee} in {learning_path}"
+
+
+class BulkEnrollmentJob(TimeStampedModel):
+    """
+    Asynchronous bulk enrollment (or unenrollment) of users in learning paths.
+
+    The emails are processed in chunks by a worker. The counters, the per-row errors, and the number of processed emails
+    are saved together with the enrollments of each chunk, so an interrupted job resumes after its last processed chunk.
+
+    .. pii: The emails are kept for auditing the bulk operation.
+    .. pii_types: email_address
+    .. pii_retirement: retained
+    """
+
+    ENROLL = "enroll"
+    UNENROLL = "unenroll"
+    ACTIONS = (
+        (ENROLL, _("Enroll")),
+        (UNENROLL, _("Unenroll")),
+    )
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    STATUSES = (
+        (PENDING, _("Pending")),
+        (RUNNING, _("Running")),
+        (COMPLETED, _("Completed")),
+        (FAILED, _("Failed")),
+    )
+
+    uuid = models.UUIDField(default=uuid4, unique=True, editable=False)
+    action = models.CharField(max_length=16, choices=ACTIONS)
+    status = models.CharField(max_length=16, choices=STATUSES, default=PENDING, db_index=True)
+    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name="+")
+    learning_paths = models.JSONField(default=list, help_text=_("Keys of the learning paths."))
+    emails = models.JSONField(default=list, help_text=_("Email addresses of the users, in the order of the request."))
+    total = models.PositiveIntegerField(
+        default=0, help_text=_("Number of emails of the job, stored so that the status is read without the emails.")
+    )
+    reason = models.TextField(blank=True)
+    org = models.CharField(max_length=255, blank=True)
+    role = models.CharField(max_length=255, blank=True)
+    processed = models.PositiveIntegerField(default=0, help_text=_("Number of emails processed so far."))
+    counts = models.JSONField(default=dict, help_text=_("Counters of the processed enrollments."))
+    errors = models.JSONField(default=list, help_text=_("Errors of the processed rows."))
+
+    def __str__(self):
+        """User-friendly string representation of this model."""
+        return f"Bulk {self.action} job {self.uuid} ({self.status})"
@@ -4,15 +4,37 @@
 
 import logging
 
-from django.db import IntegrityError
-from django.db.models.signals import post_save
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, OuterRef, Subquery, Value, When
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
+from django.utils import timezone
+from openedx_events.content_authoring.signals import COURSE_CATALOG_INFO_CHANGED
+from openedx_events.learning.signals import PERSISTENT_GRADE_SUMMARY_CHANGED
 
+from learning_paths.bulk_enrollment import AUDIT_FIELDS
+from learning_paths.cache import (
+    invalidate_catalog,
+    invalidate_course_dates,
+    invalidate_learning_path_steps,
+    invalidate_user_completions,
+    invalidate_user_grades,
+)
+from learning_paths.compat import get_user_course_completions
 from learning_paths.models import (
+    AcquiredSkill,
+    LearningPath,
     LearningPathEnrollment,
     LearningPathEnrollmentAllowed,
     LearningPathEnrollmentAudit,
+    LearningPathGradingCriteria,
+    LearningPathProgress,
+    LearningPathStep,
+    RequiredSkill,
+    Skill,
 )
+from learning_paths.tasks import update_learning_path_progress
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +48,9 @@ def process_pending_enrollments(sender, instance, created, **kwargs):
     in the LearningPathEnrollmentAllowed model. This signal handler processes such
     instances and created the corresponding LearningPathEnrollment objects.
 
+    All pending enrollments are processed in a single transaction with a fixed number of queries, regardless of the
+    number of Learning Paths the user was invited to.
+
     Args:
         sender: User model class.
         instance: The actual instance being saved.
@@ -39,41 +64,65 @@ def process_pending_enrollments(sender, instance, created, **kwargs):
         return
 
     logger.info("[LearningPaths] Processing pending enrollments for user %s", instance)
-    pending_enrollments = LearningPathEnrollmentAllowed.objects.filter(email=instance.email, is_active=True)
-    enrollments_created = 0
-
-    for entry in pending_enrollments:
-        try:
-            audit_data = {
-                "enrolled_by": instance,
-                "state_transition": LearningPathEnrollmentAudit.ALLOWEDTOENROLL_TO_ENROLLED,
-            }
-            if last_allowed_audit := entry.audit.order_by("-created").first():
-                for field in ["reason", "org", "role"]:
-                    audit_data[field] = getattr(last_allowed_audit, field, "")
-
-            enrollment = LearningPathEnrollment(learning_path=entry.learning_path, user=instance)
-            enrollment._audit = audit_data  # pylint: disable=protected-access
-            enrollment.save()
-            enrollments_created += 1
-
-            # Link existing audits from the "allowed to enroll" entry to the new enrollment.
-            entry.audit.update(enrollment=enrollment)
-
-        except IntegrityError:  # pragma: no cover
-            logger.info(
-                "[LearningPaths] Enrollment already exists for user %s in the learning path %s",
-                instance,
-                entry.learning_path.key,
+    latest_audit = LearningPathEnrollmentAudit.objects.filter(enrollment_allowed=OuterRef("pk")).order_by(
+        "-created", "-pk"
+    )
+    pending_enrollments = list(
+        LearningPathEnrollmentAllowed.objects.filter(email=instance.email, is_active=True)
+        .annotate(**{field: Subquery(latest_audit.values(field)[:1]) for field in AUDIT_FIELDS})
+        .order_by("pk")
+        .values("pk", "learning_path_id", *AUDIT_FIELDS)
+    )
+    if not pending_enrollments:
+        logger.info("[LearningPaths] Processed 0 pending Learning Path enrollments for user %s.", instance)
+        return
+
+    # The enrollments and their audits are written with bulk queries, which do not send the `post_save` signals.
+    # Therefore, the audits are created here like the `create_enrollment_audit` receiver would create them.
+    learning_path_ids = [entry["learning_path_id"] for entry in pending_enrollments]
+    with transaction.atomic():
+        LearningPathEnrollment.objects.bulk_create(
+            [
+                LearningPathEnrollment(learning_path_id=learning_path_id, user=instance)
+                for learning_path_id in learning_path_ids
+            ],
+            ignore_conflicts=True,
+        )
+        # Reload the enrollments to get their IDs on all databases.
+        enrollment_ids = dict(
+            LearningPathEnrollment.objects.filter(user=instance, learning_path_id__in=learning_path_ids).values_list(
+                "learning_path_id", "pk"
             )
-        finally:
-            entry.is_active = False
-            entry.user = instance
-            entry.save()
+        )
+        LearningPathEnrollmentAudit.objects.bulk_create(
+            [
+                LearningPathEnrollmentAudit(
+                    enrollment_id=enrollment_ids[entry["learning_path_id"]],
+                    state_transition=LearningPathEnrollmentAudit.ALLOWEDTOENROLL_TO_ENROLLED,
+                    enrolled_by=instance,
+                    **{field: entry[field] or "" for field in AUDIT_FIELDS},
+                )
+                for entry in pending_enrollments
+            ]
+        )
+        # Link existing audits from the "allowed to enroll" entries to the new enrollments.
+        LearningPathEnrollmentAudit.objects.filter(
+            enrollment_allowed_id__in=[entry["pk"] for entry in pending_enrollments]
+        ).update(
+            enrollment_id=Case(
+                *(
+                    When(enrollment_allowed_id=entry["pk"], then=Value(enrollment_ids[entry["learning_path_id"]]))
+                    for entry in pending_enrollments
+                )
+            )
+        )
+        LearningPathEnrollmentAllowed.objects.filter(pk__in=[entry["pk"] for entry in pending_enrollments]).update(
+            is_active=False, user=instance, modified=timezone.now()
+        )
 
     logger.info(
         "[LearningPaths] Processed %d pending Learning Path enrollments for user %s.",
-        enrollments_created,
+        len(pending_enrollments),
         instance,
     )
 
@@ -137,3 +186,108 @@ def create_enrollment_allowed_audit(sender, instance, created, **kwargs):
     )
 
     _create_enrollment_audit(instance, audit_data)
+
+
+@receiver([post_save, post_delete], sender=LearningPathStep)
+def invalidate_learning_path_progress(sender, instance, **kwargs):
+    """Invalidate the cached progress in a learning path when its steps change."""
+    invalidate_learning_path_steps(instance.learning_path_id)
+
+
+def invalidate_user_progress(sender, instance, **kwargs):
+    """
+    Invalidate the cached progress of a user when their block completion changes.
+
+    This is connected to the block completion model of the LMS in the plugin configuration. The course completions
+    of the completion aggregator are recalculated from the block completions when they are read. The cache is
+    invalidated after the commit, so a concurrent request does not cache the completions from before the change.
+    """
+    user_id = instance.user_id
+    transaction.on_commit(lambda: invalidate_user_completions(user_id))
+
+
+@receiver(PERSISTENT_GRADE_SUMMARY_CHANGED)
+def invalidate_user_grade(sender, signal, grade, **kwargs):
+    """Invalidate the cached grades of a user after their course grade change is committed."""
+    user_id = grade.user_id
+    transaction.on_commit(lambda: invalidate_user_grades(user_id))
+
+
+@receiver([post_save, post_delete], sender=LearningPathStep)
+@receiver(post_save, sender=LearningPathGradingCriteria)
+def update_materialized_learning_path_progress(sender, instance, **kwargs):
+    """
+    Recalculate the materialized progress in a learning path when its steps or grading criteria change.
+
+    The rows of all enrollments in the learning path are recalculated by a task, after the change is committed.
+    """
+    if not settings.LEARNING_PATHS_USE_MATERIALIZED_PROGRESS:
+        return
+    learning_path_id = instance.learning_path_id
+    transaction.on_commit(lambda: update_learning_path_progress.delay(learning_path_id))
+
+
+def update_materialized_completion(sender, instance, **kwargs):
+    """
+    Update the materialized progress of a user when their block completion changes.
+
+    This is connected to the block completion model of the LMS in the plugin configuration. The completion aggregator
+    writes the course completions with raw SQL queries, which do not send any signals. Therefore, the completion of
+    the course is read (and recalculated if it is stale) after the block completion is committed.
+    """
+    if not settings.LEARNING_PATHS_USE_MATERIALIZED_PROGRESS:
+        return
+    user, course_key = instance.user, instance.context_key
+    transaction.on_commit(lambda: _update_materialized_course_completion(user, course_key))
+
+
+def _update_materialized_course_completion(user, course_key):
+    """Read the completion of a course and update the materialized progress of the user in its Learning Paths."""
+    if not LearningPathProgress.objects.filter(
+        enrollment__user_id=user.id,
+        enrollment__learning_path__steps__course_key=course_key,
+    ).exists():
+        return
+
+    completion = get_user_course_completions(user, [course_key])[course_key]
+    LearningPathProgress.update_course(user.id, course_key, completion=completion)
+
+
+@receiver(PERSISTENT_GRADE_SUMMARY_CHANGED)
+def update_materialized_grade(sender, signal, grade, **kwargs):
+    """Update the materialized grade of a user when their course grade changes."""
+    if not settings.LEARNING_PATHS_USE_MATERIALIZED_PROGRESS:
+        return
+    LearningPathProgress.update_course(grade.user_id, grade.course.course_key, grade=grade.percent_grade)
+
+
+@receiver([post_save, post_delete], sender=LearningPath)
+@receiver([post_save, post_delete], sender=LearningPathStep)
+@receiver([post_save, post_delete], sender=LearningPathGradingCriteria)
+@receiver([post_save, post_delete], sender=Skill)
+@receiver([post_save, post_delete], sender=RequiredSkill)
+@receiver([post_save, post_delete], sender=AcquiredSkill)
+def invalidate_learning_path_catalog(sender, instance, **kwargs):
+    """
+    Invalidate the cached catalog of learning paths when a learning path, its steps, criteria, or skills change.
+
+    The catalog version is also a validator of the ETags of the learning path APIs.
+    """
+    invalidate_catalog()
+
+
+@receiver(COURSE_CATALOG_INFO_CHANGED)
+def invalidate_published_course_dates(sender, signal, catalog_info, **kwargs):
+    """Invalidate the cached dates of a course and the cached catalog of learning paths when a course is published."""
+    invalidate_course_dates(catalog_info.course_key)
+    invalidate_catalog()
+
+
+def invalidate_course_overview_dates(sender, instance, **kwargs):
+    """
+    Invalidate the cached dates of a course and the cached catalog of learning paths when a course overview changes.
+
+    This is connected to the course overview model of the LMS in the plugin configuration.
+    """
+    invalidate_course_dates(instance.id)
+    invalidate_catalog()
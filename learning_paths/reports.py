@@ -0,0 +1,106 @@
+"""
+Reports of the progress of all learners enrolled in a Learning Path.
+
+The enrollments are processed in chunks. For each chunk, the completions and grades are read with a single query
+per course, so the number of queries depends on the number of steps, and the memory usage does not depend on the
+number of learners.
+"""
+
+import csv
+import json
+from collections.abc import Iterable, Iterator, Sequence
+
+from learning_paths.compat import get_course_user_completions, get_course_user_grades
+from learning_paths.models import (
+    LearningPath,
+    LearningPathEnrollment,
+    LearningPathProgress,
+)
+
+REPORT_FORMAT_CSV = "csv"
+REPORT_FORMAT_NDJSON = "ndjson"
+REPORT_FORMATS = (REPORT_FORMAT_CSV, REPORT_FORMAT_NDJSON)
+REPORT_CONTENT_TYPES = {
+    REPORT_FORMAT_CSV: "text/csv",
+    REPORT_FORMAT_NDJSON: "application/x-ndjson",
+}
+REPORT_FIELDS = ["username", "progress", "grade", "passed"]
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class _Echo:
+    """File-like object that returns the written value instead of buffering it."""
+
+    def write(self, value: str) -> str:
+        """Return the written value."""
+        return value
+
+
+def iter_progress_report(learning_path: LearningPath, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[dict]:
+    """
+    Yield the progress, grade, and pass status of each learner actively enrolled in the Learning Path.
+
+    The rows are ordered by the enrollment ID.
+    """
+    # Load the steps and grading criteria once for all enrollments.
+    learning_path = (
+        LearningPath.objects.select_related("grading_criteria").prefetch_related("steps").get(pk=learning_path.pk)
+    )
+    steps = list(learning_path.steps.all())
+
+    enrollments = (
+        LearningPathEnrollment.objects.filter(learning_path=learning_path, is_active=True)
+        .select_related("user")
+        .only("pk", "learning_path", "user__username")
+        .order_by("pk")
+    )
+
+    last_pk = 0
+    while chunk := list(enrollments.filter(pk__gt=last_pk)[:chunk_size]):
+        user_ids = [enrollment.user_id for enrollment in chunk]
+        completions = {step.course_key: get_course_user_completions(step.course_key, user_ids) for step in steps}
+        grades = {step.course_key: get_course_user_grades(step.course_key, user_ids) for step in steps}
+
+        for enrollment in chunk:
+            enrollment.learning_path = learning_path
+            progress = LearningPathProgress(
+                enrollment=enrollment,
+                course_completions={
+                    str(course_key): values[enrollment.user_id] for course_key, values in completions.items()
+                },
+                course_grades={str(course_key): values[enrollment.user_id] for course_key, values in grades.items()},
+            )
+            progress.update_aggregates()
+            yield {
+                "username": enrollment.user.username,
+                "progress": progress.progress,
+                "grade": progress.grade,
+                "passed": progress.passed,
+            }
+
+        last_pk = chunk[-1].pk
+
+
+def render_csv(rows: Iterable[dict], fieldnames: Sequence[str] | None = None) -> Iterator[str]:
+    """Render the report rows as CSV lines, starting with the header."""
+    writer = csv.DictWriter(_Echo(), fieldnames=fieldnames or REPORT_FIELDS)
+    yield writer.writeheader()
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def render_ndjson(rows: Iterable[dict]) -> Iterator[str]:
+    """Render the report rows as newline-delimited JSON objects."""
+    for row in rows:
+        yield json.dumps(row) + "\n"
+
+
+def render_report(rows: Iterable[dict], report_format: str, fieldnames: Sequence[str] | None = None) -> Iterator[str]:
+    """
+    Render the report rows in the given format.
+
+    :param fieldnames: The columns of the CSV report. Defaults to the columns of the progress report.
+    """
+    if report_format == REPORT_FORMAT_NDJSON:
+        return render_ndjson(rows)
+    return render_csv(rows, fieldnames)
@@ -13,3 +13,64 @@ def plugin_settings(settings: Settings):
     # action. Learners cannot un-enroll themselves.
     # Set this True, if the learners should be allowed to un-enroll themselves.
     settings.LEARNING_PATHS_ALLOW_SELF_UNENROLLMENT = False
+
+    # The backend used for fetching the course completions of the learning path steps:
+    # - "native": read the completions directly from the completion aggregator models (in a single query).
+    # - "http": call the completion aggregator REST API of the LMS once per course.
+    # - "http_batched": call the completion aggregator REST API of the LMS once per page of the user's courses.
+    # The "native" backend falls back to "http" when the completion aggregator is not installed.
+    settings.LEARNING_PATHS_COMPLETION_BACKEND = "native"
+    # With the "http" backend, course completions of the learning path steps are fetched concurrently.
+    # This is the maximum number of concurrent requests per learning path.
+    settings.LEARNING_PATHS_COMPLETION_MAX_WORKERS = 8
+    # The overall deadline (in seconds) for fetching the course completions of a learning path.
+    # When it is reached, the progress is calculated from the completions fetched so far and marked as incomplete.
+    settings.LEARNING_PATHS_COMPLETION_TIMEOUT = 10
+    # With the "http_batched" backend, this is the number of courses requested per page of the completion API.
+    settings.LEARNING_PATHS_COMPLETION_BATCH_SIZE = 100
+    # With the "http" and "http_batched" backends, the requests share a process-wide session that keeps
+    # the connections to the LMS alive. This is the maximum number of connections kept alive per host. It should not
+    # be lower than LEARNING_PATHS_COMPLETION_MAX_WORKERS, otherwise concurrent requests open extra connections.
+    settings.LEARNING_PATHS_COMPLETION_POOL_SIZE = 10
+    # The timeout (in seconds) of a single request to the completion API.
+    settings.LEARNING_PATHS_COMPLETION_REQUEST_TIMEOUT = 5
+
+    # The overall time budget (in seconds) for retrieving the course grades of a learning path. When it is exceeded,
+    # the remaining courses use their last known grades.
+    settings.LEARNING_PATHS_GRADE_TIMEOUT = 10
+    # The completion and grade dependencies are called through circuit breakers. After this number of consecutive
+    # failures (including exceeded deadlines), the circuit opens and the last known values are used instead.
+    settings.LEARNING_PATHS_CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+    # The number of seconds for which an open circuit stays open before the dependency is called again.
+    settings.LEARNING_PATHS_CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 30
+    # The number of seconds for which the last known course completions and grades of each user are kept.
+    # They are returned (marked as stale) when the corresponding dependency is unavailable.
+    settings.LEARNING_PATHS_LAST_KNOWN_VALUE_TIMEOUT = 7 * 24 * 60 * 60
+
+    # The number of seconds for which the serialized catalog of learning paths (shared by all users) is cached.
+    # The cache is invalidated when a learning path, its steps, or its grading criteria change.
+    # Set this to 0 to disable the cache.
+    settings.LEARNING_PATHS_CATALOG_CACHE_TIMEOUT = 300
+    # Whether to serialize the learning path list, detail, and programs APIs from plain `values()` dicts instead of
+    # the DRF serializers. Both produce the same JSON.
+    settings.LEARNING_PATHS_FAST_SERIALIZATION = True
+    # The default and maximum page sizes of the APIs paginated with a cursor (`pagination=cursor`).
+    settings.LEARNING_PATHS_CURSOR_PAGE_SIZE = 100
+    settings.LEARNING_PATHS_CURSOR_MAX_PAGE_SIZE = 1000
+    # The number of emails processed (and saved) at once by the asynchronous bulk enrollment jobs.
+    settings.LEARNING_PATHS_BULK_ENROLLMENT_CHUNK_SIZE = 1000
+    # The number of seconds for which the course dates of the learning path steps are cached in each process.
+    # The cache is invalidated when a course is published. Set this to 0 to disable the cache.
+    settings.LEARNING_PATHS_COURSE_DATES_CACHE_TIMEOUT = 300
+    # The number of seconds for which the aggregate progress of a user in a learning path is cached.
+    # The cache is invalidated when the steps of the learning path or the course completions of the user change.
+    # Set this to 0 to disable the cache.
+    settings.LEARNING_PATHS_PROGRESS_CACHE_TIMEOUT = 300
+    # The number of seconds for which the aggregate grade of a user in a learning path is cached.
+    # The cache is invalidated when the course grades of the user change. Set this to 0 to disable the cache.
+    settings.LEARNING_PATHS_GRADE_CACHE_TIMEOUT = 300
+
+    # Serve the progress and grade APIs from the materialized LearningPathProgress table when a row exists
+    # for the enrollment. The rows are updated by the completion and grade signals only while this is enabled,
+    # so (re)build them with the `rebuild_learning_path_progress` management command after enabling it.
+    settings.LEARNING_PATHS_USE_MATERIALIZED_PROGRESS = False
@@ -0,0 +1,25 @@
+"""
+Celery tasks of the learning_paths app.
+"""
+
+from celery import shared_task
+
+from learning_paths.bulk_enrollment import run_bulk_enrollment_job
+from learning_paths.models import LearningPathProgress
+
+
+@shared_task(acks_late=True, reject_on_worker_lost=True)
+def process_bulk_enrollment_job(job_id: int):
+    """
+    Process a bulk enrollment job.
+
+    The task is acknowledged after it finishes, so it is delivered again if the worker dies. The job then resumes after
+    its last processed chunk.
+    """
+    run_bulk_enrollment_job(job_id)
+
+
+@shared_task
+def update_learning_path_progress(learning_path_id: int):
+    """Recalculate the materialized progress of all enrollments in a Learning Path after its steps change."""
+    LearningPathProgress.update_learning_path(learning_path_id)
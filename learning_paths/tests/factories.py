@@ -11,6 +11,7 @@ from learning_paths.models import (
     LearningPathEnrollmentAllowed,
     LearningPathEnrollmentAudit,
     LearningPathGradingCriteria,
+    LearningPathProgress,
     LearningPathStep,
     RequiredSkill,
     Skill,
@@ -148,3 +149,14 @@ class LearningPathEnrollmentAuditFactory(factory.django.DjangoModelFactory):
 
     class Meta:
         model = LearningPathEnrollmentAudit
+
+
+class LearningPathProgressFactory(factory.django.DjangoModelFactory):
+    """
+    Factory for LearningPathProgress model.
+    """
+
+    enrollment = factory.SubFactory(LearningPathEnrollmentFactory)
+
+    class Meta:
+        model = LearningPathProgress
@@ -0,0 +1,429 @@
+"""Tests for the bulk enrollment module."""
+
+# pylint: disable=redefined-outer-name
+
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from learning_paths.bulk_enrollment import (
+    bulk_enroll,
+    bulk_unenroll,
+    get_bulk_enroll_diff,
+    get_bulk_unenroll_diff,
+    get_invalid_emails,
+    get_valid_emails,
+    iter_bulk_operation_report,
+    run_bulk_enrollment_job,
+)
+from learning_paths.models import (
+    BulkEnrollmentJob,
+    LearningPathEnrollment,
+    LearningPathEnrollmentAllowed,
+    LearningPathEnrollmentAudit,
+)
+
+from .factories import (
+    LearningPathEnrollmentAllowedFactory,
+    LearningPathEnrollmentFactory,
+    LearningPathFactory,
+    UserFactory,
+)
+
+
+@pytest.fixture
+def staff_user():
+    """Create the staff user that runs the bulk operations."""
+    return UserFactory(is_staff=True)
+
+
+@pytest.fixture
+def audit_data(staff_user):
+    """Audit data of the bulk operations."""
+    return {"enrolled_by": staff_user, "reason": "Reason", "org": "Org", "role": "Role"}
+
+
+@pytest.fixture
+def learning_paths():
+    """Create learning paths for the bulk operations."""
+    return LearningPathFactory.create_batch(2)
+
+
+def test_get_valid_emails():
+    """Test that invalid emails are skipped, and valid ones keep their order and duplicates."""
+    emails = ["b@example.com", "invalid", "a@example.com", "", "b@example.com", "invalid"]
+
+    assert get_valid_emails(emails) == ["b@example.com", "a@example.com", "b@example.com"]
+
+
+@pytest.mark.django_db
+def test_get_invalid_emails():
+    """Test that the invalid emails of users are not reported, because these users are still enrolled."""
+    user = UserFactory(email="user@localhost")
+
+    assert get_invalid_emails(["valid@example.com", "invalid", user.email, "invalid"]) == {"invalid"}
+
+
+@pytest.mark.django_db
+class TestBulkEnroll:
+    """Tests for the `bulk_enroll` function."""
+
+    def test_counts_and_audits(self, learning_paths, audit_data, staff_user):
+        """Test that new, inactive, and active enrollments and allowed enrollments are counted and audited."""
+        new_user, inactive_user, active_user = UserFactory.create_batch(3)
+        LearningPathEnrollmentFactory(user=inactive_user, learning_path=learning_paths[0], is_active=False)
+        active_enrollment = LearningPathEnrollmentFactory(user=active_user, learning_path=learning_paths[0])
+        modified = active_enrollment.modified
+        LearningPathEnrollmentAllowedFactory(
+            email="inactive@example.com", learning_path=learning_paths[0], is_active=False
+        )
+        LearningPathEnrollmentAllowedFactory(
+            email="registered@example.com", learning_path=learning_paths[0], is_active=False, user=UserFactory()
+        )
+        LearningPathEnrollmentAudit.objects.all().delete()
+        emails = [
+            new_user.email,
+            inactive_user.email,
+            active_user.email,
+            "new@example.com",
+            "inactive@example.com",
+            "registered@example.com",
+            "invalid",
+        ]
+
+        counts = bulk_enroll(learning_paths, emails, audit_data)
+
+        # 3 users x 2 paths, except for the active enrollment.
+        assert counts["enrollments_created"] == 5
+        # 3 emails x 2 paths, except for the inactive allowed enrollment of the registered user.
+        assert counts["enrollment_allowed_created"] == 5
+        assert LearningPathEnrollment.objects.filter(is_active=True).count() == 6
+        assert not LearningPathEnrollmentAllowed.objects.filter(email="invalid").exists()
+        assert not LearningPathEnrollmentAllowed.objects.get(
+            email="registered@example.com", learning_path=learning_paths[0]
+        ).is_active
+        active_enrollment.refresh_from_db()
+        assert active_enrollment.modified > modified
+
+        audits = LearningPathEnrollmentAudit.objects.all()
+        assert audits.count() == 12
+        assert audits.filter(state_transition=LearningPathEnrollmentAudit.ENROLLED_TO_ENROLLED).get().enrollment == (
+            active_enrollment
+        )
+        assert audits.filter(state_transition=LearningPathEnrollmentAudit.UNENROLLED_TO_ENROLLED).count() == 5
+        assert audits.filter(state_transition=LearningPathEnrollmentAudit.UNENROLLED_TO_ALLOWEDTOENROLL).count() == 6
+        assert set(audits.values_list("enrolled_by", "reason", "org", "role")) == {
+            (staff_user.id, "Reason", "Org", "Role")
+        }
+
+    def test_audit_values_copied_from_latest_audit(self, learning_paths, staff_user):
+        """Test that the missing audit values are copied from the latest audit of each record."""
+        enrollment = LearningPathEnrollmentFactory(learning_path=learning_paths[0], is_active=False)
+        allowed = LearningPathEnrollmentAllowedFactory(email="allowed@example.com", learning_path=learning_paths[0])
+        for record in (enrollment, allowed):
+            record.audit.all().delete()
+            record.audit.create(reason="Old reason", org="Old org", role="Old role")
+            record.audit.create(reason="Latest reason", org="Latest org", role="")
+
+        bulk_enroll(
+            [learning_paths[0]], [enrollment.user.email, allowed.email], {"enrolled_by": staff_user, "org": "Org"}
+        )
+
+        for record in (enrollment, allowed):
+            latest_audit = record.audit.order_by("-created").first()
+            assert (latest_audit.reason, latest_audit.org, latest_audit.role) == ("Latest reason", "Org", "")
+
+    def test_case_variants_of_emails(self, learning_paths, audit_data):
+        """Test that the case variants of an email get a single allowed enrollment in each learning path."""
+        user = UserFactory(email="user@example.com")
+        emails = ["new@example.com", "New@Example.com", "NEW@example.com", user.email, user.email.upper()]
+
+        counts = bulk_enroll(learning_paths, emails, audit_data)
+        diff = get_bulk_enroll_diff(learning_paths, emails)
+
+        assert counts["enrollment_allowed_created"] == 2
+        allowed_enrollments = LearningPathEnrollmentAllowed.objects.all()
+        assert sorted(allowed_enrollments.values_list("learning_path_id", "email")) == [
+            (learning_path.id, "NEW@example.com") for learning_path in learning_paths
+        ]
+        for allowed in allowed_enrollments:
+            assert allowed.audit.get().state_transition == LearningPathEnrollmentAudit.UNENROLLED_TO_ALLOWEDTOENROLL
+        assert diff["made_allowed"] == 0
+
+    def test_query_count_is_constant(self, learning_paths, audit_data):
+        """Test that the number of queries does not depend on the number of users and learning paths."""
+        query_counts = []
+        for batch in range(2):
+            users = UserFactory.create_batch(3 + 10 * batch)
+            for user in users[::2]:
+                LearningPathEnrollmentFactory(user=user, learning_path=learning_paths[0], is_active=False)
+            emails = [user.email for user in users] + [f"new{batch}_{i}@example.com" for i in range(3 + 10 * batch)]
+
+            with CaptureQueriesContext(connection) as queries:
+                bulk_enroll(learning_paths, emails, audit_data)
+            query_counts.append(len(queries))
+
+        assert query_counts[0] == query_counts[1]
+
+
+@pytest.mark.django_db
+class TestBulkUnenroll:
+    """Tests for the `bulk_unenroll` function."""
+
+    def test_counts_and_audits(self, learning_paths, audit_data):
+        """Test that active and inactive enrollments and allowed enrollments are counted and audited."""
+        active_user, inactive_user, not_enrolled_user = UserFactory.create_batch(3)
+        LearningPathEnrollmentFactory(user=active_user, learning_path=learning_paths[0])
+        LearningPathEnrollmentFactory(user=inactive_user, learning_path=learning_paths[0], is_active=False)
+        LearningPathEnrollmentAllowedFactory(email="active@example.com", learning_path=learning_paths[1])
+        LearningPathEnrollmentAllowedFactory(
+            email="inactive@example.com", learning_path=learning_paths[1], is_active=False
+        )
+        LearningPathEnrollmentAudit.objects.all().delete()
+        emails = [
+            active_user.email,
+            inactive_user.email,
+            not_enrolled_user.email,
+            "active@example.com",
+            "inactive@example.com",
+            "active@example.com",
+            "invalid",
+        ]
+
+        counts = bulk_unenroll(learning_paths, emails, audit_data)
+
+        assert counts == {"enrollments_unenrolled": 1, "enrollment_allowed_deactivated": 1}
+        assert not LearningPathEnrollment.objects.filter(is_active=True).exists()
+        assert not LearningPathEnrollmentAllowed.objects.filter(is_active=True).exists()
+        audits = LearningPathEnrollmentAudit.objects.values_list("state_transition", flat=True)
+        assert sorted(audits) == sorted(
+            [
+                LearningPathEnrollmentAudit.ENROLLED_TO_UNENROLLED,
+                LearningPathEnrollmentAudit.UNENROLLED_TO_UNENROLLED,
+                LearningPathEnrollmentAudit.ALLOWEDTOENROLL_TO_UNENROLLED,
+                LearningPathEnrollmentAudit.UNENROLLED_TO_UNENROLLED,
+                # The repeated email is audited again.
+                LearningPathEnrollmentAudit.UNENROLLED_TO_UNENROLLED,
+            ]
+        )
+
+    def test_query_count_is_constant(self, learning_paths, audit_data):
+        """Test that the number of queries does not depend on the number of users and learning paths."""
+        query_counts = []
+        for batch in range(2):
+            users = UserFactory.create_batch(3 + 10 * batch)
+            for user in users:
+                LearningPathEnrollmentFactory(user=user, learning_path=learning_paths[0])
+            emails = [f"allowed{batch}_{i}@example.com" for i in range(3 + 10 * batch)]
+            for email in emails:
+                LearningPathEnrollmentAllowedFactory(email=email, learning_path=learning_paths[1])
+
+            with CaptureQueriesContext(connection) as queries:
+                bulk_unenroll(learning_paths, [user.email for user in users] + emails, audit_data)
+            query_counts.append(len(queries))
+
+        assert query_counts[0] == query_counts[1]
+
+
+@pytest.mark.django_db
+class TestRunBulkEnrollmentJob:
+    """Tests for the `run_bulk_enrollment_job` function."""
+
+    @staticmethod
+    def create_job(learning_paths, staff_user, action, emails) -> BulkEnrollmentJob:
+        """Create a pending bulk enrollment job."""
+        return BulkEnrollmentJob.objects.create(
+            action=action,
+            created_by=staff_user,
+            learning_paths=[str(learning_path.key) for learning_path in learning_paths],
+            emails=emails,
+            reason="Reason",
+        )
+
+    def test_enroll_in_chunks(self, learning_paths, staff_user):
+        """Test that the emails are enrolled in chunks, with the same counters as a single bulk enrollment."""
+        user = UserFactory()
+        emails = [user.email, "invalid", "new@example.com", user.email, "invalid"]
+        job = self.create_job(learning_paths, staff_user, BulkEnrollmentJob.ENROLL, emails)
+
+        run_bulk_enrollment_job(job.id, chunk_size=2)
+
+        job.refresh_from_db()
+        assert job.status == BulkEnrollmentJob.COMPLETED
+        assert job.processed == 5
+        assert job.counts == {"enrollments_created": 2, "enrollment_allowed_created": 2}
+        assert [error["row"] for error in job.errors] == [1, 4]
+        # The repeated email is enrolled only once.
+        assert LearningPathEnrollmentAudit.objects.filter(enrollment__user=user).count() == 2
+        assert set(LearningPathEnrollmentAudit.objects.values_list("enrolled_by", "reason")) == {
+            (staff_user.id, "Reason")
+        }
+
+    def test_unenroll(self, learning_paths, staff_user):
+        """Test that the emails are unenrolled."""
+        enrollment = LearningPathEnrollmentFactory(learning_path=learning_paths[0])
+        job = self.create_job(learning_paths, staff_user, BulkEnrollmentJob.UNENROLL, [enrollment.user.email])
+
+        run_bulk_enrollment_job(job.id)
+
+        job.refresh_from_db()
+        enrollment.refresh_from_db()
+        assert not enrollment.is_active
+        assert job.status == BulkEnrollmentJob.COMPLETED
+        assert job.counts == {"enrollments_unenrolled": 1, "enrollment_allowed_deactivated": 0}
+
+    def test_resume_after_failure(self, learning_paths, staff_user):
+        """Test that an interrupted job resumes after its last processed chunk."""
+        emails = [f"user{i}@example.com" for i in range(5)]
+        job = self.create_job(learning_paths, staff_user, BulkEnrollmentJob.ENROLL, emails)
+
+        with (
+            patch("learning_paths.bulk_enrollment.bulk_enroll", side_effect=[{}, RuntimeError]) as mock_bulk_enroll,
+            pytest.raises(RuntimeError),
+        ):
+            run_bulk_enrollment_job(job.id, chunk_size=2)
+
+        job.refresh_from_db()
+        assert job.status == BulkEnrollmentJob.FAILED
+        assert job.processed == 2
+        assert mock_bulk_enroll.call_count == 2
+
+        run_bulk_enrollment_job(job.id, chunk_size=2)
+
+        job.refresh_from_db()
+        assert job.status == BulkEnrollmentJob.COMPLETED
+        assert job.processed == 5
+        assert set(LearningPathEnrollmentAllowed.objects.values_list("email", flat=True)) == set(emails[2:])
+        assert job.counts == {"enrollments_created": 0, "enrollment_allowed_created": 6}
+
+    def test_completed_job_is_not_processed_again(self, learning_paths, staff_user):
+        """Test that running a completed job again does not change the enrollments."""
+        job = self.create_job(learning_paths, staff_user, BulkEnrollmentJob.ENROLL, ["new@example.com"])
+        run_bulk_enrollment_job(job.id)
+
+        with patch("learning_paths.bulk_enrollment.bulk_enroll") as mock_bulk_enroll:
+            run_bulk_enrollment_job(job.id)
+
+        mock_bulk_enroll.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestIterBulkOperationReport:
+    """Tests for the `iter_bulk_operation_report` function."""
+
+    def test_processes_stream_in_chunks(self, learning_paths, audit_data):
+        """Test that the emails are consumed and processed one chunk at a time."""
+        user = UserFactory()
+        consumed = []
+
+        def iter_emails():
+            for email in [user.email, "new@example.com", "invalid"]:
+                consumed.append(email)
+                yield email
+
+        report = iter_bulk_operation_report(BulkEnrollmentJob.ENROLL, learning_paths, iter_emails(), audit_data, 2)
+
+        assert next(report) == {"row": 0, "email": user.email, "result": "enrolled", "error": ""}
+        assert len(consumed) == 2
+        assert LearningPathEnrollment.objects.filter(user=user).count() == 2
+        assert list(report) == [
+            {"row": 1, "email": "new@example.com", "result": "allowed", "error": ""},
+            {"row": 2, "email": "invalid", "result": "invalid", "error": "Invalid email address."},
+        ]
+
+    def test_unenroll(self, learning_paths, audit_data):
+        """Test that the users and the allowed emails are reported as unenrolled."""
+        enrollment = LearningPathEnrollmentFactory(learning_path=learning_paths[0])
+
+        report = iter_bulk_operation_report(
+            BulkEnrollmentJob.UNENROLL, learning_paths, [enrollment.user.email, "new@example.com"], audit_data, 10
+        )
+
+        assert [row["result"] for row in report] == ["unenrolled", "unenrolled"]
+        enrollment.refresh_from_db()
+        assert not enrollment.is_active
+
+
+@pytest.mark.django_db
+class TestBulkOperationDiff:
+    """Tests for the `get_bulk_enroll_diff` and `get_bulk_unenroll_diff` functions."""
+
+    @pytest.fixture
+    def emails(self, learning_paths):
+        """Create enrollments and allowed enrollments in various states, and get the emails of the bulk operations."""
+        new_user, inactive_user, active_user = UserFactory.create_batch(3)
+        LearningPathEnrollmentFactory(user=inactive_user, learning_path=learning_paths[0], is_active=False)
+        LearningPathEnrollmentFactory(user=active_user, learning_path=learning_paths[0])
+        LearningPathEnrollmentAllowedFactory(email="active@example.com", learning_path=learning_paths[0])
+        LearningPathEnrollmentAllowedFactory(
+            email="inactive@example.com", learning_path=learning_paths[0], is_active=False
+        )
+        LearningPathEnrollmentAllowedFactory(
+            email="registered@example.com", learning_path=learning_paths[0], is_active=False, user=UserFactory()
+        )
+        return [
+            new_user.email,
+            inactive_user.email,
+            active_user.email,
+            "new@example.com",
+            "active@example.com",
+            "inactive@example.com",
+            "registered@example.com",
+            "invalid",
+            "invalid",
+        ]
+
+    def test_enroll_diff(self, learning_paths, emails, audit_data):
+        """Test that the diff has the counters of the bulk enrollment, and that nothing is written."""
+        with CaptureQueriesContext(connection) as queries:
+            diff = get_bulk_enroll_diff(learning_paths, emails)
+
+        assert all(query["sql"].startswith("SELECT") for query in queries)
+        assert diff == {
+            "enrollments_created": 5,
+            "enrollment_allowed_created": 6,
+            "newly_enrolled": 4,
+            "reactivated": 1,
+            "already_enrolled": 1,
+            "made_allowed": 6,
+            "invalid": 1,
+        }
+        assert bulk_enroll(learning_paths, emails, audit_data) == {
+            "enrollments_created": diff["enrollments_created"],
+            "enrollment_allowed_created": diff["enrollment_allowed_created"],
+        }
+
+    def test_unenroll_diff(self, learning_paths, emails, audit_data):
+        """Test that the diff has the counters of the bulk unenrollment, and that nothing is written."""
+        with CaptureQueriesContext(connection) as queries:
+            diff = get_bulk_unenroll_diff(learning_paths, emails)
+
+        assert all(query["sql"].startswith("SELECT") for query in queries)
+        assert diff == {
+            "enrollments_unenrolled": 1,
+            "enrollment_allowed_deactivated": 1,
+            "already_unenrolled": 1,
+            "invalid": 1,
+        }
+        assert bulk_unenroll(learning_paths, emails, audit_data) == {
+            "enrollments_unenrolled": diff["enrollments_unenrolled"],
+            "enrollment_allowed_deactivated": diff["enrollment_allowed_deactivated"],
+        }
+
+    @pytest.mark.parametrize("get_diff", [get_bulk_enroll_diff, get_bulk_unenroll_diff])
+    def test_query_count_is_constant(self, learning_paths, get_diff):
+        """Test that the number of queries does not depend on the number of emails and learning paths."""
+        query_counts = []
+        for batch in range(2):
+            users = UserFactory.create_batch(2 + 5 * batch)
+            for user in users[::2]:
+                LearningPathEnrollmentFactory(user=user, learning_path=learning_paths[0])
+            emails = [user.email for user in users] + [f"new{batch}_{i}@example.com" for i in range(2 + 5 * batch)]
+
+            with CaptureQueriesContext(connection) as queries:
+                get_diff(learning_paths[: batch + 1], emails)
+            query_counts.append(len(queries))
+
+        assert query_counts[0] == query_counts[1]
@@ -0,0 +1,198 @@
+"""Tests for the cache module."""
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from opaque_keys.edx.keys import CourseKey
+
+from learning_paths.cache import (
+    get_cached_course_dates,
+    get_cached_grade,
+    get_cached_progress,
+    get_course_dates_versions,
+    get_grade_cache_key,
+    get_progress_cache_key,
+    grade_cache_stats,
+    invalidate_course_dates,
+    invalidate_learning_path_steps,
+    invalidate_user_completions,
+    progress_cache_stats,
+    set_cached_course_dates,
+    set_cached_grade,
+    set_cached_progress,
+)
+
+
+class TestProgressCache:
+    """Tests for the progress cache."""
+
+    def test_cache_key_is_stable(self):
+        """Test that the cache key does not change until the cache is invalidated."""
+        assert get_progress_cache_key(1, 2) == get_progress_cache_key(1, 2)
+
+    @pytest.mark.parametrize(
+        "invalidate, arg",
+        [(invalidate_learning_path_steps, 2), (invalidate_user_completions, 1)],
+    )
+    def test_invalidation_changes_cache_key(self, invalidate, arg):
+        """Test that invalidating the steps or the completions changes the cache key."""
+        cache_key = get_progress_cache_key(1, 2)
+        set_cached_progress(cache_key, 0.5)
+
+        invalidate(arg)
+
+        new_cache_key = get_progress_cache_key(1, 2)
+        assert new_cache_key != cache_key
+        assert get_cached_progress(new_cache_key) is None
+
+    def test_invalidation_does_not_affect_other_entries(self):
+        """Test that invalidating the completions of a user does not affect other users."""
+        cache_key = get_progress_cache_key(1, 2)
+
+        invalidate_user_completions(3)
+
+        assert get_progress_cache_key(1, 2) == cache_key
+
+    def test_hit_and_miss_counters(self):
+        """Test that the cache hits and misses are counted."""
+        cache_key = get_progress_cache_key(1, 2)
+        hits, misses = progress_cache_stats["hits"], progress_cache_stats["misses"]
+
+        assert get_cached_progress(cache_key) is None
+        set_cached_progress(cache_key, 0.5)
+        assert get_cached_progress(cache_key) == 0.5
+
+        assert progress_cache_stats["hits"] == hits + 1
+        assert progress_cache_stats["misses"] == misses + 1
+
+    def test_max_age(self):
+        """Test that the cached progress older than `max_age` is not returned."""
+        cache_key = get_progress_cache_key(1, 2)
+        with patch("learning_paths.cache.time.time", return_value=1000):
+            set_cached_progress(cache_key, 0.5)
+
+        with patch("learning_paths.cache.time.time", return_value=1010):
+            assert get_cached_progress(cache_key) == 0.5
+            assert get_cached_progress(cache_key, max_age=10) == 0.5
+            assert get_cached_progress(cache_key, max_age=9) is None
+
+    def test_disabled_cache(self, settings):
+        """Test that nothing is cached when the cache timeout is 0."""
+        settings.LEARNING_PATHS_PROGRESS_CACHE_TIMEOUT = 0
+        cache_key = get_progress_cache_key(1, 2)
+
+        set_cached_progress(cache_key, 0.5)
+
+        assert get_cached_progress(cache_key) is None
+
+
+class TestGradeCache:
+    """Tests for the grade cache."""
+
+    STEPS = [("course-v1:edX+DemoX+Course_1", 1.0), ("course-v1:edX+DemoX+Course_2", 0.5)]
+
+    def test_cache_key_does_not_depend_on_step_order(self):
+        """Test that the cache key does not depend on the order of the steps."""
+        assert get_grade_cache_key(1, 2, self.STEPS) == get_grade_cache_key(1, 2, reversed(self.STEPS))
+
+    @pytest.mark.parametrize(
+        "steps",
+        [
+            [("course-v1:edX+DemoX+Course_1", 1.0), ("course-v1:edX+DemoX+Course_2", 1.0)],
+            [("course-v1:edX+DemoX+Course_1", 1.0)],
+            [],
+        ],
+    )
+    def test_cache_key_depends_on_steps(self, steps):
+        """Test that changing the steps or their weights changes the cache key."""
+        assert get_grade_cache_key(1, 2, self.STEPS) != get_grade_cache_key(1, 2, steps)
+
+    def test_hit_and_miss_counters(self):
+        """Test that the grade is cached and the cache hits and misses are counted."""
+        cache_key = get_grade_cache_key(1, 2, self.STEPS)
+        hits, misses = grade_cache_stats["hits"], grade_cache_stats["misses"]
+
+        assert get_cached_grade(cache_key) is None
+        set_cached_grade(cache_key, 0.8)
+        assert get_cached_grade(cache_key) == 0.8
+
+        assert grade_cache_stats["hits"] == hits + 1
+        assert grade_cache_stats["misses"] == misses + 1
+
+
+class TestCourseDatesCache:
+    """Tests for the process-local cache of course dates."""
+
+    COURSE_KEY = CourseKey.from_string("course-v1:edX+DemoX+Demo_Course")
+    OTHER_COURSE_KEY = CourseKey.from_string("course-v1:edX+DemoX+Other_Course")
+    DATES = (datetime(2024, 1, 1, tzinfo=timezone.utc), None)
+
+    def _get_cached_dates(self, *course_keys):
+        """Retrieve the cached dates of the courses with their current versions."""
+        return get_cached_course_dates(get_course_dates_versions(course_keys))
+
+    def _set_cached_dates(self, course_dates):
+        """Cache the course dates with their current versions."""
+        set_cached_course_dates(course_dates, get_course_dates_versions(course_dates))
+
+    def test_cached_dates(self):
+        """Test that only the cached course dates are returned."""
+        self._set_cached_dates({self.COURSE_KEY: self.DATES})
+
+        assert self._get_cached_dates(self.COURSE_KEY, self.OTHER_COURSE_KEY) == {self.COURSE_KEY: self.DATES}
+
+    def test_dates_expire(self, settings):
+        """Test that the cached course dates expire after the timeout."""
+        settings.LEARNING_PATHS_COURSE_DATES_CACHE_TIMEOUT = 10
+        with patch("learning_paths.cache.time.monotonic", return_value=100):
+            self._set_cached_dates({self.COURSE_KEY: self.DATES})
+
+        with patch("learning_paths.cache.time.monotonic", return_value=109):
+            assert self._get_cached_dates(self.COURSE_KEY) == {self.COURSE_KEY: self.DATES}
+        with patch("learning_paths.cache.time.monotonic", return_value=110):
+            assert not self._get_cached_dates(self.COURSE_KEY)
+
+    def test_disabled_cache(self, settings):
+        """Test that the course dates are not cached when the timeout is 0."""
+        settings.LEARNING_PATHS_COURSE_DATES_CACHE_TIMEOUT = 0
+
+        self._set_cached_dates({self.COURSE_KEY: self.DATES})
+
+        assert not get_course_dates_versions([self.COURSE_KEY])
+        assert not self._get_cached_dates(self.COURSE_KEY)
+
+    def test_invalidate_course(self):
+        """Test that invalidating a course does not affect the cached dates of other courses."""
+        self._set_cached_dates({self.COURSE_KEY: self.DATES, self.OTHER_COURSE_KEY: self.DATES})
+
+        invalidate_course_dates(self.COURSE_KEY)
+
+        assert self._get_cached_dates(self.COURSE_KEY, self.OTHER_COURSE_KEY) == {self.OTHER_COURSE_KEY: self.DATES}
+
+    def test_invalidate_course_in_other_process(self):
+        """Test that the dates cached in other processes are outdated after the course is invalidated."""
+        self._set_cached_dates({self.COURSE_KEY: self.DATES})
+
+        # Another process only bumps the version in the shared cache.
+        with patch.dict("learning_paths.cache._course_dates_cache", clear=True):
+            invalidate_course_dates(self.COURSE_KEY)
+
+        assert not self._get_cached_dates(self.COURSE_KEY)
+
+    def test_dates_retrieved_during_invalidation_are_outdated(self):
+        """Test that the dates retrieved before a course is invalidated are stored with the outdated version."""
+        versions = get_course_dates_versions([self.COURSE_KEY])
+
+        invalidate_course_dates(self.COURSE_KEY)
+        set_cached_course_dates({self.COURSE_KEY: self.DATES}, versions)
+
+        assert not self._get_cached_dates(self.COURSE_KEY)
+
+    def test_invalidate_all_courses(self):
+        """Test that all course dates cached in this process can be cleared."""
+        self._set_cached_dates({self.COURSE_KEY: self.DATES, self.OTHER_COURSE_KEY: self.DATES})
+
+        invalidate_course_dates()
+
+        assert not self._get_cached_dates(self.COURSE_KEY, self.OTHER_COURSE_KEY)
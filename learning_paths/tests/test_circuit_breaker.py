@@ -0,0 +1,62 @@
+# pylint: disable=redefined-outer-name
+"""Tests for the circuit breakers."""
+
+import pytest
+from django.core.cache import cache
+
+from learning_paths.circuit_breaker import CircuitBreaker
+
+
+@pytest.fixture
+def breaker(settings):
+    """Create a circuit breaker that opens after 2 failures."""
+    settings.LEARNING_PATHS_CIRCUIT_BREAKER_FAILURE_THRESHOLD = 2
+    return CircuitBreaker("test")
+
+
+def test_closed_by_default(breaker):
+    """Test that requests are allowed while no failures are recorded."""
+    assert breaker.allow_request()
+
+
+def test_opens_after_threshold(breaker):
+    """Test that the circuit opens after the failure threshold is reached."""
+    breaker.record_failure()
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert not breaker.allow_request()
+
+
+def test_success_resets_failures(breaker):
+    """Test that a success resets the count of consecutive failures."""
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.allow_request()
+
+
+def test_trial_failure_reopens(breaker):
+    """Test that a single failure after the recovery timeout opens the circuit again."""
+    breaker.record_failure()
+    breaker.record_failure()
+    # Simulate the expiration of the recovery timeout.
+    cache.delete(breaker.open_cache_key)
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+
+    assert not breaker.allow_request()
+
+
+def test_trial_success_closes(breaker):
+    """Test that a success after the recovery timeout closes the circuit."""
+    breaker.record_failure()
+    breaker.record_failure()
+    cache.delete(breaker.open_cache_key)
+
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.allow_request()
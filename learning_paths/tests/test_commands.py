@@ -0,0 +1,207 @@
+# pylint: disable=redefined-outer-name,unused-argument
+"""Tests for the management commands."""
+
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import call, patch
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+from opaque_keys.edx.keys import CourseKey
+
+from learning_paths.models import BulkEnrollmentJob, LearningPathProgress
+
+from .factories import (
+    LearningPathEnrollmentFactory,
+    LearningPathFactory,
+    LearningPathProgressFactory,
+    LearningPathStepFactory,
+)
+
+COURSE_KEY = "course-v1:edX+DemoX+Demo_Course"
+
+
+@pytest.fixture
+def mock_course_values():
+    """Mock the bulk course completions and grades retrieved from edx-platform."""
+    with (
+        patch(
+            "learning_paths.management.commands.rebuild_learning_path_progress.get_course_user_completions",
+            side_effect=lambda course_key, user_ids, **kwargs: dict.fromkeys(user_ids, 0.9),
+        ) as mock_completions,
+        patch(
+            "learning_paths.management.commands.rebuild_learning_path_progress.get_course_user_grades",
+            side_effect=lambda course_key, user_ids: dict.fromkeys(user_ids, 0.8),
+        ),
+    ):
+        yield mock_completions
+
+
+@pytest.mark.django_db
+class TestRebuildLearningPathProgress:
+    """Tests for the rebuild_learning_path_progress management command."""
+
+    @pytest.fixture
+    def learning_path(self):
+        """Create a learning path with a single step."""
+        learning_path = LearningPathFactory()
+        LearningPathStepFactory(learning_path=learning_path, course_key=COURSE_KEY)
+        return learning_path
+
+    def test_rebuild_in_chunks(self, learning_path, mock_course_values):
+        """Test that the progress of all active enrollments is built in chunks."""
+        enrollments = LearningPathEnrollmentFactory.create_batch(3, learning_path=learning_path)
+        LearningPathEnrollmentFactory(learning_path=learning_path, is_active=False)
+
+        call_command("rebuild_learning_path_progress", chunk_size=2)
+
+        assert LearningPathProgress.objects.count() == 3
+        for enrollment in enrollments:
+            progress = enrollment.progress
+            assert progress.course_completions == {COURSE_KEY: 0.9}
+            assert progress.course_grades == {COURSE_KEY: 0.8}
+            assert progress.progress == 0.9
+            assert progress.grade == 0.8
+            assert progress.completed is True
+            assert progress.passed is True
+
+    def test_rebuild_updates_existing_rows(self, learning_path, mock_course_values):
+        """Test that the existing rows are replaced with the recalculated values."""
+        progress = LearningPathProgressFactory(
+            enrollment__learning_path=learning_path, course_completions={COURSE_KEY: 0.1}, progress=0.1
+        )
+
+        call_command("rebuild_learning_path_progress")
+
+        progress.refresh_from_db()
+        assert progress.progress == 0.9
+        assert LearningPathProgress.objects.count() == 1
+
+    def test_rebuild_single_learning_path(self, learning_path, mock_course_values):
+        """Test that only the selected learning path is rebuilt."""
+        enrollment = LearningPathEnrollmentFactory(learning_path=learning_path)
+        LearningPathEnrollmentFactory()
+
+        call_command("rebuild_learning_path_progress", learning_paths=[str(learning_path.key)])
+
+        assert list(LearningPathProgress.objects.values_list("enrollment", flat=True)) == [enrollment.pk]
+        mock_course_values.assert_called_once_with(
+            CourseKey.from_string(COURSE_KEY), [enrollment.user_id], recalculate_stale=True
+        )
+
+    def test_rebuild_retrieves_course_values_per_chunk(self, learning_path, mock_course_values):
+        """Test that the values of each course are retrieved once per chunk, with the stale ones recalculated."""
+        enrollments = LearningPathEnrollmentFactory.create_batch(3, learning_path=learning_path)
+
+        call_command("rebuild_learning_path_progress", chunk_size=2)
+
+        course_key = CourseKey.from_string(COURSE_KEY)
+        assert mock_course_values.call_args_list == [
+            call(course_key, [enrollments[0].user_id, enrollments[1].user_id], recalculate_stale=True),
+            call(course_key, [enrollments[2].user_id], recalculate_stale=True),
+        ]
+
+
+@pytest.mark.django_db
+class TestExportLearningPathProgress:
+    """Tests for the export_learning_path_progress management command."""
+
+    @pytest.fixture(autouse=True)
+    def mock_course_values(self):
+        """Mock the bulk course completions and grades retrieved from edx-platform."""
+        with (
+            patch(
+                "learning_paths.reports.get_course_user_completions",
+                side_effect=lambda course_key, user_ids: dict.fromkeys(user_ids, 0.5),
+            ),
+            patch(
+                "learning_paths.reports.get_course_user_grades",
+                side_effect=lambda course_key, user_ids: dict.fromkeys(user_ids, 0.8),
+            ),
+        ):
+            yield
+
+    @pytest.fixture
+    def enrollment(self):
+        """Create an enrollment in a learning path with a single step."""
+        enrollment = LearningPathEnrollmentFactory()
+        LearningPathStepFactory(learning_path=enrollment.learning_path, course_key=COURSE_KEY)
+        return enrollment
+
+    def test_export_csv(self, enrollment):
+        """Test that the report is written to the standard output as CSV by default."""
+        out = StringIO()
+
+        call_command("export_learning_path_progress", str(enrollment.learning_path.key), stdout=out)
+
+        assert out.getvalue().splitlines() == [
+            "username,progress,grade,passed",
+            f"{enrollment.user.username},0.5,0.8,True",
+        ]
+
+    def test_export_ndjson_to_file(self, enrollment, tmp_path):
+        """Test that the report is written to the output file as NDJSON."""
+        output = tmp_path / "report.ndjson"
+
+        call_command(
+            "export_learning_path_progress",
+            str(enrollment.learning_path.key),
+            "--format",
+            "ndjson",
+            "--output",
+            str(output),
+        )
+
+        assert [json.loads(line) for line in output.read_text().splitlines()] == [
+            {"username": enrollment.user.username, "progress": 0.5, "grade": 0.8, "passed": True}
+        ]
+
+    def test_missing_learning_path(self):
+        """Test that an error is raised when the learning path does not exist."""
+        with pytest.raises(CommandError):
+            call_command("export_learning_path_progress", "path-v1:test+missing+run+group")
+
+
+@pytest.mark.django_db
+class TestResumeBulkEnrollmentJobs:
+    """Tests for the `resume_bulk_enrollment_jobs` management command."""
+
+    @staticmethod
+    def create_job(status: str, minutes_ago: int) -> BulkEnrollmentJob:
+        """Create a bulk enrollment job that was last updated the given number of minutes ago."""
+        job = BulkEnrollmentJob.objects.create(
+            action=BulkEnrollmentJob.ENROLL,
+            status=status,
+            learning_paths=[str(LearningPathFactory().key)],
+            emails=["user@example.com"],
+        )
+        BulkEnrollmentJob.objects.filter(pk=job.pk).update(modified=timezone.now() - timedelta(minutes=minutes_ago))
+        return job
+
+    @pytest.mark.parametrize(
+        ("include_failed", "expected_statuses"),
+        [
+            (False, [BulkEnrollmentJob.COMPLETED, BulkEnrollmentJob.COMPLETED, BulkEnrollmentJob.FAILED]),
+            (True, [BulkEnrollmentJob.COMPLETED, BulkEnrollmentJob.COMPLETED, BulkEnrollmentJob.COMPLETED]),
+        ],
+    )
+    def test_resumes_stale_jobs(self, include_failed, expected_statuses):
+        """Test that the stale pending, running, and optionally failed jobs are processed again."""
+        stale_jobs = [
+            self.create_job(BulkEnrollmentJob.PENDING, 20),
+            self.create_job(BulkEnrollmentJob.RUNNING, 20),
+            self.create_job(BulkEnrollmentJob.FAILED, 20),
+        ]
+        recent_job = self.create_job(BulkEnrollmentJob.RUNNING, 1)
+        out = StringIO()
+
+        args = ["--include-failed"] if include_failed else []
+        call_command("resume_bulk_enrollment_jobs", *args, stdout=out)
+
+        for job in stale_jobs + [recent_job]:
+            job.refresh_from_db()
+        assert [job.status for job in stale_jobs] == expected_statuses
+        assert recent_job.status == BulkEnrollmentJob.RUNNING
+        assert f"Resumed {2 + include_failed} bulk enrollment jobs." in out.getvalue()
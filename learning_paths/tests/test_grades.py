@@ -0,0 +1,74 @@
+# pylint: disable=redefined-outer-name,unused-argument
+"""Tests for the retrieval of course grades."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from django.db import DatabaseError
+from opaque_keys.edx.keys import CourseKey
+
+from learning_paths.cache import set_last_known_values
+from learning_paths.circuit_breaker import grade_circuit_breaker
+from learning_paths.grades import CourseGrades, get_course_grades
+
+COURSE_KEYS = [CourseKey.from_string(f"course-v1:edX+DemoX+Course_{i}") for i in range(2)]
+
+
+@pytest.fixture
+def mock_get_user_course_grade():
+    """Mock the course grades retrieved from edx-platform."""
+    with patch("learning_paths.grades.get_user_course_grade", return_value=Mock(percent=0.8)) as mock:
+        yield mock
+
+
+@pytest.mark.django_db
+class TestGetCourseGrades:
+    """Tests for get_course_grades."""
+
+    def test_get_course_grades(self, user, mock_get_user_course_grade):
+        """Test that the current grades are returned."""
+        assert get_course_grades(user, COURSE_KEYS) == CourseGrades(dict.fromkeys(COURSE_KEYS, 0.8))
+
+    def test_failure_uses_last_known_grade(self, user, mock_get_user_course_grade):
+        """Test that the last known grade is used when retrieving a grade fails."""
+        get_course_grades(user, COURSE_KEYS)
+        mock_get_user_course_grade.side_effect = [Mock(percent=0.9), DatabaseError("Unavailable")]
+
+        assert get_course_grades(user, COURSE_KEYS) == CourseGrades(
+            {COURSE_KEYS[0]: 0.9, COURSE_KEYS[1]: 0.8}, stale=True
+        )
+
+    def test_failure_without_last_known_grade(self, user, mock_get_user_course_grade):
+        """Test that the grade is 0.0 when it cannot be retrieved and no value is known."""
+        mock_get_user_course_grade.side_effect = DatabaseError("Unavailable")
+
+        assert get_course_grades(user, COURSE_KEYS[:1]) == CourseGrades({COURSE_KEYS[0]: 0.0}, stale=True)
+
+    def test_unexpected_error_is_raised(self, user, mock_get_user_course_grade):
+        """Test that errors other than an unavailable grade dependency are not replaced with the last known grade."""
+        mock_get_user_course_grade.side_effect = TypeError("Bug")
+
+        with pytest.raises(TypeError):
+            get_course_grades(user, COURSE_KEYS)
+
+    def test_open_circuit_skips_dependency(self, user, settings, mock_get_user_course_grade):
+        """Test that the grades are not retrieved while the circuit is open."""
+        settings.LEARNING_PATHS_CIRCUIT_BREAKER_FAILURE_THRESHOLD = 1
+        set_last_known_values("grade", user.id, {COURSE_KEYS[0]: 0.5})
+        grade_circuit_breaker.record_failure()
+
+        assert get_course_grades(user, COURSE_KEYS) == CourseGrades(
+            {COURSE_KEYS[0]: 0.5, COURSE_KEYS[1]: 0.0}, stale=True
+        )
+        mock_get_user_course_grade.assert_not_called()
+
+    def test_time_budget(self, user, settings, mock_get_user_course_grade):
+        """Test that the remaining grades are not retrieved after the time budget is exceeded."""
+        settings.LEARNING_PATHS_GRADE_TIMEOUT = 0
+        set_last_known_values("grade", user.id, {COURSE_KEYS[1]: 0.5})
+
+        with patch("learning_paths.grades.time.monotonic", side_effect=[0, 0, 1]):
+            course_grades = get_course_grades(user, COURSE_KEYS)
+
+        assert course_grades == CourseGrades({COURSE_KEYS[0]: 0.8, COURSE_KEYS[1]: 0.5}, stale=True)
+        mock_get_user_course_grade.assert_called_once()
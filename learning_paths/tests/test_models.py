@@ -4,24 +4,35 @@ Tests for the learning_paths models.
 """
 
 import re
+from unittest.mock import Mock, patch
 
 import pytest
 from django.core.exceptions import ValidationError
 from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.db import IntegrityError
+from django.db import DatabaseError, IntegrityError, connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from opaque_keys.edx.keys import CourseKey
 from slugify import slugify
 
+from learning_paths.cache import invalidate_user_grades
 from learning_paths.keys import LearningPathKey
 from learning_paths.models import (
     LearningPath,
+    LearningPathEnrollment,
     LearningPathEnrollmentAllowed,
     LearningPathEnrollmentAudit,
+    LearningPathProgress,
 )
 
 from .factories import (
     LearningPathEnrollmentAllowedFactory,
     LearningPathEnrollmentAuditFactory,
+    LearningPathEnrollmentFactory,
+    LearningPathFactory,
+    LearningPathProgressFactory,
+    LearningPathStepFactory,
 )
 
 
@@ -146,6 +157,162 @@ class TestLearningPath:
         assert criteria.required_grade == 0.75
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "model, columns",
+    [
+        (LearningPathEnrollment, ["learning_path_id", "user_id", "is_active"]),
+        (LearningPathEnrollment, ["user_id", "is_active"]),
+        (LearningPathEnrollmentAllowed, ["email", "is_active"]),
+        (LearningPathEnrollmentAudit, ["enrollment_id", "created"]),
+        (LearningPathEnrollmentAudit, ["enrollment_allowed_id", "created"]),
+    ],
+)
+def test_composite_indexes(model, columns):
+    """Test that the composite indexes used by the enrollment lookups exist in the database."""
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+
+    assert any(constraint["index"] and constraint["columns"] == columns for constraint in constraints.values())
+
+
+@pytest.mark.django_db
+class TestLearningPathManager:
+    """Tests for the LearningPathManager."""
+
+    @pytest.fixture
+    def paths(self, user):
+        """Create public and invite-only learning paths with active, inactive, and foreign enrollments."""
+        paths = {
+            "public": LearningPathFactory(invite_only=False),
+            "public_enrolled": LearningPathFactory(invite_only=False),
+            "invite_only": LearningPathFactory(invite_only=True),
+            "invite_only_enrolled": LearningPathFactory(invite_only=True),
+            "invite_only_inactive": LearningPathFactory(invite_only=True),
+        }
+        LearningPathEnrollmentFactory(user=user, learning_path=paths["invite_only_enrolled"])
+        LearningPathEnrollmentFactory(user=user, learning_path=paths["public_enrolled"])
+        LearningPathEnrollmentFactory(user=user, learning_path=paths["invite_only_inactive"], is_active=False)
+        LearningPathEnrollmentFactory(learning_path=paths["invite_only"])
+        LearningPathEnrollmentFactory(learning_path=paths["public"])
+        return paths
+
+    def test_visible_paths_and_ordering(self, user, paths):
+        """Test that the enrolled paths come first (the most recent first), followed by the visible public paths."""
+        visible_paths = list(LearningPath.objects.get_paths_visible_to_user(user))
+
+        assert visible_paths == [paths["public_enrolled"], paths["invite_only_enrolled"], paths["public"]]
+        assert [path.enrollment_date for path in visible_paths] == [
+            paths["public_enrolled"].learningpathenrollment_set.get(user=user).created,
+            paths["invite_only_enrolled"].learningpathenrollment_set.get(user=user).created,
+            None,
+        ]
+
+    def test_staff_sees_all_paths(self, user, paths):
+        """Test that staff users see all paths, with the enrollment dates of their own enrollments only."""
+        user.is_staff = True
+
+        visible_paths = list(LearningPath.objects.get_paths_visible_to_user(user))
+
+        assert len(visible_paths) == len(paths)
+        assert [path.enrollment_date is not None for path in visible_paths] == [True, True, False, False, False]
+
+    def test_single_join_without_subquery(self, user, paths):
+        """Test that the paths and their enrollment dates are selected with a join instead of a subquery."""
+        with CaptureQueriesContext(connection) as queries:
+            list(LearningPath.objects.get_paths_visible_to_user(user))
+
+        sql = queries.captured_queries[0]["sql"]
+        assert sql.count("SELECT") == 1
+        assert "LEFT OUTER JOIN" in sql
+
+    def test_lean_count(self, user, paths):
+        """Test that counting the visible paths skips the ordering and the enrollment date."""
+        with CaptureQueriesContext(connection) as queries:
+            assert LearningPath.objects.get_paths_visible_to_user(user).count() == 3
+
+        sql = queries.captured_queries[0]["sql"]
+        assert sql.count("SELECT") == 1
+        assert "ORDER BY" not in sql
+
+
+@pytest.mark.django_db
+class TestLearningPathGradingCriteria:
+    """Tests for the LearningPathGradingCriteria model."""
+
+    @pytest.fixture
+    def mock_get_user_course_grade(self):
+        """Mock the course grades retrieved from edx-platform."""
+        grades = {"course-v1:edX+DemoX+Course_1": 1.0, "course-v1:edX+DemoX+Course_2": 0.5}
+        with patch("learning_paths.grades.get_user_course_grade") as mock_grade:
+            mock_grade.side_effect = lambda user, course_key: Mock(percent=grades[str(course_key)])
+            yield mock_grade
+
+    @pytest.fixture
+    def steps(self, learning_path):
+        """Create the steps of the learning path."""
+        return [
+            LearningPathStepFactory(learning_path=learning_path, course_key="course-v1:edX+DemoX+Course_1", weight=1),
+            LearningPathStepFactory(learning_path=learning_path, course_key="course-v1:edX+DemoX+Course_2", weight=0.5),
+        ]
+
+    def test_calculate_grade(self, user, learning_path, steps, mock_get_user_course_grade):
+        """Test that the grade is the weighted mean of the course grades."""
+        assert learning_path.grading_criteria.calculate_grade(user).grade == pytest.approx(1.25 / 1.5)
+
+    def test_calculate_grade_without_steps(self, user, learning_path, mock_get_user_course_grade):
+        """Test that the grade of a learning path without steps is 0.0."""
+        assert learning_path.grading_criteria.calculate_grade(user).grade == 0.0
+
+    def test_grade_is_cached(self, user, learning_path, steps, mock_get_user_course_grade):
+        """Test that the course grades are read only once."""
+        grading_criteria = learning_path.grading_criteria
+        assert grading_criteria.calculate_grade(user) == grading_criteria.calculate_grade(user)
+        assert mock_get_user_course_grade.call_count == len(steps)
+
+    def test_stale_grade_is_not_cached(self, user, learning_path, steps, mock_get_user_course_grade):
+        """Test that the grade calculated from the last known course grades is not cached."""
+        grading_criteria = learning_path.grading_criteria
+        grading_criteria.calculate_grade(user)
+        invalidate_user_grades(user.id)
+        mock_get_user_course_grade.side_effect = DatabaseError("Unavailable")
+
+        aggregate_grade = grading_criteria.calculate_grade(user)
+        assert aggregate_grade.grade == pytest.approx(1.25 / 1.5)
+        assert aggregate_grade.stale is True
+        grading_criteria.calculate_grade(user)
+        assert mock_get_user_course_grade.call_count == 3 * len(steps)
+
+    def test_grade_change_invalidates_cache(self, user, learning_path, steps, mock_get_user_course_grade):
+        """Test that the grade is recalculated after the course grades of the user change."""
+        grading_criteria = learning_path.grading_criteria
+        grading_criteria.calculate_grade(user)
+
+        invalidate_user_grades(user.id)
+        grading_criteria.calculate_grade(user)
+
+        assert mock_get_user_course_grade.call_count == 2 * len(steps)
+
+    def test_weight_change_invalidates_cache(self, user, learning_path, steps, mock_get_user_course_grade):
+        """Test that the cached grade is never returned for a different set of weights."""
+        grading_criteria = learning_path.grading_criteria
+        grading_criteria.calculate_grade(user)
+
+        steps[1].weight = 1
+        steps[1].save()
+
+        assert grading_criteria.calculate_grade(user).grade == 0.75
+
+    def test_step_removal_invalidates_cache(self, user, learning_path, steps, mock_get_user_course_grade):
+        """Test that the cached grade is never returned for a different set of steps."""
+        grading_criteria = learning_path.grading_criteria
+        grading_criteria.calculate_grade(user)
+
+        steps[1].delete()
+
+        assert grading_criteria.calculate_grade(user).grade == 1.0
+
+
 @pytest.mark.django_db
 class TestLearningPathEnrollmentAllowed:
     """Tests for the LearningPathEnrollmentAllowed model."""
@@ -204,3 +371,139 @@ class TestLearningPathEnrollmentAudit:
         audit = LearningPathEnrollmentAuditFactory()
         expected_str = f"{LearningPathEnrollmentAudit.DEFAULT_TRANSITION_STATE} for unknown in unknown"
         assert str(audit) == expected_str
+
+
+@pytest.mark.django_db
+class TestLearningPathProgress:
+    """Tests for the LearningPathProgress model."""
+
+    COURSE_1 = "course-v1:edX+DemoX+Course_1"
+    COURSE_2 = "course-v1:edX+DemoX+Course_2"
+
+    @pytest.fixture
+    def progress(self, user, learning_path):
+        """Create the materialized progress of a user in a learning path with two steps."""
+        LearningPathStepFactory(learning_path=learning_path, course_key=self.COURSE_1, weight=1)
+        LearningPathStepFactory(learning_path=learning_path, course_key=self.COURSE_2, weight=0.5)
+        enrollment = LearningPathEnrollmentFactory(user=user, learning_path=learning_path)
+        return LearningPathProgressFactory(enrollment=enrollment)
+
+    def test_update_aggregates(self, progress):
+        """Test that the aggregates are calculated from the course values."""
+        progress.course_completions = {self.COURSE_1: 1.0, self.COURSE_2: 0.6}
+        progress.course_grades = {self.COURSE_1: 0.9}
+
+        progress.update_aggregates()
+
+        assert progress.progress == pytest.approx(0.8)
+        assert progress.grade == pytest.approx(0.6)
+        assert progress.completed is True
+        assert progress.passed is False
+
+    def test_update_aggregates_without_grading_criteria(self, progress):
+        """Test that the flags are not set when the learning path has no grading criteria."""
+        progress.enrollment.learning_path.grading_criteria.delete()
+        progress.enrollment.learning_path.refresh_from_db()
+        progress.course_completions = {self.COURSE_1: 1.0, self.COURSE_2: 1.0}
+
+        progress.update_aggregates()
+
+        assert progress.progress == 1.0
+        assert progress.completed is False
+
+    def test_update_course(self, user, progress, django_assert_num_queries):
+        """Test that a course change updates only its contribution, in a fixed number of queries."""
+        progress.course_completions = {self.COURSE_2: 0.5}
+        progress.save()
+        other_path_progress = LearningPathProgressFactory(enrollment__user=user)
+
+        with django_assert_num_queries(3):
+            updated = LearningPathProgress.update_course(user.id, CourseKey.from_string(self.COURSE_1), completion=1.0)
+
+        assert updated == 1
+        progress.refresh_from_db()
+        assert progress.course_completions == {self.COURSE_1: 1.0, self.COURSE_2: 0.5}
+        assert progress.progress == 0.75
+        other_path_progress.refresh_from_db()
+        assert other_path_progress.course_completions == {}
+
+    def test_update_course_grade(self, user, progress):
+        """Test that a course grade change updates the aggregate grade."""
+        LearningPathProgress.update_course(user.id, CourseKey.from_string(self.COURSE_2), grade=0.9)
+
+        progress.refresh_from_db()
+        assert progress.course_grades == {self.COURSE_2: 0.9}
+        assert progress.grade == pytest.approx(0.3)
+
+    def test_update_course_includes_inactive_enrollments(self, user, progress):
+        """Test that the progress of inactive enrollments is updated, so it is current after a reactivation."""
+        progress.enrollment.is_active = False
+        progress.enrollment.save()
+
+        assert LearningPathProgress.update_course(user.id, CourseKey.from_string(self.COURSE_1), completion=1.0) == 1
+
+        progress.refresh_from_db()
+        assert progress.progress == 0.5
+
+    @override_settings(LEARNING_PATHS_USE_MATERIALIZED_PROGRESS=True)
+    def test_step_change_updates_learning_path(self, progress, django_capture_on_commit_callbacks):
+        """Test that removing a step recalculates the aggregates of the learning path after the commit."""
+        progress.course_completions = {self.COURSE_1: 1.0}
+        progress.course_grades = {self.COURSE_1: 0.0}
+        progress.update_aggregates()
+        progress.save()
+        assert progress.progress == 0.5
+
+        with django_capture_on_commit_callbacks(execute=True):
+            progress.enrollment.learning_path.steps.get(course_key=self.COURSE_2).delete()
+
+        progress.refresh_from_db()
+        assert progress.progress == 1.0
+        assert progress.completed is True
+
+    @patch("learning_paths.models.get_course_user_grades")
+    @patch("learning_paths.models.get_course_user_completions")
+    @override_settings(LEARNING_PATHS_USE_MATERIALIZED_PROGRESS=True)
+    def test_added_step_retrieves_course_values(
+        self, mock_completions, mock_grades, progress, django_capture_on_commit_callbacks
+    ):
+        """Test that adding a step retrieves the completion and grade of the new course for each user."""
+        user = progress.enrollment.user
+        progress.course_completions = {self.COURSE_1: 1.0, self.COURSE_2: 1.0}
+        progress.course_grades = {self.COURSE_1: 1.0, self.COURSE_2: 1.0}
+        progress.save()
+        course_3 = CourseKey.from_string("course-v1:edX+DemoX+Course_3")
+        mock_completions.return_value = {user.id: 0.4}
+        mock_grades.return_value = {user.id: 0.7}
+
+        with django_capture_on_commit_callbacks(execute=True):
+            LearningPathStepFactory(learning_path=progress.enrollment.learning_path, course_key=course_3, weight=0.5)
+
+        mock_completions.assert_called_once_with(course_3, [user.id])
+        mock_grades.assert_called_once_with(course_3, [user.id])
+        progress.refresh_from_db()
+        assert progress.course_completions[str(course_3)] == 0.4
+        assert progress.course_grades[str(course_3)] == 0.7
+        assert progress.progress == pytest.approx(0.8)
+        assert progress.grade == pytest.approx(0.925)
+
+    @patch.object(LearningPathProgress, "UPDATE_BATCH_SIZE", 1)
+    def test_update_learning_path_in_chunks(self, progress, django_assert_num_queries):
+        """Test that the rows of a learning path are recalculated in chunks."""
+        other_progress = LearningPathProgressFactory(enrollment__learning_path=progress.enrollment.learning_path)
+        for row in (progress, other_progress):
+            row.course_completions = {self.COURSE_1: 1.0, self.COURSE_2: 1.0}
+            row.course_grades = {self.COURSE_1: 1.0, self.COURSE_2: 1.0}
+            row.save()
+
+        # Each chunk: the rows, their steps, and the update. The last query finds no more rows.
+        with django_assert_num_queries(7):
+            updated = LearningPathProgress.update_learning_path(progress.enrollment.learning_path_id)
+
+        assert updated == 2
+        other_progress.refresh_from_db()
+        assert other_progress.progress == 1.0
+
+    def test_string_representation(self, progress):
+        """Test the string representation."""
+        assert str(progress) == f"{progress.enrollment}: 0%"
@@ -1,20 +1,43 @@
 # pylint: disable=redefined-outer-name
 """Tests for the signals module."""
 
+from unittest.mock import Mock, patch
+
 import pytest
 from django.contrib.auth import get_user_model
-
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from opaque_keys.edx.keys import CourseKey
+
+from learning_paths.cache import (
+    get_cached_course_dates,
+    get_catalog_version,
+    get_course_dates_versions,
+    get_grade_cache_key,
+    get_progress_cache_key,
+    set_cached_course_dates,
+)
 from learning_paths.models import (
     LearningPathEnrollment,
     LearningPathEnrollmentAllowed,
     LearningPathEnrollmentAudit,
 )
-from learning_paths.receivers import process_pending_enrollments
+from learning_paths.receivers import (
+    invalidate_course_overview_dates,
+    invalidate_user_grade,
+    invalidate_user_progress,
+    process_pending_enrollments,
+    update_materialized_completion,
+    update_materialized_grade,
+)
 
 from .factories import (
     LearningPathEnrollmentAllowedFactory,
     LearningPathEnrollmentFactory,
     LearningPathFactory,
+    LearningPathProgressFactory,
+    LearningPathStepFactory,
     UserFactory,
 )
 
@@ -113,6 +136,57 @@ def test_process_pending_enrollments_only_processes_active_records(user_email, l
     assert inactive_entry.user is None
 
 
+@pytest.mark.django_db
+def test_process_pending_enrollments_links_audits_to_enrollments(user_email, learning_paths):
+    """
+    GIVEN that there are LearningPathEnrollmentAllowed objects with multiple audits for an email
+    WHEN the process_pending_enrollments signal handler is triggered
+    THEN the audits of each allowed enrollment are linked to the enrollment in the same learning path
+    AND the audit data of each enrollment is copied from the latest audit of the allowed enrollment
+    """
+    for learning_path in learning_paths:
+        entry = LearningPathEnrollmentAllowedFactory(email=user_email, learning_path=learning_path)
+        entry.audit.all().delete()
+        entry.audit.create(reason="Old reason", org="Old org")
+        entry.audit.create(reason=f"Reason {learning_path.pk}", org="Org")
+
+    user = UserFactory(email=user_email)
+    process_pending_enrollments(sender=User, instance=user, created=True)
+
+    for learning_path in learning_paths:
+        enrollment = LearningPathEnrollment.objects.get(user=user, learning_path=learning_path)
+        assert set(
+            enrollment.audit.exclude(enrollment_allowed=None).values_list(
+                "enrollment_allowed__learning_path", flat=True
+            )
+        ) == {learning_path.pk}
+        audit = enrollment.audit.get(enrollment_allowed=None)
+        assert (audit.reason, audit.org, audit.role) == (f"Reason {learning_path.pk}", "Org", "")
+
+
+@pytest.mark.django_db
+def test_process_pending_enrollments_query_count_is_constant(learning_paths):
+    """
+    GIVEN that users are invited to different numbers of learning paths
+    WHEN the process_pending_enrollments signal handler is triggered
+    THEN the number of queries does not depend on the number of pending enrollments
+    """
+    query_counts = []
+    for count in (1, 5):
+        email = f"user{count}@example.com"
+        for learning_path in [*learning_paths, *LearningPathFactory.create_batch(count - 1)][:count]:
+            LearningPathEnrollmentAllowedFactory(email=email, learning_path=learning_path, _audit={"reason": "Reason"})
+        user = UserFactory(email=email)
+
+        with CaptureQueriesContext(connection) as queries:
+            process_pending_enrollments(sender=User, instance=user, created=True)
+        query_counts.append(len(queries))
+
+        assert LearningPathEnrollment.objects.filter(user=user).count() == count
+
+    assert query_counts[0] == query_counts[1]
+
+
 @pytest.mark.django_db
 def test_process_pending_enrollments_when_no_pending_enrollments(user_email):
     """
@@ -281,3 +355,164 @@ class TestEnrollmentAuditReceivers:
         assert latest_audit.org == initial_payload["org"]
         assert latest_audit.role == "TestRole"
         assert latest_audit.state_transition == LearningPathEnrollmentAudit.UNENROLLED_TO_ALLOWEDTOENROLL
+
+
+@pytest.mark.django_db
+class TestProgressCacheInvalidation:
+    """Tests for the receivers that invalidate the cached progress."""
+
+    @pytest.fixture
+    def learning_path(self):
+        """Create a learning path for testing."""
+        return LearningPathFactory()
+
+    def test_step_save_invalidates_progress(self, user, learning_path):
+        """Test that adding or changing a step invalidates the cached progress in the learning path."""
+        cache_key = get_progress_cache_key(user.id, learning_path.id)
+        step = LearningPathStepFactory(learning_path=learning_path)
+        assert get_progress_cache_key(user.id, learning_path.id) != cache_key
+
+        cache_key = get_progress_cache_key(user.id, learning_path.id)
+        step.weight = 0.5
+        step.save()
+        assert get_progress_cache_key(user.id, learning_path.id) != cache_key
+
+    def test_step_delete_invalidates_progress(self, user, learning_path):
+        """Test that removing a step invalidates the cached progress in the learning path."""
+        step = LearningPathStepFactory(learning_path=learning_path)
+        cache_key = get_progress_cache_key(user.id, learning_path.id)
+
+        step.delete()
+
+        assert get_progress_cache_key(user.id, learning_path.id) != cache_key
+
+    def test_completion_change_invalidates_progress(self, user, learning_path, django_capture_on_commit_callbacks):
+        """Test that a completion change invalidates the cached progress of the user after the commit."""
+        other_user = UserFactory()
+        cache_key = get_progress_cache_key(user.id, learning_path.id)
+        other_cache_key = get_progress_cache_key(other_user.id, learning_path.id)
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            invalidate_user_progress(sender=Mock(), instance=Mock(user_id=user.id))
+        assert get_progress_cache_key(user.id, learning_path.id) == cache_key
+
+        callbacks[0]()
+
+        assert get_progress_cache_key(user.id, learning_path.id) != cache_key
+        assert get_progress_cache_key(other_user.id, learning_path.id) == other_cache_key
+
+
+@pytest.mark.django_db
+def test_grade_change_invalidates_grades(django_capture_on_commit_callbacks):
+    """Test that a course grade change invalidates the cached grades of the user after the commit."""
+    cache_key = get_grade_cache_key(1, 2, [])
+    other_cache_key = get_grade_cache_key(3, 2, [])
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        invalidate_user_grade(sender=None, signal=None, grade=Mock(user_id=1))
+    assert get_grade_cache_key(1, 2, []) == cache_key
+
+    callbacks[0]()
+
+    assert get_grade_cache_key(1, 2, []) != cache_key
+    assert get_grade_cache_key(3, 2, []) == other_cache_key
+
+
+def test_course_overview_change_invalidates_course_dates():
+    """Test that a course overview change invalidates the cached dates of the course and the catalog."""
+    course_key = CourseKey.from_string("course-v1:edX+DemoX+Demo_Course")
+    set_cached_course_dates({course_key: (None, None)}, get_course_dates_versions([course_key]))
+    catalog_version = get_catalog_version()
+
+    invalidate_course_overview_dates(sender=Mock(), instance=Mock(id=course_key))
+
+    assert not get_cached_course_dates(get_course_dates_versions([course_key]))
+    assert get_catalog_version() != catalog_version
+
+
+@pytest.mark.django_db
+@patch("learning_paths.receivers.LearningPathProgress.update_course")
+class TestMaterializedProgressReceivers:
+    """Tests for the receivers that update the materialized progress."""
+
+    COURSE_KEY = CourseKey.from_string("course-v1:edX+DemoX+Demo_Course")
+
+    @pytest.fixture(autouse=True)
+    def enable_materialized_progress(self, settings):
+        """Enable the materialized progress."""
+        settings.LEARNING_PATHS_USE_MATERIALIZED_PROGRESS = True
+
+    @patch("learning_paths.receivers.get_user_course_completions")
+    def test_block_completion_change(
+        self, mock_get_completions, mock_update_course, django_capture_on_commit_callbacks
+    ):
+        """Test that a block completion change updates the completion of the course after the commit."""
+        step = LearningPathStepFactory(course_key=self.COURSE_KEY)
+        user = LearningPathProgressFactory(enrollment__learning_path=step.learning_path).enrollment.user
+        mock_get_completions.return_value = {self.COURSE_KEY: 0.5}
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            update_materialized_completion(sender=Mock(), instance=Mock(user=user, context_key=self.COURSE_KEY))
+        mock_get_completions.assert_not_called()
+
+        callbacks[0]()
+
+        mock_get_completions.assert_called_once_with(user, [self.COURSE_KEY])
+        mock_update_course.assert_called_once_with(user.id, self.COURSE_KEY, completion=0.5)
+
+    @patch("learning_paths.receivers.get_user_course_completions")
+    def test_block_completion_change_without_progress(
+        self, mock_get_completions, mock_update_course, django_capture_on_commit_callbacks
+    ):
+        """Test that the completion is not read for courses outside of the Learning Paths of the user."""
+        progress = LearningPathProgressFactory()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            update_materialized_completion(
+                sender=Mock(), instance=Mock(user=progress.enrollment.user, context_key=self.COURSE_KEY)
+            )
+
+        mock_get_completions.assert_not_called()
+        mock_update_course.assert_not_called()
+
+    def test_course_grade_change(self, mock_update_course):
+        """Test that a course grade change updates the grade of the course."""
+        grade = Mock(user_id=1, course=Mock(course_key=self.COURSE_KEY), percent_grade=0.8)
+
+        update_materialized_grade(sender=None, signal=None, grade=grade)
+
+        mock_update_course.assert_called_once_with(1, self.COURSE_KEY, grade=0.8)
+
+    @patch("learning_paths.receivers.update_learning_path_progress")
+    def test_step_change_schedules_task(self, mock_task, _mock_update_course, django_capture_on_commit_callbacks):
+        """Test that a step change schedules the recalculation of the learning path after the commit."""
+        step = LearningPathStepFactory()
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            step.delete()
+        mock_task.delay.assert_not_called()
+
+        callbacks[0]()
+
+        mock_task.delay.assert_called_once_with(step.learning_path_id)
+
+    @override_settings(LEARNING_PATHS_USE_MATERIALIZED_PROGRESS=False)
+    @patch("learning_paths.receivers.update_learning_path_progress")
+    @patch("learning_paths.receivers.get_user_course_completions")
+    def test_receivers_disabled(
+        self, mock_get_completions, mock_task, mock_update_course, django_capture_on_commit_callbacks
+    ):
+        """Test that nothing is updated when the materialized progress is disabled."""
+        step = LearningPathStepFactory(course_key=self.COURSE_KEY)
+        user = LearningPathProgressFactory(enrollment__learning_path=step.learning_path).enrollment.user
+
+        with django_capture_on_commit_callbacks(execute=True):
+            update_materialized_completion(sender=Mock(), instance=Mock(user=user, context_key=self.COURSE_KEY))
+            update_materialized_grade(
+                sender=None, signal=None, grade=Mock(user_id=user.id, course=Mock(course_key=self.COURSE_KEY))
+            )
+            step.delete()
+
+        mock_get_completions.assert_not_called()
+        mock_task.delay.assert_not_called()
+        mock_update_course.assert_not_called()
@@ -0,0 +1,110 @@
+# pylint: disable=redefined-outer-name,unused-argument
+"""Tests for the Learning Path progress reports."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from learning_paths.reports import iter_progress_report, render_csv, render_ndjson
+
+from .factories import (
+    LearningPathEnrollmentFactory,
+    LearningPathFactory,
+    LearningPathStepFactory,
+    UserFactory,
+)
+
+COURSE_KEYS = ["course-v1:edX+DemoX+Demo_Course", "course-v1:edX+DemoX+Another_Course"]
+
+
+@pytest.fixture
+def mock_course_values():
+    """Mock the bulk course completions and grades retrieved from edx-platform."""
+    with (
+        patch(
+            "learning_paths.reports.get_course_user_completions",
+            side_effect=lambda course_key, user_ids: dict.fromkeys(user_ids, 0.5),
+        ) as mock_completions,
+        patch(
+            "learning_paths.reports.get_course_user_grades",
+            side_effect=lambda course_key, user_ids: dict.fromkeys(user_ids, 0.8),
+        ) as mock_grades,
+    ):
+        yield mock_completions, mock_grades
+
+
+@pytest.fixture
+def learning_path():
+    """Create a learning path with two steps and grading criteria."""
+    learning_path = LearningPathFactory()
+    for order, course_key in enumerate(COURSE_KEYS):
+        LearningPathStepFactory(learning_path=learning_path, course_key=course_key, order=order)
+    return learning_path
+
+
+@pytest.fixture
+def enrollments(learning_path):
+    """Create active enrollments in the learning path."""
+    return LearningPathEnrollmentFactory.create_batch(5, learning_path=learning_path)
+
+
+@pytest.mark.django_db
+class TestIterProgressReport:
+    """Tests for iter_progress_report."""
+
+    def test_report_rows(self, learning_path, enrollments, mock_course_values):
+        """Test that a row is generated for each active enrollment."""
+        LearningPathEnrollmentFactory(learning_path=learning_path, is_active=False)
+        LearningPathEnrollmentFactory(user=UserFactory())
+
+        rows = list(iter_progress_report(learning_path))
+
+        assert rows == [
+            {"username": enrollment.user.username, "progress": 0.5, "grade": 0.8, "passed": True}
+            for enrollment in enrollments
+        ]
+
+    def test_values_are_fetched_per_course_and_chunk(self, learning_path, enrollments, mock_course_values):
+        """Test that the completions and grades are fetched in bulk for each course and chunk of enrollments."""
+        mock_completions, mock_grades = mock_course_values
+
+        rows = list(iter_progress_report(learning_path, chunk_size=2))
+
+        assert len(rows) == len(enrollments)
+        # 3 chunks with 2 courses each.
+        assert mock_completions.call_count == 6
+        assert mock_grades.call_count == 6
+        assert mock_grades.call_args_list[0].args[1] == [enrollment.user_id for enrollment in enrollments[:2]]
+
+    def test_number_of_queries(self, learning_path, enrollments, mock_course_values, django_assert_num_queries):
+        """Test that the number of queries depends only on the number of chunks."""
+        # Learning path with grading criteria, steps, and 3 chunks of enrollments + the final empty chunk.
+        with django_assert_num_queries(6):
+            list(iter_progress_report(learning_path, chunk_size=2))
+
+    def test_not_passed(self, learning_path, enrollments, mock_course_values):
+        """Test that the pass status depends on the required grade."""
+        learning_path.grading_criteria.required_grade = 0.9
+        learning_path.grading_criteria.save()
+
+        rows = list(iter_progress_report(learning_path))
+
+        assert not any(row["passed"] for row in rows)
+
+
+class TestRenderReport:
+    """Tests for the report renderers."""
+
+    rows = [{"username": "user", "progress": 0.5, "grade": 0.8, "passed": True}]
+
+    def test_render_csv(self):
+        """Test that the CSV report starts with a header."""
+        assert "".join(render_csv(self.rows)) == "username,progress,grade,passed\r\nuser,0.5,0.8,True\r\n"
+
+    def test_render_ndjson(self):
+        """Test that each row is rendered as a JSON object in a separate line."""
+        lines = list(render_ndjson(self.rows))
+
+        assert len(lines) == 1
+        assert json.loads(lines[0]) == self.rows[0]
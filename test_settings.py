@@ -68,3 +68,26 @@ DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 
 USE_TZ = True
 LEARNING_PATHS_ALLOW_SELF_UNENROLLMENT = False
+LEARNING_PATHS_COMPLETION_BACKEND = "native"
+LEARNING_PATHS_COMPLETION_MAX_WORKERS = 8
+LEARNING_PATHS_COMPLETION_TIMEOUT = 10
+LEARNING_PATHS_COMPLETION_BATCH_SIZE = 100
+LEARNING_PATHS_COMPLETION_POOL_SIZE = 10
+LEARNING_PATHS_COMPLETION_REQUEST_TIMEOUT = 5
+LEARNING_PATHS_GRADE_TIMEOUT = 10
+LEARNING_PATHS_CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+LEARNING_PATHS_CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 30
+LEARNING_PATHS_LAST_KNOWN_VALUE_TIMEOUT = 7 * 24 * 60 * 60
+LEARNING_PATHS_CATALOG_CACHE_TIMEOUT = 300
+LEARNING_PATHS_FAST_SERIALIZATION = True
+LEARNING_PATHS_CURSOR_PAGE_SIZE = 100
+LEARNING_PATHS_CURSOR_MAX_PAGE_SIZE = 1000
+LEARNING_PATHS_BULK_ENROLLMENT_CHUNK_SIZE = 1000
+LEARNING_PATHS_COURSE_DATES_CACHE_TIMEOUT = 300
+LEARNING_PATHS_PROGRESS_CACHE_TIMEOUT = 300
+LEARNING_PATHS_GRADE_CACHE_TIMEOUT = 300
+LEARNING_PATHS_USE_MATERIALIZED_PROGRESS = False
+
+# Run the Celery tasks in the same process.
+CELERY_TASK_ALWAYS_EAGER = True
+CELERY_TASK_EAGER_PROPAGATES = True